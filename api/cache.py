@@ -0,0 +1,139 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from cachetools import LRUCache
+
+
+@dataclass
+class _Entry:
+    value: Any
+    loaded_at: float
+
+
+class StaleWhileRevalidateCache:
+    """LRU cache that serves stale values while a single refresh runs.
+
+    Values younger than ``ttl`` are served as hits. Older values are still
+    served (counted as stale) while one background refresh per key runs,
+    until they are older than ``max_staleness``; after that, and on a miss,
+    callers block on the load. Concurrent loads of the same key are coalesced
+    so only one of them reaches the loader.
+
+    With ``getsizeof``, ``maxsize`` bounds the summed size of the cached
+    values instead of their count; a value larger than the whole cache is
+    returned to its callers without being stored.
+
+    With ``unchanged``, a reloaded value that ``unchanged(old, new)`` reports
+    as equal to the cached one is dropped and the cached value kept (with a
+    fresh load time), so anything derived from it, such as a Last-Modified
+    timestamp, only moves when the content does.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_staleness: float,
+        maxsize: int = 32,
+        refresh_workers: int = 2,
+        getsizeof: Callable[[Any], int] | None = None,
+        unchanged: Callable[[Any, Any], bool] | None = None,
+    ):
+        if max_staleness < ttl:
+            raise ValueError('max_staleness must be >= ttl')
+        self.ttl = ttl
+        self.max_staleness = max_staleness
+        self._unchanged = unchanged
+        self._entries: LRUCache = LRUCache(
+            maxsize=maxsize,
+            getsizeof=(lambda entry: getsizeof(entry.value)) if getsizeof else None,
+        )
+        self._inflight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=refresh_workers, thread_name_prefix='cache-refresh'
+        )
+        self._counters = dict.fromkeys(
+            ('hits', 'misses', 'stale', 'coalesced', 'refreshes', 'refreshErrors'), 0
+        )
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry.loaded_at if entry else None
+
+            if entry is not None and age <= self.ttl:
+                self._counters['hits'] += 1
+                return entry.value
+
+            if entry is not None and age <= self.max_staleness:
+                self._counters['stale'] += 1
+                if key not in self._inflight:
+                    future: Future = Future()
+                    self._inflight[key] = future
+                    self._executor.submit(self._refresh, key, loader, future)
+                return entry.value
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self._counters['coalesced'] += 1
+                owner = False
+            else:
+                self._counters['misses'] += 1
+                future = Future()
+                self._inflight[key] = future
+                owner = True
+
+        if owner:
+            self._load(key, loader, future)
+        return future.result()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._counters,
+                'entries': len(self._entries),
+                'size': self._entries.currsize,
+                'maxSize': self._entries.maxsize,
+                'inflight': len(self._inflight),
+                'ttlSeconds': self.ttl,
+                'maxStalenessSeconds': self.max_staleness,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], future: Future) -> None:
+        with self._lock:
+            self._counters['refreshes'] += 1
+        self._load(key, loader, future)
+        if future.exception() is not None:
+            with self._lock:
+                self._counters['refreshErrors'] += 1
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], future: Future) -> None:
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            return
+        with self._lock:
+            previous = self._entries.get(key)
+            if (
+                previous is not None
+                and self._unchanged is not None
+                and self._unchanged(previous.value, value)
+            ):
+                value = previous.value
+            try:
+                self._entries[key] = _Entry(value, time.monotonic())
+            except ValueError:
+                # Larger than the whole cache; drop any older value for the key.
+                self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+        future.set_result(value)
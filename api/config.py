@@ -15,8 +15,46 @@ class Settings(BaseSettings):
         'SNOWFLAKE_PRIVATE_KEY_PATH',
         os.path.join(os.path.dirname(__file__), '..', 'rsa_key.p8')
     )
+    # 'snowflake', or 'duckdb' to serve from the local Parquet replica
+    query_backend: str = 'snowflake'
+    local_replica_dir: str = os.getenv(
+        'LOCAL_REPLICA_DIR',
+        os.path.join(os.path.dirname(__file__), '..', 'data', 'replica')
+    )
     cors_origins: list[str] = ['http://localhost:4200', 'http://localhost:8000']
     cache_ttl_seconds: int = 300
+    # Past the TTL, cached payloads are served while one refresh runs in the
+    # background; past this age requests wait for fresh data instead.
+    cache_max_staleness_seconds: int = 3600
+    # Filtered dashboards are cached per filter set; bound by encoded size
+    cache_max_bytes: int = 64 * 1024 * 1024
+
+    # Payloads at least this large are stored gzip/brotli-compressed
+    compression_min_bytes: int = 1024
+
+    # Snowflake connection pool
+    pool_min_size: int = 1
+    pool_max_size: int = 8
+    pool_idle_timeout_seconds: int = 900
+    pool_health_check_seconds: int = 60
+    pool_checkout_timeout_seconds: int = 30
+
+    # Per-request widget query fan-out (keep parallelism <= pool_max_size)
+    query_max_parallelism: int = 4
+    query_timeout_seconds: int = 60
+
+    # Precomputed payloads published by snapshot.py after each dbt run
+    snapshot_dir: str = os.getenv(
+        'DASHBOARD_SNAPSHOT_DIR',
+        os.path.join(os.path.dirname(__file__), 'snapshots')
+    )
+    snapshot_keep: int = 5
+    # Older snapshots are ignored and the dashboards queried live, so a
+    # missed deploy cannot pin the API to stale data. 0 disables the check.
+    snapshot_max_age_seconds: int = 26 * 3600
+
+    # Answer /executive from one GROUPING SETS scan of AGG_ORDERS_DAILY
+    executive_single_scan: bool = True
 
 
 settings = Settings()
@@ -1,18 +1,28 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Generator
+from functools import lru_cache
+from typing import Any, Generator, Protocol
 
+import pyarrow as pa
 import snowflake.connector
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from snowflake.connector import SnowflakeConnection
 
 from config import settings
+from pool import ConnectionPool
 
 os.environ['SF_OCSP_FAIL_OPEN'] = 'true'
 
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
 
+
+@lru_cache(maxsize=1)
 def _load_private_key() -> bytes:
+    # Parsed once per process; every pooled session reuses the DER bytes.
     with open(settings.snowflake_private_key_path, 'rb') as f:
         p_key = serialization.load_pem_private_key(
             f.read(), password=None, backend=default_backend()
@@ -24,9 +34,8 @@ def _load_private_key() -> bytes:
     )
 
 
-@contextmanager
-def get_connection(schema: str = 'MARTS') -> Generator[SnowflakeConnection, None, None]:
-    conn = snowflake.connector.connect(
+def _connect(schema: str) -> SnowflakeConnection:
+    return snowflake.connector.connect(
         user=settings.snowflake_user,
         account=settings.snowflake_account,
         warehouse=settings.snowflake_warehouse,
@@ -35,18 +44,178 @@ def get_connection(schema: str = 'MARTS') -> Generator[SnowflakeConnection, None
         role=settings.snowflake_role,
         private_key=_load_private_key(),
         insecure_mode=True,
+        client_session_keep_alive=True,
     )
+
+
+def _ping(conn: SnowflakeConnection) -> None:
+    cur = conn.cursor()
     try:
-        yield conn
+        cur.execute('SELECT 1')
+        cur.fetchone()
     finally:
-        conn.close()
+        cur.close()
 
 
-def execute_query(query: str, schema: str = 'MARTS') -> list[dict[str, Any]]:
-    with get_connection(schema) as conn:
-        cur = conn.cursor()
-        cur.execute(query)
-        columns = [desc[0] for desc in cur.description]
-        rows = cur.fetchall()
-        cur.close()
-    return [dict(zip(columns, row)) for row in rows]
+def get_pool(schema: str = 'MARTS') -> ConnectionPool:
+    with _pools_lock:
+        if schema not in _pools:
+            _pools[schema] = ConnectionPool(
+                factory=lambda: _connect(schema),
+                min_size=settings.pool_min_size,
+                max_size=settings.pool_max_size,
+                idle_timeout=settings.pool_idle_timeout_seconds,
+                health_check_after=settings.pool_health_check_seconds,
+                checkout_timeout=settings.pool_checkout_timeout_seconds,
+                is_alive=lambda conn: not conn.is_closed(),
+                ping=_ping,
+            )
+        return _pools[schema]
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    with _pools_lock:
+        pools = dict(_pools)
+    return {schema: pool.stats() for schema, pool in pools.items()}
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+@contextmanager
+def get_connection(schema: str = 'MARTS') -> Generator[SnowflakeConnection, None, None]:
+    with get_pool(schema).connection() as conn:
+        yield conn
+
+
+class QueryBackend(Protocol):
+    name: str
+
+    def execute(
+        self,
+        query: str,
+        schema: str = 'MARTS',
+        timeout: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]: ...
+
+    def execute_arrow(
+        self,
+        query: str,
+        schema: str = 'MARTS',
+        timeout: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> pa.Table: ...
+
+    def warm(self) -> None: ...
+
+    def stats(self) -> dict[str, Any]: ...
+
+    def close(self) -> None: ...
+
+
+class SnowflakeBackend:
+    name = 'snowflake'
+
+    def execute(
+        self,
+        query: str,
+        schema: str = 'MARTS',
+        timeout: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        with get_connection(schema) as conn:
+            cur = conn.cursor()
+            try:
+                # Snowflake cancels the statement server-side once the timeout passes.
+                cur.execute(query, params, timeout=timeout or settings.query_timeout_seconds)
+                columns = [desc[0] for desc in cur.description]
+                rows = cur.fetchall()
+            finally:
+                cur.close()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def execute_arrow(
+        self,
+        query: str,
+        schema: str = 'MARTS',
+        timeout: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> pa.Table:
+        with get_connection(schema) as conn:
+            cur = conn.cursor()
+            try:
+                cur.execute(query, params, timeout=timeout or settings.query_timeout_seconds)
+                columns = [desc[0] for desc in cur.description]
+                table = cur.fetch_arrow_all()
+            finally:
+                cur.close()
+        if table is None:
+            # fetch_arrow_all() returns None instead of an empty table.
+            return pa.table({name: pa.nulls(0) for name in columns})
+        return table
+
+    def warm(self) -> None:
+        get_pool().warm()
+
+    def stats(self) -> dict[str, Any]:
+        return pool_stats()
+
+    def close(self) -> None:
+        close_pools()
+
+
+@lru_cache(maxsize=1)
+def get_backend() -> QueryBackend:
+    if settings.query_backend == 'snowflake':
+        return SnowflakeBackend()
+    if settings.query_backend == 'duckdb':
+        from local_backend import DuckDBBackend
+        return DuckDBBackend(settings.local_replica_dir)
+    raise ValueError(f'Unknown query backend: {settings.query_backend!r}')
+
+
+def execute_query(
+    query: str,
+    schema: str = 'MARTS',
+    timeout: int | None = None,
+    params: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    return get_backend().execute(query, schema, timeout, params)
+
+
+def execute_query_arrow(
+    query: str,
+    schema: str = 'MARTS',
+    timeout: int | None = None,
+    params: dict[str, Any] | None = None,
+) -> pa.Table:
+    return get_backend().execute_arrow(query, schema, timeout, params)
+
+
+def execute_queries(
+    queries: dict[str, str],
+    schema: str = 'MARTS',
+    params: dict[str, Any] | None = None,
+) -> dict[str, pa.Table]:
+    """Run independent queries concurrently and return their Arrow results by name.
+
+    At most ``settings.query_max_parallelism`` queries of one call are in
+    flight at a time. The first failure cancels queries that have not
+    started yet and is re-raised. ``params`` are bound into every query.
+    """
+    workers = max(1, min(len(queries), settings.query_max_parallelism))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dashboard-query')
+    try:
+        futures = {
+            name: executor.submit(execute_query_arrow, query, schema, None, params)
+            for name, query in queries.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from fastapi import HTTPException, Query
+
+# Orders on or after this month count as the "current" KPI period.
+DEFAULT_PERIOD_SPLIT = date(2018, 1, 1)
+
+
+def _split_values(values: list[str]) -> list[str]:
+    # Accept both ?state=SP&state=RJ and ?state=SP,RJ
+    return [v.strip() for value in values for v in value.split(',') if v.strip()]
+
+
+@dataclass(frozen=True)
+class DashboardFilters:
+    """Normalized dashboard filters over MARTS.FCT_ORDERS.
+
+    Instances are canonical (deduplicated, sorted, case-normalized), so two
+    requests selecting the same orders share one cache key. Values are only
+    ever sent to the warehouse as bind parameters.
+    """
+
+    start_date: date | None = None
+    end_date: date | None = None
+    states: tuple[str, ...] = ()
+    payment_types: tuple[str, ...] = ()
+    period_split: date = DEFAULT_PERIOD_SPLIT
+
+    @classmethod
+    def normalize(
+        cls,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        states: list[str] | tuple[str, ...] = (),
+        payment_types: list[str] | tuple[str, ...] = (),
+        period_split: date = DEFAULT_PERIOD_SPLIT,
+    ) -> 'DashboardFilters':
+        if start_date and end_date and start_date > end_date:
+            raise ValueError('start_date must not be after end_date')
+        return cls(
+            start_date=start_date,
+            end_date=end_date,
+            states=tuple(sorted({s.upper() for s in _split_values(list(states))})),
+            payment_types=tuple(sorted({
+                p.lower().replace(' ', '_') for p in _split_values(list(payment_types))
+            })),
+            period_split=period_split,
+        )
+
+    @property
+    def is_default(self) -> bool:
+        return self == DashboardFilters()
+
+    @property
+    def selects_orders(self) -> bool:
+        """Whether the filters narrow the set of orders; period_split does not."""
+        return bool(self.start_date or self.end_date or self.states or self.payment_types)
+
+    def cache_key(self) -> tuple:
+        return (self.start_date, self.end_date, self.states, self.payment_types,
+                self.period_split)
+
+    def where_sql(self) -> str:
+        """SQL predicate over FCT_ORDERS columns, using pyformat placeholders."""
+        conditions = []
+        if self.start_date:
+            conditions.append('ORDER_DATE >= %(start_date)s')
+        if self.end_date:
+            conditions.append('ORDER_DATE <= %(end_date)s')
+        if self.states:
+            placeholders = ', '.join(f'%(state_{i})s' for i in range(len(self.states)))
+            conditions.append(f'CUSTOMER_STATE IN ({placeholders})')
+        if self.payment_types:
+            placeholders = ', '.join(
+                f'%(payment_type_{i})s' for i in range(len(self.payment_types))
+            )
+            conditions.append(f'PRIMARY_PAYMENT_TYPE IN ({placeholders})')
+        return ' AND '.join(conditions) or 'TRUE'
+
+    def params(self) -> dict[str, Any]:
+        params: dict[str, Any] = {'period_split': self.period_split}
+        if self.start_date:
+            params['start_date'] = self.start_date
+        if self.end_date:
+            params['end_date'] = self.end_date
+        params.update({f'state_{i}': s for i, s in enumerate(self.states)})
+        params.update({f'payment_type_{i}': p for i, p in enumerate(self.payment_types)})
+        return params
+
+
+def dashboard_filters(
+    start_date: date | None = None,
+    end_date: date | None = None,
+    state: list[str] = Query(default=[]),
+    payment_type: list[str] = Query(default=[]),
+    period_split: date = DEFAULT_PERIOD_SPLIT,
+) -> DashboardFilters:
+    try:
+        return DashboardFilters.normalize(start_date, end_date, state, payment_type, period_split)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
@@ -0,0 +1,179 @@
+"""Embedded DuckDB backend serving the dashboard SQL from a local Parquet replica.
+
+The replica is a directory of Parquet exports of the tables the dashboard
+reads, laid out as ``<replica_dir>/<schema>/<table>.parquet``. Refresh it
+after a dbt run with:
+
+    python api/local_backend.py
+
+and select it with ``QUERY_BACKEND=duckdb``.
+"""
+import os
+import re
+import sys
+import threading
+from typing import Any
+
+from config import settings
+
+REPLICA_TABLES: tuple[tuple[str, str], ...] = (
+    ('MARTS', 'FCT_ORDERS'),
+    ('MARTS', 'AGG_ORDERS_DAILY'),
+    ('MARTS', 'DIM_PRODUCTS'),
+    ('MARTS', 'DIM_SELLERS'),
+    ('MARTS', 'DIM_CUSTOMERS'),
+    ('MARTS', 'TOP_SELLERS'),
+)
+
+# Snowflake functions used by the dashboard SQL that DuckDB lacks or spells
+# differently. `::INT` needs no shim: DuckDB accepts the cast syntax and, like
+# Snowflake, rounds DECIMAL half away from zero.
+DIALECT_SHIM = (
+    # TO_CHAR(date, 'YYYY-MM' | 'Mon YYYY') -> strftime
+    """
+    CREATE MACRO TO_CHAR(d, fmt) AS strftime(
+        CAST(d AS TIMESTAMP),
+        replace(replace(replace(fmt, 'YYYY', '%Y'), 'Mon', '%b'), 'MM', '%m')
+    )
+    """,
+    # INITCAP with Snowflake's default delimiter set
+    """
+    CREATE MACRO INITCAP(s) AS CASE WHEN length(s) = 0 THEN s ELSE array_to_string(
+        list_transform(
+            range(1, length(s) + 1),
+            i -> CASE
+                WHEN i = 1 OR contains(' !?@"^#$&~_,.:;+-*%/|\\[](){}<>', s[i - 1])
+                THEN upper(s[i]) ELSE lower(s[i])
+            END
+        ),
+        ''
+    ) END
+    """,
+)
+
+
+_PYFORMAT_PARAM = re.compile(r'%\((\w+)\)s')
+
+
+def _bind(query: str, params: dict[str, Any] | None) -> tuple[str, dict[str, Any]]:
+    # The dashboard SQL uses Snowflake's pyformat placeholders; DuckDB binds
+    # $name and rejects parameters the statement does not reference.
+    if not params:
+        return query, {}
+    names = set(_PYFORMAT_PARAM.findall(query))
+    return (
+        _PYFORMAT_PARAM.sub(r'$\1', query),
+        {name: value for name, value in params.items() if name in names},
+    )
+
+
+def replica_path(replica_dir: str, schema: str, table: str) -> str:
+    return os.path.join(replica_dir, schema.lower(), f'{table.lower()}.parquet')
+
+
+class DuckDBBackend:
+    name = 'duckdb'
+
+    def __init__(self, replica_dir: str):
+        import duckdb
+
+        self.replica_dir = replica_dir
+        self._conn = duckdb.connect(database=':memory:')
+        self._lock = threading.Lock()
+        self._tables: list[str] = []
+
+        for statement in DIALECT_SHIM:
+            self._conn.execute(statement)
+        for schema, table in REPLICA_TABLES:
+            path = replica_path(replica_dir, schema, table)
+            if not os.path.exists(path):
+                continue
+            self._conn.execute(f'CREATE SCHEMA IF NOT EXISTS {schema}')
+            self._conn.execute(
+                f"CREATE VIEW {schema}.{table} AS SELECT * FROM read_parquet('{path}')"
+            )
+            self._tables.append(f'{schema}.{table}')
+        if not self._tables:
+            raise FileNotFoundError(f'no Parquet replica tables found in {replica_dir}')
+
+    def execute(
+        self,
+        query: str,
+        schema: str = 'MARTS',
+        timeout: int | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        # One cursor per call: DuckDB connections are not shared across threads,
+        # cursors on the same in-memory database are.
+        with self._lock:
+            cur = self._conn.cursor()
+        try:
+            cur.execute(f'SET schema = {schema.lower()}')
+            cur.execute(*_bind(query, params))
+            columns = [desc[0].upper() for desc in cur.description]
+            rows = cur.fetchall()
+        finally:
+            cur.close()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def execute_arrow(
+        self,
+        query: str,
+        schema: str = 'MARTS',
+        timeout: int | None = None,
+        params: dict[str, Any] | None = None,
+    ):
+        with self._lock:
+            cur = self._conn.cursor()
+        try:
+            cur.execute(f'SET schema = {schema.lower()}')
+            table = cur.execute(*_bind(query, params)).arrow()
+        finally:
+            cur.close()
+        return table.rename_columns([name.upper() for name in table.column_names])
+
+    def warm(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, Any]:
+        return {'replicaDir': self.replica_dir, 'tables': self._tables}
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def export_replica(replica_dir: str | None = None) -> list[str]:
+    """Export the replica tables from Snowflake to Parquet files."""
+    import pyarrow.parquet as pq
+
+    from database import get_connection
+
+    replica_dir = replica_dir or settings.local_replica_dir
+    written = []
+    with get_connection() as conn:
+        for schema, table in REPLICA_TABLES:
+            cur = conn.cursor()
+            try:
+                cur.execute(f'SELECT * FROM {schema}.{table}')
+                arrow_table = cur.fetch_arrow_all()
+            finally:
+                cur.close()
+            if arrow_table is None:
+                print(f'⚠ {schema}.{table} is empty, skipped')
+                continue
+            path = replica_path(replica_dir, schema, table)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.tmp'
+            pq.write_table(arrow_table, tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+            print(f'✓ {schema}.{table}: {arrow_table.num_rows:,} rows → {path}')
+            written.append(path)
+    return written
+
+
+if __name__ == '__main__':
+    try:
+        export_replica()
+    except Exception as e:
+        print(f'✗ Replica export failed: {e}')
+        sys.exit(1)
@@ -1,12 +1,30 @@
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import settings
+from database import get_backend
 from routers.dashboard import router as dashboard_router
+from snapshot import snapshots
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the minimum number of sessions in the background so startup never
+    # blocks on Snowflake; the pool falls back to lazy creation if this fails.
+    backend = get_backend()
+    threading.Thread(target=backend.warm, daemon=True).start()
+    snapshots.load()
+    yield
+    backend.close()
+
 
 app = FastAPI(
     title="E-Commerce Analytics API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -22,4 +40,9 @@ app.include_router(dashboard_router)
 
 @app.get("/health")
 def health_check():
-    return {"status": "ok"}
+    return {"status": "ok", "backend": settings.query_backend}
+
+
+@app.get("/health/pool")
+def pool_health():
+    return get_backend().stats()
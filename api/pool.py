@@ -0,0 +1,225 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator
+
+
+class PoolTimeoutError(RuntimeError):
+    pass
+
+
+class PoolClosedError(RuntimeError):
+    pass
+
+
+@dataclass
+class _Slot:
+    conn: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived connections.
+
+    Connections are created lazily up to ``max_size``. Idle connections are
+    validated on checkout (``is_alive`` always, ``ping`` once they have been
+    idle longer than ``health_check_after``) and closed once they have been
+    idle longer than ``idle_timeout``, never dropping below ``min_size``.
+    After ``close`` the pool hands out no more connections and closes the
+    checked-out ones as they are returned.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 8,
+        idle_timeout: float = 900,
+        health_check_after: float = 60,
+        checkout_timeout: float = 30,
+        is_alive: Callable[[Any], bool] = lambda conn: True,
+        ping: Callable[[Any], None] = lambda conn: None,
+        close: Callable[[Any], None] = lambda conn: conn.close(),
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(f'invalid pool size: min={min_size} max={max_size}')
+        self._factory = factory
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._health_check_after = health_check_after
+        self._checkout_timeout = checkout_timeout
+        self._is_alive = is_alive
+        self._ping = ping
+        self._close = close
+
+        self._idle: deque[_Slot] = deque()
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._created = 0
+        self._discarded = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def warm(self) -> None:
+        # Reserve the slots up front, like _checkout, so concurrent checkouts
+        # cannot push the pool past max_size while connections are created.
+        with self._cond:
+            if self._closed:
+                return
+            missing = max(self._min_size - len(self._idle) - self._in_use, 0)
+            self._in_use += missing
+        for created in range(missing):
+            try:
+                slot = _Slot(self._factory())
+            except BaseException:
+                with self._cond:
+                    self._in_use -= missing - created
+                    self._cond.notify_all()
+                raise
+            with self._cond:
+                self._created += 1
+            self._checkin(slot)
+
+    @contextmanager
+    def connection(self) -> Generator[Any, None, None]:
+        slot = self._checkout()
+        try:
+            yield slot.conn
+        except BaseException:
+            self._checkin(slot, broken=not self._safe_is_alive(slot.conn))
+            raise
+        self._checkin(slot)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                'inUse': self._in_use,
+                'idle': len(self._idle),
+                'size': self._in_use + len(self._idle),
+                'minSize': self._min_size,
+                'maxSize': self._max_size,
+                'created': self._created,
+                'discarded': self._discarded,
+                'checkouts': self._checkouts,
+                'waits': self._waits,
+                'totalWaitMs': round(self._wait_seconds * 1000, 1),
+                'avgWaitMs': round(self._wait_seconds * 1000 / self._checkouts, 2)
+                if self._checkouts else 0.0,
+                'maxWaitMs': round(self._max_wait_seconds * 1000, 1),
+            }
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            slots = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for slot in slots:
+            self._discard(slot)
+
+    # -- internals -----------------------------------------------------------
+
+    def _checkout(self) -> _Slot:
+        started = time.monotonic()
+        deadline = started + self._checkout_timeout
+        waited = False
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise PoolClosedError('connection pool is closed')
+                self._prune_idle()
+                while not self._idle and self._in_use + len(self._idle) >= self._max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f'no connection available within {self._checkout_timeout}s '
+                            f'(max_size={self._max_size})'
+                        )
+                    waited = True
+                    self._cond.wait(remaining)
+                    if self._closed:
+                        raise PoolClosedError('connection pool is closed')
+                slot = self._idle.pop() if self._idle else None
+                self._in_use += 1
+
+            if slot is None:
+                try:
+                    slot = _Slot(self._factory())
+                except BaseException:
+                    with self._cond:
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._created += 1
+            elif not self._healthy(slot):
+                with self._cond:
+                    self._in_use -= 1
+                    self._cond.notify()
+                self._discard(slot)
+                continue
+
+            wait = time.monotonic() - started
+            with self._cond:
+                self._checkouts += 1
+                self._wait_seconds += wait
+                self._max_wait_seconds = max(self._max_wait_seconds, wait)
+                if waited:
+                    self._waits += 1
+            return slot
+
+    def _checkin(self, slot: _Slot, broken: bool = False) -> None:
+        with self._cond:
+            self._in_use -= 1
+            broken = broken or self._closed
+            if not broken:
+                slot.last_used_at = time.monotonic()
+                self._idle.append(slot)
+            self._cond.notify()
+        if broken:
+            self._discard(slot)
+
+    def _healthy(self, slot: _Slot) -> bool:
+        if not self._safe_is_alive(slot.conn):
+            return False
+        if time.monotonic() - slot.last_used_at < self._health_check_after:
+            return True
+        try:
+            self._ping(slot.conn)
+        except Exception:
+            return False
+        return True
+
+    def _safe_is_alive(self, conn: Any) -> bool:
+        try:
+            return bool(self._is_alive(conn))
+        except Exception:
+            return False
+
+    def _prune_idle(self) -> None:
+        # Called with the lock held; oldest idle connections sit on the left.
+        now = time.monotonic()
+        while (
+            self._idle
+            and self._in_use + len(self._idle) > self._min_size
+            and now - self._idle[0].last_used_at > self._idle_timeout
+        ):
+            slot = self._idle.popleft()
+            threading.Thread(target=self._discard, args=(slot,), daemon=True).start()
+
+    def _discard(self, slot: _Slot) -> None:
+        with self._cond:
+            self._discarded += 1
+        try:
+            self._close(slot.conn)
+        except Exception:
+            pass
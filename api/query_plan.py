@@ -0,0 +1,233 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Single-scan executive plan
+#
+# The executive widgets all aggregate orders along one dimension at a time,
+# so they are compiled into a single GROUPING SETS statement: one scan of the
+# MARTS.AGG_ORDERS_DAILY rollup, one row group per widget. Averages are
+# ratios of the rollup's additive sums. Distinct customers do not add up
+# across the rollup's rows, so the sets that report them (total, period,
+# state) take them from a second GROUPING SETS pass over the customer column
+# of MARTS.FCT_ORDERS. split_executive_rows() turns the result back into the
+# per-widget row shapes the individual queries in routers/dashboard.py
+# return, so the payload builders do not change.
+# ---------------------------------------------------------------------------
+
+EXECUTIVE_SINGLE_SCAN_SQL = """
+WITH base AS (
+    SELECT
+        ORDER_MONTH,
+        ORDER_STATUS,
+        CUSTOMER_STATE,
+        PRIMARY_PAYMENT_TYPE,
+        REVIEW_BUCKET                                           AS review_bucket,
+        ORDERS,
+        REVENUE,
+        PAYMENT_VALUE,
+        REVIEW_SCORE_SUM,
+        REVIEWED_ORDERS,
+        ON_TIME_ORDERS,
+        LATE_DELIVERIES,
+        DELIVERY_DAYS_SUM,
+        DELIVERED_WITH_DAYS,
+        CASE WHEN ORDER_MONTH >= %(period_split)s THEN 'current' ELSE 'previous' END
+                                                                AS period
+    FROM MARTS.AGG_ORDERS_DAILY
+    WHERE {filters}
+),
+rollup AS (
+    SELECT
+        CASE
+            WHEN GROUPING(period) = 0               THEN 'period'
+            WHEN GROUPING(ORDER_MONTH) = 0          THEN 'month'
+            WHEN GROUPING(ORDER_STATUS) = 0         THEN 'status'
+            WHEN GROUPING(CUSTOMER_STATE) = 0       THEN 'state'
+            WHEN GROUPING(PRIMARY_PAYMENT_TYPE) = 0 THEN 'payment_type'
+            WHEN GROUPING(review_bucket) = 0        THEN 'review'
+            ELSE 'total'
+        END                                                     AS grouping_set,
+        period                                                  AS period,
+        TO_CHAR(ORDER_MONTH, 'YYYY-MM')                         AS date,
+        TO_CHAR(ORDER_MONTH, 'Mon YYYY')                        AS label,
+        ORDER_STATUS                                            AS order_status,
+        INITCAP(ORDER_STATUS)                                   AS status,
+        CUSTOMER_STATE                                          AS state,
+        PRIMARY_PAYMENT_TYPE                                    AS payment_type,
+        INITCAP(REPLACE(PRIMARY_PAYMENT_TYPE, '_', ' '))        AS type,
+        review_bucket                                           AS score,
+        COALESCE(SUM(ORDERS), 0)                                AS orders,
+        SUM(REVENUE)                                            AS revenue,
+        SUM(REVENUE) / NULLIF(SUM(ORDERS), 0)                   AS aov,
+        SUM(PAYMENT_VALUE)                                      AS payment_value,
+        SUM(REVIEW_SCORE_SUM) / NULLIF(SUM(REVIEWED_ORDERS), 0) AS review,
+        SUM(ON_TIME_ORDERS) * 100.0 / NULLIF(SUM(ORDERS), 0)    AS on_time,
+        SUM(DELIVERY_DAYS_SUM) / NULLIF(SUM(DELIVERED_WITH_DAYS), 0)
+                                                                AS avg_delivery_days,
+        SUM(LATE_DELIVERIES)                                    AS late_deliveries,
+        SUM(ON_TIME_ORDERS)                                     AS early_deliveries
+    FROM base
+    GROUP BY GROUPING SETS (
+        (),
+        (period),
+        (ORDER_MONTH),
+        (ORDER_STATUS),
+        (CUSTOMER_STATE),
+        (PRIMARY_PAYMENT_TYPE),
+        (review_bucket)
+    )
+),
+customers AS (
+    SELECT
+        CASE
+            WHEN GROUPING(period) = 0         THEN 'period'
+            WHEN GROUPING(CUSTOMER_STATE) = 0 THEN 'state'
+            ELSE 'total'
+        END                                                     AS grouping_set,
+        period                                                  AS period,
+        CUSTOMER_STATE                                          AS state,
+        COUNT(DISTINCT CUSTOMER_UNIQUE_ID)                      AS customers
+    FROM (
+        SELECT
+            CUSTOMER_STATE,
+            CUSTOMER_UNIQUE_ID,
+            CASE WHEN ORDER_MONTH >= %(period_split)s THEN 'current' ELSE 'previous' END
+                                                                AS period
+        FROM MARTS.FCT_ORDERS
+        WHERE {filters}
+    )
+    GROUP BY GROUPING SETS ((), (period), (CUSTOMER_STATE))
+)
+SELECT r.*, c.customers
+FROM rollup r
+LEFT JOIN customers c
+    ON c.grouping_set = r.grouping_set
+   AND c.period IS NOT DISTINCT FROM r.period
+   AND c.state IS NOT DISTINCT FROM r.state
+"""
+
+
+def _round(value: Any, places: int) -> Decimal | None:
+    # Snowflake ROUND() rounds half away from zero, unlike Python's round().
+    if value is None:
+        return None
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return value.quantize(Decimal(1).scaleb(-places), rounding=ROUND_HALF_UP)
+
+
+def _percentages(rows: list[dict], key: str = 'ORDERS') -> list[Decimal | None]:
+    total = sum(r[key] for r in rows)
+    return [_round(Decimal(r[key]) * 100 / total, 1) if total else None for r in rows]
+
+
+def _change_pct(current: Any, previous: Any) -> Decimal | None:
+    if current is None or previous is None or previous == 0:
+        return None
+    return _round((Decimal(current) - Decimal(previous)) * 100 / Decimal(previous), 1)
+
+
+def _diff(current: Any, previous: Any, places: int) -> Decimal | None:
+    if current is None or previous is None:
+        return None
+    return _round(Decimal(current) - Decimal(previous), places)
+
+
+def _period_summary(row: dict | None) -> dict[str, Any]:
+    if row is None:
+        # An empty period has no averages, but counts zero orders and customers,
+        # as the COALESCE and COUNT(DISTINCT) of EXECUTIVE_KPIS_SQL do
+        return dict(dict.fromkeys(('revenue', 'aov', 'review', 'on_time')), orders=0, customers=0)
+    return {
+        'revenue': _round(row['REVENUE'], 2),
+        'orders': row['ORDERS'],
+        'aov': _round(row['AOV'], 2),
+        'customers': row['CUSTOMERS'],
+        'review': _round(row['REVIEW'], 2),
+        'on_time': _round(row['ON_TIME'], 1),
+    }
+
+
+def split_executive_rows(rows: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Split EXECUTIVE_SINGLE_SCAN_SQL rows into the per-widget query results."""
+    sets: dict[str, list[dict]] = {}
+    for row in rows:
+        sets.setdefault(row['GROUPING_SET'], []).append(row)
+
+    total = (sets.get('total') or [None])[0]
+    periods = {r['PERIOD']: r for r in sets.get('period', [])}
+    current = _period_summary(periods.get('current'))
+    previous = _period_summary(periods.get('previous'))
+
+    kpis = []
+    if total is not None:
+        kpis.append({
+            'TOTAL_REVENUE': _round(total['REVENUE'], 2),
+            'TOTAL_ORDERS': total['ORDERS'],
+            'AVG_ORDER_VALUE': _round(total['AOV'], 2),
+            'UNIQUE_CUSTOMERS': total['CUSTOMERS'],
+            'AVG_REVIEW_SCORE': _round(total['REVIEW'], 2),
+            'ON_TIME_RATE': _round(total['ON_TIME'], 1),
+            'REVENUE_CHANGE': _change_pct(current['revenue'], previous['revenue']),
+            'ORDERS_CHANGE': _change_pct(current['orders'], previous['orders']),
+            'AOV_CHANGE': _change_pct(current['aov'], previous['aov']),
+            'CUSTOMERS_CHANGE': _change_pct(current['customers'], previous['customers']),
+            'REVIEW_CHANGE': _diff(current['review'], previous['review'], 2),
+            'ON_TIME_CHANGE': _diff(current['on_time'], previous['on_time'], 1),
+        })
+
+    months = sorted(sets.get('month', []), key=lambda r: r['DATE'])
+    revenue_ts = [
+        {'DATE': r['DATE'], 'LABEL': r['LABEL'], 'VALUE': _round(r['REVENUE'], 2)}
+        for r in months
+    ]
+
+    statuses = sorted(sets.get('status', []), key=lambda r: r['ORDERS'], reverse=True)
+    order_statuses = [
+        {'STATUS': r['STATUS'], 'COUNT': r['ORDERS'], 'PERCENTAGE': pct}
+        for r, pct in zip(statuses, _percentages(statuses))
+    ]
+
+    states = [r for r in sets.get('state', []) if r['STATE'] is not None]
+    states = sorted(states, key=lambda r: _round(r['REVENUE'], 2), reverse=True)[:10]
+    top_states = [
+        {'STATE': r['STATE'], 'REVENUE': _round(r['REVENUE'], 2),
+         'ORDERS': r['ORDERS'], 'CUSTOMERS': r['CUSTOMERS']}
+        for r in states
+    ]
+
+    payments = [r for r in sets.get('payment_type', []) if r['PAYMENT_TYPE'] is not None]
+    payments = sorted(payments, key=lambda r: r['ORDERS'], reverse=True)
+    payment_types = [
+        {'TYPE': r['TYPE'], 'COUNT': r['ORDERS'],
+         'VALUE': _round(r['PAYMENT_VALUE'], 2), 'PERCENTAGE': pct}
+        for r, pct in zip(payments, _percentages(payments))
+    ]
+
+    buckets = [r for r in sets.get('review', []) if r['SCORE'] is not None]
+    buckets = sorted(buckets, key=lambda r: r['SCORE'], reverse=True)
+    reviews = [
+        {'SCORE': r['SCORE'], 'COUNT': r['ORDERS'], 'PERCENTAGE': pct}
+        for r, pct in zip(buckets, _percentages(buckets))
+    ]
+
+    delivery = [
+        {
+            'ON_TIME_RATE': _round(r['ON_TIME'], 1),
+            'AVG_DELIVERY_DAYS': _round(r['AVG_DELIVERY_DAYS'], 1),
+            'LATE_DELIVERIES': r['LATE_DELIVERIES'],
+            'EARLY_DELIVERIES': r['EARLY_DELIVERIES'],
+        }
+        for r in sets.get('status', []) if r['ORDER_STATUS'] == 'delivered'
+    ]
+
+    return {
+        'kpis': kpis,
+        'revenue_ts': revenue_ts,
+        'order_statuses': order_statuses,
+        'top_states': top_states,
+        'payment_types': payment_types,
+        'reviews': reviews,
+        'delivery': delivery,
+    }
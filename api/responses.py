@@ -0,0 +1,109 @@
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+
+from config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """A JSON payload serialized once, with its validators and compressed bodies.
+
+    Cached and snapshot payloads are stored in this form so a hit costs no
+    JSON encoding or compression, and conditional requests are answered from
+    the ETag alone.
+    """
+
+    body: bytes
+    etag: str
+    last_modified: datetime
+    gzip_body: bytes | None = None
+    br_body: bytes | None = None
+
+    @classmethod
+    def encode(cls, payload: Any, last_modified: datetime | None = None) -> 'EncodedPayload':
+        # Same serialization as FastAPI's JSONResponse.
+        body = json.dumps(
+            payload, ensure_ascii=False, allow_nan=False, separators=(',', ':')
+        ).encode('utf-8')
+        compress = len(body) >= settings.compression_min_bytes
+        return cls(
+            body=body,
+            etag=f'W/"{hashlib.sha256(body).hexdigest()[:32]}"',
+            last_modified=(last_modified or datetime.now(timezone.utc)).replace(microsecond=0),
+            gzip_body=gzip.compress(body, compresslevel=6, mtime=0) if compress else None,
+            br_body=brotli.compress(body, quality=5) if compress and brotli else None,
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.gzip_body or b'') + len(self.br_body or b'')
+
+
+def _accepted_encodings(header: str) -> dict[str, float]:
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if coding:
+            accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def _not_modified(request: Request, payload: EncodedPayload) -> bool:
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return '*' in tags or payload.etag.removeprefix('W/') in tags
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return since.tzinfo is not None and payload.last_modified <= since
+    return False
+
+
+def json_response(request: Request, payload: EncodedPayload) -> Response:
+    headers = {
+        'ETag': payload.etag,
+        'Last-Modified': format_datetime(payload.last_modified, usegmt=True),
+        'Cache-Control': 'no-cache',
+        'Vary': 'Accept-Encoding',
+    }
+    if _not_modified(request, payload):
+        return Response(status_code=304, headers=headers)
+
+    accepted = _accepted_encodings(request.headers.get('accept-encoding', ''))
+    wildcard = accepted.get('*', 0.0)
+    # Highest q-value wins; brotli is preferred over gzip on ties.
+    candidates = [
+        (accepted.get(coding, wildcard), rank, coding, body)
+        for rank, coding, body in ((2, 'br', payload.br_body), (1, 'gzip', payload.gzip_body))
+        if body is not None
+    ]
+    q, _, coding, body = max(candidates, default=(0.0, 0, None, None))
+    if q > 0:
+        headers['Content-Encoding'] = coding
+    else:
+        body = payload.body
+    return Response(content=body, media_type='application/json', headers=headers)
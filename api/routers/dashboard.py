@@ -1,68 +1,105 @@
-from fastapi import APIRouter, HTTPException
-from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
-from database import execute_query
+from cache import StaleWhileRevalidateCache
+from database import execute_queries, execute_query
 from config import settings
+from filters import DashboardFilters, dashboard_filters
+from responses import EncodedPayload, json_response
+from query_plan import EXECUTIVE_SINGLE_SCAN_SQL, split_executive_rows
+from snapshot import snapshots
+from transform import Column, first_row, from_rows, records
 
 router = APIRouter(prefix='/api/dashboard', tags=['dashboard'])
 
-cache = TTLCache(maxsize=32, ttl=settings.cache_ttl_seconds)
+cache = StaleWhileRevalidateCache(
+    ttl=settings.cache_ttl_seconds,
+    max_staleness=settings.cache_max_staleness_seconds,
+    maxsize=settings.cache_max_bytes,
+    getsizeof=lambda payload: payload.size,
+    # Keep Last-Modified when a refresh produces the same body
+    unchanged=lambda old, new: old.etag == new.etag,
+)
 
 # ---------------------------------------------------------------------------
-# SQL Queries — All reference dbt marts/intermediate models in Snowflake
+# SQL Queries — All reference dbt marts models in Snowflake
+#
+# {filters} marks where DashboardFilters.where_sql() is spliced into queries
+# over FCT_ORDERS or AGG_ORDERS_DAILY, which share the filter columns; filter
+# values are always passed as bind parameters. Additive measures are summed
+# from the daily rollup; only distinct customer counts scan FCT_ORDERS.
+# The sales dashboard reads the lifetime dimension tables, so it takes no
+# filters rather than mixing filtered and lifetime numbers.
 # ---------------------------------------------------------------------------
 
 EXECUTIVE_KPIS_SQL = """
 WITH totals AS (
     SELECT
-        ROUND(SUM(ORDER_TOTAL), 2)                                          AS total_revenue,
-        COUNT(*)                                                             AS total_orders,
-        ROUND(AVG(ORDER_TOTAL), 2)                                          AS avg_order_value,
+        ROUND(SUM(REVENUE), 2)                                              AS total_revenue,
+        COALESCE(SUM(ORDERS), 0)                                             AS total_orders,
+        ROUND(SUM(REVENUE) / NULLIF(SUM(ORDERS), 0), 2)                     AS avg_order_value,
+        ROUND(SUM(REVIEW_SCORE_SUM) / NULLIF(SUM(REVIEWED_ORDERS), 0), 2)   AS avg_review_score,
+        ROUND(SUM(ON_TIME_ORDERS) * 100.0 / NULLIF(SUM(ORDERS), 0), 1)      AS on_time_rate
+    FROM MARTS.AGG_ORDERS_DAILY
+    WHERE {filters}
+),
+halves AS (
+    SELECT
+        ORDER_MONTH >= %(period_split)s                                     AS is_current,
+        ROUND(SUM(REVENUE), 2)                                              AS revenue,
+        SUM(ORDERS)                                                          AS orders,
+        ROUND(SUM(REVENUE) / NULLIF(SUM(ORDERS), 0), 2)                     AS aov,
+        ROUND(SUM(REVIEW_SCORE_SUM) / NULLIF(SUM(REVIEWED_ORDERS), 0), 2)   AS review,
+        ROUND(SUM(ON_TIME_ORDERS) * 100.0 / NULLIF(SUM(ORDERS), 0), 1)      AS on_time
+    FROM MARTS.AGG_ORDERS_DAILY
+    WHERE {filters}
+    GROUP BY ORDER_MONTH >= %(period_split)s
+),
+-- Distinct customers do not add up across days, so they come from the fact table
+customers AS (
+    SELECT
         COUNT(DISTINCT CUSTOMER_UNIQUE_ID)                                   AS unique_customers,
-        ROUND(AVG(AVG_REVIEW_SCORE), 2)                                     AS avg_review_score,
-        ROUND(AVG(CASE WHEN IS_DELIVERED_ON_TIME THEN 1.0 ELSE 0.0 END)*100, 1)
-                                                                             AS on_time_rate
+        COUNT(DISTINCT CASE WHEN ORDER_MONTH >= %(period_split)s
+                            THEN CUSTOMER_UNIQUE_ID END)                     AS current_customers,
+        COUNT(DISTINCT CASE WHEN ORDER_MONTH < %(period_split)s
+                            THEN CUSTOMER_UNIQUE_ID END)                     AS previous_customers
     FROM MARTS.FCT_ORDERS
+    WHERE {filters}
 ),
 current_half AS (
-    SELECT
-        ROUND(SUM(ORDER_TOTAL), 2)            AS revenue,
-        COUNT(*)                               AS orders,
-        ROUND(AVG(ORDER_TOTAL), 2)            AS aov,
-        COUNT(DISTINCT CUSTOMER_UNIQUE_ID)     AS customers,
-        ROUND(AVG(AVG_REVIEW_SCORE), 2)       AS review,
-        ROUND(AVG(CASE WHEN IS_DELIVERED_ON_TIME THEN 1.0 ELSE 0.0 END)*100, 1) AS on_time
-    FROM MARTS.FCT_ORDERS
-    WHERE ORDER_MONTH >= '2018-01-01'
+    SELECT h.revenue, COALESCE(h.orders, 0) AS orders, h.aov,
+           cu.current_customers AS customers, h.review, h.on_time
+    FROM customers cu
+    LEFT JOIN halves h ON h.is_current
 ),
 previous_half AS (
-    SELECT
-        ROUND(SUM(ORDER_TOTAL), 2)            AS revenue,
-        COUNT(*)                               AS orders,
-        ROUND(AVG(ORDER_TOTAL), 2)            AS aov,
-        COUNT(DISTINCT CUSTOMER_UNIQUE_ID)     AS customers,
-        ROUND(AVG(AVG_REVIEW_SCORE), 2)       AS review,
-        ROUND(AVG(CASE WHEN IS_DELIVERED_ON_TIME THEN 1.0 ELSE 0.0 END)*100, 1) AS on_time
-    FROM MARTS.FCT_ORDERS
-    WHERE ORDER_MONTH < '2018-01-01'
+    SELECT h.revenue, COALESCE(h.orders, 0) AS orders, h.aov,
+           cu.previous_customers AS customers, h.review, h.on_time
+    FROM customers cu
+    LEFT JOIN halves h ON NOT h.is_current
 )
 SELECT
-    t.*,
+    t.total_revenue,
+    t.total_orders,
+    t.avg_order_value,
+    cu.unique_customers,
+    t.avg_review_score,
+    t.on_time_rate,
     ROUND((c.revenue  - p.revenue)  * 100.0 / NULLIF(p.revenue, 0), 1)   AS revenue_change,
     ROUND((c.orders   - p.orders)   * 100.0 / NULLIF(p.orders, 0), 1)    AS orders_change,
     ROUND((c.aov      - p.aov)      * 100.0 / NULLIF(p.aov, 0), 1)      AS aov_change,
     ROUND((c.customers- p.customers)* 100.0 / NULLIF(p.customers, 0), 1) AS customers_change,
     ROUND(c.review - p.review, 2)                                          AS review_change,
     ROUND(c.on_time - p.on_time, 1)                                        AS on_time_change
-FROM totals t, current_half c, previous_half p
+FROM totals t, customers cu, current_half c, previous_half p
 """
 
 REVENUE_TIME_SERIES_SQL = """
 SELECT
     TO_CHAR(ORDER_MONTH, 'YYYY-MM')  AS date,
     TO_CHAR(ORDER_MONTH, 'Mon YYYY') AS label,
-    ROUND(SUM(ORDER_TOTAL), 2)       AS value
-FROM MARTS.FCT_ORDERS
+    ROUND(SUM(REVENUE), 2)           AS value
+FROM MARTS.AGG_ORDERS_DAILY
+WHERE {filters}
 GROUP BY ORDER_MONTH
 ORDER BY ORDER_MONTH
 """
@@ -70,80 +107,94 @@ ORDER BY ORDER_MONTH
 ORDER_STATUSES_SQL = """
 SELECT
     INITCAP(ORDER_STATUS)                                       AS status,
-    COUNT(*)                                                     AS count,
-    ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER(), 1)          AS percentage
-FROM MARTS.FCT_ORDERS
+    SUM(ORDERS)                                                  AS count,
+    ROUND(SUM(ORDERS) * 100.0 / SUM(SUM(ORDERS)) OVER(), 1)    AS percentage
+FROM MARTS.AGG_ORDERS_DAILY
+WHERE {filters}
 GROUP BY ORDER_STATUS
 ORDER BY count DESC
 """
 
 TOP_STATES_SQL = """
-SELECT
-    CUSTOMER_STATE                             AS state,
-    ROUND(SUM(ORDER_TOTAL), 2)                AS revenue,
-    COUNT(*)                                   AS orders,
-    COUNT(DISTINCT CUSTOMER_UNIQUE_ID)         AS customers
-FROM MARTS.FCT_ORDERS
-WHERE CUSTOMER_STATE IS NOT NULL
-GROUP BY CUSTOMER_STATE
-ORDER BY revenue DESC
-LIMIT 10
+WITH states AS (
+    SELECT
+        CUSTOMER_STATE                         AS state,
+        ROUND(SUM(REVENUE), 2)                AS revenue,
+        SUM(ORDERS)                            AS orders
+    FROM MARTS.AGG_ORDERS_DAILY
+    WHERE CUSTOMER_STATE IS NOT NULL AND {filters}
+    GROUP BY CUSTOMER_STATE
+    ORDER BY revenue DESC
+    LIMIT 10
+),
+customers AS (
+    SELECT
+        CUSTOMER_STATE                         AS state,
+        COUNT(DISTINCT CUSTOMER_UNIQUE_ID)     AS customers
+    FROM MARTS.FCT_ORDERS
+    WHERE CUSTOMER_STATE IN (SELECT state FROM states) AND {filters}
+    GROUP BY CUSTOMER_STATE
+)
+SELECT s.state, s.revenue, s.orders, c.customers
+FROM states s
+JOIN customers c ON c.state = s.state
+ORDER BY s.revenue DESC
 """
 
 PAYMENT_TYPES_SQL = """
 SELECT
     INITCAP(REPLACE(PRIMARY_PAYMENT_TYPE, '_', ' ')) AS type,
-    COUNT(*)                                          AS count,
-    ROUND(SUM(PAYMENT_TOTAL), 2)                     AS value,
-    ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER(), 1) AS percentage
-FROM MARTS.FCT_ORDERS
-WHERE PRIMARY_PAYMENT_TYPE IS NOT NULL
+    SUM(ORDERS)                                       AS count,
+    ROUND(SUM(PAYMENT_VALUE), 2)                     AS value,
+    ROUND(SUM(ORDERS) * 100.0 / SUM(SUM(ORDERS)) OVER(), 1) AS percentage
+FROM MARTS.AGG_ORDERS_DAILY
+WHERE PRIMARY_PAYMENT_TYPE IS NOT NULL AND {filters}
 GROUP BY PRIMARY_PAYMENT_TYPE
 ORDER BY count DESC
 """
 
 REVIEW_DISTRIBUTION_SQL = """
 SELECT
-    ROUND(AVG_REVIEW_SCORE)::INT                                AS score,
-    COUNT(*)                                                     AS count,
-    ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER(), 1)          AS percentage
-FROM MARTS.FCT_ORDERS
-WHERE AVG_REVIEW_SCORE IS NOT NULL
-GROUP BY ROUND(AVG_REVIEW_SCORE)
+    REVIEW_BUCKET                                               AS score,
+    SUM(ORDERS)                                                  AS count,
+    ROUND(SUM(ORDERS) * 100.0 / SUM(SUM(ORDERS)) OVER(), 1)    AS percentage
+FROM MARTS.AGG_ORDERS_DAILY
+WHERE REVIEW_BUCKET IS NOT NULL AND {filters}
+GROUP BY REVIEW_BUCKET
 ORDER BY score DESC
 """
 
 DELIVERY_METRICS_SQL = """
 SELECT
-    ROUND(AVG(CASE WHEN IS_DELIVERED_ON_TIME THEN 1.0 ELSE 0.0 END)*100, 1)     AS on_time_rate,
-    ROUND(AVG(DAYS_TO_DELIVER), 1)                                                AS avg_delivery_days,
-    SUM(CASE WHEN IS_DELIVERED_ON_TIME = FALSE AND DAYS_TO_DELIVER IS NOT NULL
-        THEN 1 ELSE 0 END)                                                        AS late_deliveries,
-    SUM(CASE WHEN IS_DELIVERED_ON_TIME THEN 1 ELSE 0 END)                         AS early_deliveries
-FROM MARTS.FCT_ORDERS
-WHERE ORDER_STATUS = 'delivered'
+    ROUND(SUM(ON_TIME_ORDERS) * 100.0 / NULLIF(SUM(ORDERS), 0), 1)               AS on_time_rate,
+    ROUND(SUM(DELIVERY_DAYS_SUM) / NULLIF(SUM(DELIVERED_WITH_DAYS), 0), 1)       AS avg_delivery_days,
+    SUM(LATE_DELIVERIES)                                                          AS late_deliveries,
+    SUM(ON_TIME_ORDERS)                                                           AS early_deliveries
+FROM MARTS.AGG_ORDERS_DAILY
+WHERE ORDER_STATUS = 'delivered' AND {filters}
 """
 
 # --- Sales Analytics queries ------------------------------------------------
 
 SALES_KPIS_SQL = """
 SELECT
-    SUM(ITEM_COUNT)                                               AS total_products_sold,
+    SUM(ITEMS)                                                    AS total_products_sold,
     (SELECT COUNT(DISTINCT CATEGORY)
      FROM MARTS.DIM_PRODUCTS WHERE TOTAL_ORDERS > 0)             AS active_categories,
     (SELECT COUNT(*)
      FROM MARTS.DIM_SELLERS WHERE TOTAL_ORDERS > 0)              AS total_sellers,
-    ROUND(AVG(AVG_REVIEW_SCORE), 2)                              AS avg_review_score
-FROM MARTS.FCT_ORDERS
-WHERE AVG_REVIEW_SCORE IS NOT NULL
+    ROUND(SUM(REVIEW_SCORE_SUM) / NULLIF(SUM(REVIEWED_ORDERS), 0), 2)
+                                                                  AS avg_review_score
+FROM MARTS.AGG_ORDERS_DAILY
+WHERE REVIEW_BUCKET IS NOT NULL
 """
 
 SALES_TREND_SQL = """
 SELECT
     TO_CHAR(ORDER_MONTH, 'YYYY-MM')  AS date,
     TO_CHAR(ORDER_MONTH, 'Mon YYYY') AS label,
-    ROUND(SUM(ORDER_TOTAL), 2)       AS value
-FROM MARTS.FCT_ORDERS
+    ROUND(SUM(REVENUE), 2)           AS value
+FROM MARTS.AGG_ORDERS_DAILY
 GROUP BY ORDER_MONTH
 ORDER BY ORDER_MONTH
 """
@@ -165,24 +216,16 @@ LIMIT 10
 
 TOP_SELLERS_SQL = """
 SELECT
-    s.SELLER_ID                                        AS seller_id,
-    INITCAP(s.CITY)                                    AS city,
-    s.STATE                                            AS state,
-    ROUND(s.TOTAL_REVENUE, 2)                          AS revenue,
-    s.TOTAL_ORDERS                                     AS orders,
-    ROUND(COALESCE(s.AVG_REVIEW_SCORE, 0), 1)         AS avg_rating,
-    ROUND(
-        COUNT(CASE WHEN oi.ORDER_STATUS = 'delivered' THEN 1 END) * 100.0
-        / NULLIF(COUNT(*), 0), 1
-    )                                                   AS fulfillment_rate
-FROM MARTS.DIM_SELLERS s
-LEFT JOIN INTERMEDIATE.INT_ORDER_ITEMS_ENRICHED oi
-    ON s.SELLER_ID = oi.SELLER_ID
-WHERE s.TOTAL_ORDERS > 0
-GROUP BY s.SELLER_ID, s.CITY, s.STATE,
-         s.TOTAL_REVENUE, s.TOTAL_ORDERS, s.AVG_REVIEW_SCORE
-ORDER BY revenue DESC
-LIMIT 10
+    SELLER_ID                                          AS seller_id,
+    INITCAP(CITY)                                      AS city,
+    STATE                                              AS state,
+    ROUND(TOTAL_REVENUE, 2)                            AS revenue,
+    TOTAL_ORDERS                                       AS orders,
+    ROUND(COALESCE(AVG_REVIEW_SCORE, 0), 1)           AS avg_rating,
+    FULFILLMENT_RATE                                   AS fulfillment_rate
+FROM MARTS.TOP_SELLERS
+WHERE REVENUE_RANK <= 10
+ORDER BY REVENUE_RANK
 """
 
 CATEGORY_METRICS_SQL = """
@@ -225,93 +268,50 @@ SEGMENT_COLORS = {
 # Helper — build KPI dicts for the Angular frontend
 # ---------------------------------------------------------------------------
 
+def _value(row: dict, key: str, cast: type = float) -> float | int:
+    # Aggregates are NULL when the filters match no orders.
+    return cast(row.get(key) or 0)
+
+
+def _kpi(label: str, value: float | int, change: float, icon: str, fmt: str,
+         neutral_when_flat: bool = False) -> dict:
+    if change > 0:
+        trend = 'up'
+    elif change == 0 and neutral_when_flat:
+        trend = 'neutral'
+    else:
+        trend = 'down'
+    return {'label': label, 'value': value, 'change': change, 'trend': trend,
+            'icon': icon, 'format': fmt}
+
+
 def _build_executive_kpis(row: dict) -> list[dict]:
     return [
-        {
-            'label': 'Total Revenue',
-            'value': float(row['TOTAL_REVENUE']),
-            'change': float(row.get('REVENUE_CHANGE', 0) or 0),
-            'trend': 'up' if float(row.get('REVENUE_CHANGE', 0) or 0) > 0 else 'down',
-            'icon': 'attach_money',
-            'format': 'currency',
-        },
-        {
-            'label': 'Total Orders',
-            'value': int(row['TOTAL_ORDERS']),
-            'change': float(row.get('ORDERS_CHANGE', 0) or 0),
-            'trend': 'up' if float(row.get('ORDERS_CHANGE', 0) or 0) > 0 else 'down',
-            'icon': 'shopping_cart',
-            'format': 'number',
-        },
-        {
-            'label': 'Avg Order Value',
-            'value': float(row['AVG_ORDER_VALUE']),
-            'change': float(row.get('AOV_CHANGE', 0) or 0),
-            'trend': 'up' if float(row.get('AOV_CHANGE', 0) or 0) > 0 else 'down',
-            'icon': 'trending_up',
-            'format': 'currency',
-        },
-        {
-            'label': 'Unique Customers',
-            'value': int(row['UNIQUE_CUSTOMERS']),
-            'change': float(row.get('CUSTOMERS_CHANGE', 0) or 0),
-            'trend': 'up' if float(row.get('CUSTOMERS_CHANGE', 0) or 0) > 0 else 'down',
-            'icon': 'people',
-            'format': 'number',
-        },
-        {
-            'label': 'Customer Satisfaction',
-            'value': float(row['AVG_REVIEW_SCORE']),
-            'change': float(row.get('REVIEW_CHANGE', 0) or 0),
-            'trend': 'up' if float(row.get('REVIEW_CHANGE', 0) or 0) > 0 else ('down' if float(row.get('REVIEW_CHANGE', 0) or 0) < 0 else 'neutral'),
-            'icon': 'star',
-            'format': 'rating',
-        },
-        {
-            'label': 'On-Time Delivery',
-            'value': float(row['ON_TIME_RATE']),
-            'change': float(row.get('ON_TIME_CHANGE', 0) or 0),
-            'trend': 'up' if float(row.get('ON_TIME_CHANGE', 0) or 0) > 0 else ('down' if float(row.get('ON_TIME_CHANGE', 0) or 0) < 0 else 'neutral'),
-            'icon': 'local_shipping',
-            'format': 'percent',
-        },
+        _kpi('Total Revenue', _value(row, 'TOTAL_REVENUE'),
+             _value(row, 'REVENUE_CHANGE'), 'attach_money', 'currency'),
+        _kpi('Total Orders', _value(row, 'TOTAL_ORDERS', int),
+             _value(row, 'ORDERS_CHANGE'), 'shopping_cart', 'number'),
+        _kpi('Avg Order Value', _value(row, 'AVG_ORDER_VALUE'),
+             _value(row, 'AOV_CHANGE'), 'trending_up', 'currency'),
+        _kpi('Unique Customers', _value(row, 'UNIQUE_CUSTOMERS', int),
+             _value(row, 'CUSTOMERS_CHANGE'), 'people', 'number'),
+        _kpi('Customer Satisfaction', _value(row, 'AVG_REVIEW_SCORE'),
+             _value(row, 'REVIEW_CHANGE'), 'star', 'rating', neutral_when_flat=True),
+        _kpi('On-Time Delivery', _value(row, 'ON_TIME_RATE'),
+             _value(row, 'ON_TIME_CHANGE'), 'local_shipping', 'percent', neutral_when_flat=True),
     ]
 
 
 def _build_sales_kpis(row: dict) -> list[dict]:
     return [
-        {
-            'label': 'Total Products Sold',
-            'value': int(row['TOTAL_PRODUCTS_SOLD']),
-            'change': 0,
-            'trend': 'neutral',
-            'icon': 'inventory_2',
-            'format': 'number',
-        },
-        {
-            'label': 'Active Categories',
-            'value': int(row['ACTIVE_CATEGORIES']),
-            'change': 0,
-            'trend': 'neutral',
-            'icon': 'category',
-            'format': 'number',
-        },
-        {
-            'label': 'Total Sellers',
-            'value': int(row['TOTAL_SELLERS']),
-            'change': 0,
-            'trend': 'neutral',
-            'icon': 'store',
-            'format': 'number',
-        },
-        {
-            'label': 'Avg Review Score',
-            'value': float(row['AVG_REVIEW_SCORE']),
-            'change': 0,
-            'trend': 'neutral',
-            'icon': 'reviews',
-            'format': 'rating',
-        },
+        _kpi('Total Products Sold', _value(row, 'TOTAL_PRODUCTS_SOLD', int), 0,
+             'inventory_2', 'number', neutral_when_flat=True),
+        _kpi('Active Categories', _value(row, 'ACTIVE_CATEGORIES', int), 0,
+             'category', 'number', neutral_when_flat=True),
+        _kpi('Total Sellers', _value(row, 'TOTAL_SELLERS', int), 0,
+             'store', 'number', neutral_when_flat=True),
+        _kpi('Avg Review Score', _value(row, 'AVG_REVIEW_SCORE'), 0,
+             'reviews', 'rating', neutral_when_flat=True),
     ]
 
 
@@ -319,63 +319,104 @@ def _build_sales_kpis(row: dict) -> list[dict]:
 # Routes
 # ---------------------------------------------------------------------------
 
+def _get_payload(name: str, loader, filters: DashboardFilters) -> EncodedPayload:
+    # Snapshots are only built for the unfiltered dashboards.
+    if filters.is_default:
+        payload = snapshots.get(name)
+        if payload is not None:
+            return payload
+    return cache.get_or_load(
+        (name, filters.cache_key()), lambda: EncodedPayload.encode(loader(filters))
+    )
+
+
 @router.get('/executive')
-def get_executive_dashboard():
-    if 'executive' in cache:
-        return cache['executive']
+def get_executive_dashboard(
+    request: Request, filters: DashboardFilters = Depends(dashboard_filters)
+) -> Response:
+    return json_response(request, _get_payload('executive', load_executive_dashboard, filters))
 
+
+@router.get('/sales')
+def get_sales_dashboard(
+    request: Request, filters: DashboardFilters = Depends(dashboard_filters)
+) -> Response:
+    if filters.selects_orders:
+        raise HTTPException(
+            status_code=422,
+            detail='The sales dashboard shows lifetime totals and cannot be filtered '
+                   'by date, state or payment type',
+        )
+    # period_split does not affect the sales widgets, so every request shares
+    # the unfiltered payload.
+    return json_response(
+        request, _get_payload('sales', lambda _: load_sales_dashboard(), DashboardFilters())
+    )
+
+
+@router.get('/cache/stats')
+def get_cache_stats():
+    return {**cache.stats(), 'snapshot': snapshots.info()}
+
+
+def _filtered(queries: dict[str, str], filters: DashboardFilters) -> dict[str, str]:
+    where = filters.where_sql()
+    return {name: sql.replace('{filters}', where) for name, sql in queries.items()}
+
+
+def load_executive_dashboard(filters: DashboardFilters = DashboardFilters()) -> dict:
     try:
-        kpi_rows = execute_query(EXECUTIVE_KPIS_SQL)
-        revenue_ts = execute_query(REVENUE_TIME_SERIES_SQL)
-        order_statuses = execute_query(ORDER_STATUSES_SQL)
-        top_states = execute_query(TOP_STATES_SQL)
-        payment_types = execute_query(PAYMENT_TYPES_SQL)
-        reviews = execute_query(REVIEW_DISTRIBUTION_SQL)
-        delivery = execute_query(DELIVERY_METRICS_SQL)
+        if settings.executive_single_scan:
+            split = split_executive_rows(execute_query(
+                EXECUTIVE_SINGLE_SCAN_SQL.replace('{filters}', filters.where_sql()),
+                params=filters.params(),
+            ))
+            rows = {name: from_rows(widget_rows) for name, widget_rows in split.items()}
+        else:
+            rows = execute_queries(_filtered({
+                'kpis': EXECUTIVE_KPIS_SQL,
+                'revenue_ts': REVENUE_TIME_SERIES_SQL,
+                'order_statuses': ORDER_STATUSES_SQL,
+                'top_states': TOP_STATES_SQL,
+                'payment_types': PAYMENT_TYPES_SQL,
+                'reviews': REVIEW_DISTRIBUTION_SQL,
+                'delivery': DELIVERY_METRICS_SQL,
+            }, filters), params=filters.params())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f'Snowflake query error: {e}')
 
-    kpi_row = kpi_rows[0] if kpi_rows else {}
-    delivery_row = delivery[0] if delivery else {}
+    kpi_row = first_row(rows['kpis'])
+    delivery_row = first_row(rows['delivery'])
 
     result = {
         'kpis': _build_executive_kpis(kpi_row),
         'salesMetrics': {
-            'totalRevenue': float(kpi_row.get('TOTAL_REVENUE', 0)),
-            'totalOrders': int(kpi_row.get('TOTAL_ORDERS', 0)),
-            'averageOrderValue': float(kpi_row.get('AVG_ORDER_VALUE', 0)),
-            'revenueGrowth': float(kpi_row.get('REVENUE_CHANGE', 0) or 0),
-            'orderGrowth': float(kpi_row.get('ORDERS_CHANGE', 0) or 0),
+            'totalRevenue': _value(kpi_row, 'TOTAL_REVENUE'),
+            'totalOrders': _value(kpi_row, 'TOTAL_ORDERS', int),
+            'averageOrderValue': _value(kpi_row, 'AVG_ORDER_VALUE'),
+            'revenueGrowth': _value(kpi_row, 'REVENUE_CHANGE'),
+            'orderGrowth': _value(kpi_row, 'ORDERS_CHANGE'),
         },
-        'revenueTimeSeries': [
-            {'date': r['DATE'], 'value': float(r['VALUE']), 'label': r['LABEL']}
-            for r in revenue_ts
-        ],
-        'orderStatuses': [
-            {'status': r['STATUS'], 'count': int(r['COUNT']),
-             'percentage': float(r['PERCENTAGE'])}
-            for r in order_statuses
-        ],
-        'topStates': [
-            {'state': r['STATE'], 'revenue': float(r['REVENUE']),
-             'orders': int(r['ORDERS']), 'customers': int(r['CUSTOMERS'])}
-            for r in top_states
-        ],
-        'paymentTypes': [
-            {'type': r['TYPE'], 'count': int(r['COUNT']),
-             'value': float(r['VALUE']), 'percentage': float(r['PERCENTAGE'])}
-            for r in payment_types
-        ],
-        'reviewDistribution': [
-            {'score': int(r['SCORE']), 'count': int(r['COUNT']),
-             'percentage': float(r['PERCENTAGE'])}
-            for r in reviews
-        ],
+        'revenueTimeSeries': records(rows['revenue_ts'], {
+            'DATE': str, 'VALUE': float, 'LABEL': str,
+        }),
+        'orderStatuses': records(rows['order_statuses'], {
+            'STATUS': str, 'COUNT': int, 'PERCENTAGE': float,
+        }),
+        'topStates': records(rows['top_states'], {
+            'STATE': str, 'REVENUE': float, 'ORDERS': int, 'CUSTOMERS': int,
+        }),
+        'paymentTypes': records(rows['payment_types'], {
+            'TYPE': str, 'COUNT': int, 'VALUE': float, 'PERCENTAGE': float,
+        }),
+        'reviewDistribution': records(rows['reviews'], {
+            'SCORE': int, 'COUNT': int, 'PERCENTAGE': float,
+        }),
         'deliveryMetrics': {
-            'onTimeRate': float(delivery_row.get('ON_TIME_RATE', 0) or 0),
-            'avgDeliveryDays': float(delivery_row.get('AVG_DELIVERY_DAYS', 0) or 0),
-            'lateDeliveries': int(delivery_row.get('LATE_DELIVERIES', 0) or 0),
-            'earlyDeliveries': int(delivery_row.get('EARLY_DELIVERIES', 0) or 0),
+            'onTimeRate': _value(delivery_row, 'ON_TIME_RATE'),
+            'avgDeliveryDays': _value(delivery_row, 'AVG_DELIVERY_DAYS'),
+            'lateDeliveries': _value(delivery_row, 'LATE_DELIVERIES', int),
+            'earlyDeliveries': _value(delivery_row, 'EARLY_DELIVERIES', int),
         },
         'topProducts': [],
         'topSellers': [],
@@ -384,26 +425,29 @@ def get_executive_dashboard():
         'salesTrend': [],
     }
 
-    cache['executive'] = result
     return result
 
 
-@router.get('/sales')
-def get_sales_dashboard():
-    if 'sales' in cache:
-        return cache['sales']
-
+def load_sales_dashboard() -> dict:
     try:
-        kpi_rows = execute_query(SALES_KPIS_SQL)
-        sales_trend = execute_query(SALES_TREND_SQL)
-        top_products = execute_query(TOP_PRODUCTS_SQL)
-        top_sellers = execute_query(TOP_SELLERS_SQL)
-        categories = execute_query(CATEGORY_METRICS_SQL)
-        segments = execute_query(CUSTOMER_SEGMENTS_SQL)
+        rows = execute_queries({
+            'kpis': SALES_KPIS_SQL,
+            'sales_trend': SALES_TREND_SQL,
+            'top_products': TOP_PRODUCTS_SQL,
+            'top_sellers': TOP_SELLERS_SQL,
+            'categories': CATEGORY_METRICS_SQL,
+            'segments': CUSTOMER_SEGMENTS_SQL,
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f'Snowflake query error: {e}')
 
-    kpi_row = kpi_rows[0] if kpi_rows else {}
+    kpi_row = first_row(rows['kpis'])
+
+    segments = records(rows['segments'], {
+        'SEGMENT': str, 'COUNT': int, 'REVENUE': float, 'AVG_ORDER_VALUE': float,
+    })
+    for segment in segments:
+        segment['color'] = SEGMENT_COLORS.get(segment['segment'], '#9E9E9E')
 
     result = {
         'kpis': _build_sales_kpis(kpi_row),
@@ -414,54 +458,35 @@ def get_sales_dashboard():
             'revenueGrowth': 0,
             'orderGrowth': 0,
         },
-        'salesTrend': [
-            {'date': r['DATE'], 'value': float(r['VALUE']), 'label': r['LABEL']}
-            for r in sales_trend
-        ],
-        'topProducts': [
-            {
-                'rank': int(r['RANK']),
-                'productId': r['PRODUCT_ID'],
-                'category': r['CATEGORY'],
-                'revenue': float(r['REVENUE']),
-                'orders': int(r['ORDERS']),
-                'avgPrice': float(r['AVG_PRICE']),
-                'avgReview': float(r['AVG_REVIEW']),
-            }
-            for r in top_products
-        ],
-        'topSellers': [
-            {
-                'sellerId': r['SELLER_ID'],
-                'city': r['CITY'],
-                'state': r['STATE'],
-                'revenue': float(r['REVENUE']),
-                'orders': int(r['ORDERS']),
-                'avgRating': float(r['AVG_RATING']),
-                'fulfillmentRate': float(r.get('FULFILLMENT_RATE', 0) or 0),
-            }
-            for r in top_sellers
-        ],
-        'categoryMetrics': [
-            {
-                'category': r['CATEGORY'],
-                'revenue': float(r['REVENUE']),
-                'orders': int(r['ORDERS']),
-                'avgPrice': float(r['AVG_PRICE']),
-                'productCount': int(r['PRODUCT_COUNT']),
-            }
-            for r in categories
-        ],
-        'customerSegments': [
-            {
-                'segment': r['SEGMENT'],
-                'count': int(r['COUNT']),
-                'revenue': float(r['REVENUE']),
-                'avgOrderValue': float(r['AVG_ORDER_VALUE']),
-                'color': SEGMENT_COLORS.get(r['SEGMENT'], '#9E9E9E'),
-            }
-            for r in segments
-        ],
+        'salesTrend': records(rows['sales_trend'], {
+            'DATE': str, 'VALUE': float, 'LABEL': str,
+        }),
+        'topProducts': records(rows['top_products'], {
+            'RANK': int,
+            'PRODUCT_ID': str,
+            'CATEGORY': str,
+            'REVENUE': float,
+            'ORDERS': int,
+            'AVG_PRICE': float,
+            'AVG_REVIEW': float,
+        }),
+        'topSellers': records(rows['top_sellers'], {
+            'SELLER_ID': str,
+            'CITY': str,
+            'STATE': str,
+            'REVENUE': float,
+            'ORDERS': int,
+            'AVG_RATING': float,
+            'FULFILLMENT_RATE': Column(float, default=0.0),
+        }),
+        'categoryMetrics': records(rows['categories'], {
+            'CATEGORY': str,
+            'REVENUE': float,
+            'ORDERS': int,
+            'AVG_PRICE': float,
+            'PRODUCT_COUNT': int,
+        }),
+        'customerSegments': segments,
         'revenueTimeSeries': [],
         'orderStatuses': [],
         'topStates': [],
@@ -475,5 +500,4 @@ def get_sales_dashboard():
         },
     }
 
-    cache['sales'] = result
     return result
@@ -0,0 +1,152 @@
+"""Build precomputed dashboard snapshots after a dbt run.
+
+The dashboard payloads only change when the marts are rebuilt, so
+scripts/deploy_prod.sh runs this module right after `dbt run`/`dbt test`:
+
+    python api/snapshot.py
+
+Each build is written to a timestamped file in ``settings.snapshot_dir`` and
+then atomically published as ``dashboard-latest.json``, which the API loads
+at startup and serves from memory. A snapshot older than
+``settings.snapshot_max_age_seconds`` is not served; requests fall back to
+live queries until the next build is published.
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+from config import settings
+from responses import EncodedPayload
+
+SNAPSHOT_FORMAT_VERSION = 1
+LATEST_FILENAME = 'dashboard-latest.json'
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.snapshot-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def build_snapshot(snapshot_dir: str | None = None, keep: int | None = None) -> str:
+    from routers.dashboard import load_executive_dashboard, load_sales_dashboard
+
+    snapshot_dir = snapshot_dir or settings.snapshot_dir
+    keep = settings.snapshot_keep if keep is None else keep
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    built_at = datetime.now(timezone.utc)
+    snapshot = {
+        'formatVersion': SNAPSHOT_FORMAT_VERSION,
+        'builtAt': built_at.isoformat(),
+        'database': settings.snowflake_database,
+        'payloads': {
+            'executive': load_executive_dashboard(),
+            'sales': load_sales_dashboard(),
+        },
+    }
+    data = json.dumps(snapshot, separators=(',', ':')).encode('utf-8')
+
+    version_path = os.path.join(
+        snapshot_dir, f"dashboard-{built_at.strftime('%Y%m%dT%H%M%SZ')}.json"
+    )
+    _write_atomic(version_path, data)
+    _write_atomic(os.path.join(snapshot_dir, LATEST_FILENAME), data)
+
+    versions = sorted(
+        name for name in os.listdir(snapshot_dir)
+        if name.startswith('dashboard-') and name != LATEST_FILENAME
+    )
+    for name in versions[:-keep] if keep > 0 else []:
+        os.remove(os.path.join(snapshot_dir, name))
+
+    return version_path
+
+
+class SnapshotStore:
+    """In-memory view of the latest published snapshot.
+
+    ``get`` re-stats the snapshot file on every call and reloads it when a
+    new build has been published, so a running API picks up a deploy without
+    restarting. It returns None once the snapshot is older than
+    ``max_age_seconds``, so callers query live data instead.
+    """
+
+    def __init__(self, snapshot_dir: str, max_age_seconds: int = 0):
+        self.path = os.path.join(snapshot_dir, LATEST_FILENAME)
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._mtime_ns: int | None = None
+        self._snapshot: dict[str, Any] | None = None
+        self._encoded: dict[str, EncodedPayload] = {}
+
+    def load(self) -> dict[str, Any] | None:
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            with self._lock:
+                self._mtime_ns, self._snapshot, self._encoded = None, None, {}
+            return None
+
+        with self._lock:
+            if mtime_ns == self._mtime_ns:
+                return self._snapshot
+            with open(self.path, 'rb') as f:
+                snapshot = json.loads(f.read())
+            encoded = {}
+            if snapshot.get('formatVersion') != SNAPSHOT_FORMAT_VERSION:
+                snapshot = None
+            else:
+                built_at = datetime.fromisoformat(snapshot['builtAt'])
+                encoded = {
+                    name: EncodedPayload.encode(payload, last_modified=built_at)
+                    for name, payload in snapshot['payloads'].items()
+                }
+            self._mtime_ns, self._snapshot, self._encoded = mtime_ns, snapshot, encoded
+            return snapshot
+
+    def is_expired(self, snapshot: dict[str, Any]) -> bool:
+        if not self.max_age_seconds:
+            return False
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(snapshot['builtAt'])
+        return age.total_seconds() > self.max_age_seconds
+
+    def get(self, name: str) -> EncodedPayload | None:
+        snapshot = self.load()
+        if snapshot is None or self.is_expired(snapshot):
+            return None
+        with self._lock:
+            return self._encoded.get(name)
+
+    def info(self) -> dict[str, Any]:
+        snapshot = self.load()
+        if snapshot is None:
+            return {'available': False}
+        return {
+            'available': True,
+            'builtAt': snapshot['builtAt'],
+            'expired': self.is_expired(snapshot),
+            'database': snapshot['database'],
+            'payloads': sorted(snapshot['payloads']),
+        }
+
+
+snapshots = SnapshotStore(settings.snapshot_dir, settings.snapshot_max_age_seconds)
+
+
+if __name__ == '__main__':
+    try:
+        path = build_snapshot()
+    except Exception as e:
+        print(f'✗ Snapshot build failed: {e}')
+        sys.exit(1)
+    print(f'✓ Dashboard snapshot written to {path}')
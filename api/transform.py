@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# ---------------------------------------------------------------------------
+# Column-wise payload building
+#
+# Query results arrive as Arrow tables. Typing, rounding, null defaults and
+# the UPPER_SNAKE -> camelCase rename are applied once per column with Arrow
+# compute kernels; Python objects are only created by the final to_pylist().
+# ---------------------------------------------------------------------------
+
+_ARROW_TYPES = {float: pa.float64(), int: pa.int64(), str: pa.string()}
+
+
+@dataclass(frozen=True)
+class Column:
+    type: type
+    round: int | None = None
+    default: Any = None
+
+
+def camel_case(name: str) -> str:
+    head, *rest = name.lower().split('_')
+    return head + ''.join(part.title() for part in rest)
+
+
+def _convert(table: pa.Table, name: str, spec: type | Column) -> pa.ChunkedArray | pa.Array:
+    if not isinstance(spec, Column):
+        spec = Column(spec)
+    if name in table.column_names:
+        values = table.column(name)
+    else:
+        values = pa.nulls(table.num_rows)
+    if spec.round is not None and not pa.types.is_null(values.type):
+        # Snowflake ROUND() semantics: half away from zero.
+        values = pc.round(values, ndigits=spec.round, round_mode='half_towards_infinity')
+    if spec.type is float and pa.types.is_decimal(values.type):
+        # Arrow's DECIMAL -> DOUBLE cast scales in floating point (70.6 comes
+        # out as 70.60000000000001); going through the decimal string rounds
+        # to the nearest double like float(Decimal) did.
+        values = pc.cast(values, pa.string())
+    # Unsafe casts truncate DECIMAL -> INT like int(Decimal) did.
+    values = pc.cast(values, _ARROW_TYPES[spec.type], safe=False)
+    if spec.default is not None:
+        values = pc.fill_null(values, pa.scalar(spec.default, _ARROW_TYPES[spec.type]))
+    return values
+
+
+def records(table: pa.Table, spec: dict[str, type | Column]) -> list[dict[str, Any]]:
+    """Convert ``table`` to JSON-ready dicts keyed by the camelCased column names.
+
+    ``spec`` maps source column -> output type (``float``, ``int``, ``str``)
+    or a ``Column`` with rounding and a null default; output keys follow the
+    spec order.
+    """
+    if table.num_rows == 0:
+        return []
+    return pa.table({
+        camel_case(name): _convert(table, name, column_spec)
+        for name, column_spec in spec.items()
+    }).to_pylist()
+
+
+def first_row(table: pa.Table) -> dict[str, Any]:
+    return table.slice(0, 1).to_pylist()[0] if table.num_rows else {}
+
+
+def from_rows(rows: list[dict[str, Any]]) -> pa.Table:
+    return pa.Table.from_pylist(rows)
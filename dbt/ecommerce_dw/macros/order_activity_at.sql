@@ -0,0 +1,11 @@
+{% macro order_activity_at(alias) -%}
+
+    {#- Latest status timestamp of an order; NULL steps fall back to the purchase -#}
+    greatest(
+        {{ alias }}.purchased_at,
+        coalesce({{ alias }}.approved_at, {{ alias }}.purchased_at),
+        coalesce({{ alias }}.delivered_to_carrier_at, {{ alias }}.purchased_at),
+        coalesce({{ alias }}.delivered_to_customer_at, {{ alias }}.purchased_at)
+    )
+
+{%- endmacro %}
@@ -20,6 +20,18 @@ sellers as (
 
     select * from {{ ref('stg_sellers') }}
 
+),
+
+order_reviews as (
+
+    select
+        order_id,
+        count(*) as review_count,
+        sum(review_score) as review_score_sum
+
+    from {{ ref('stg_order_reviews') }}
+    group by order_id
+
 )
 
 select
@@ -44,9 +56,15 @@ select
 
     -- Seller context
     s.city as seller_city,
-    s.state as seller_state
+    s.state as seller_state,
+
+    -- Review context: totals over all reviews of the order, repeated on each
+    -- of its items, so sums over items weight reviews as an item-review join
+    coalesce(r.review_count, 0) as order_review_count,
+    coalesce(r.review_score_sum, 0) as order_review_score_sum
 
 from order_items oi
 left join orders o on oi.order_id = o.order_id
 left join products p on oi.product_id = p.product_id
 left join sellers s on oi.seller_id = s.seller_id
+left join order_reviews r on oi.order_id = r.order_id
@@ -1,6 +1,55 @@
-with orders as (
+{{
+    config(
+        materialized='incremental',
+        unique_key='order_id',
+        incremental_strategy='merge',
+        on_schema_change='append_new_columns'
+    )
+}}
+
+-- Incremental runs rebuild only orders with activity (status timestamps or
+-- reviews) after the latest last_updated_at already loaded, minus a lookback
+-- for late-arriving rows. Items and payments arrive with their order; other
+-- late changes are picked up by the scheduled full refresh.
+
+with
+
+{% if is_incremental() %}
+
+watermark as (
+
+    select
+        dateadd(
+            'day', -{{ var('incremental_lookback_days') }}, max(last_updated_at)
+        ) as updated_since
+    from {{ this }}
+
+),
+
+changed_orders as (
+
+    select o.order_id
+    from {{ ref('stg_orders') }} o
+    cross join watermark w
+    where {{ order_activity_at('o') }} > w.updated_since
+
+    union
+
+    select r.order_id
+    from {{ ref('stg_order_reviews') }} r
+    cross join watermark w
+    where coalesce(r.review_answered_at, r.review_created_at) > w.updated_since
+
+),
+
+{% endif %}
+
+orders as (
 
     select * from {{ ref('stg_orders') }}
+    {% if is_incremental() %}
+    where order_id in (select order_id from changed_orders)
+    {% endif %}
 
 ),
 
@@ -16,6 +65,9 @@ items_summary as (
         sum(total_item_value) as items_total
 
     from {{ ref('stg_order_items') }}
+    {% if is_incremental() %}
+    where order_id in (select order_id from changed_orders)
+    {% endif %}
     group by order_id
 
 ),
@@ -30,6 +82,9 @@ payments_summary as (
         max(payment_installments) as max_installments
 
     from {{ ref('stg_order_payments') }}
+    {% if is_incremental() %}
+    where order_id in (select order_id from changed_orders)
+    {% endif %}
     group by order_id
 
 ),
@@ -39,9 +94,13 @@ reviews_summary as (
     select
         order_id,
         avg(review_score)::decimal(3, 2) as avg_review_score,
-        count(*) as review_count
+        count(*) as review_count,
+        max(coalesce(review_answered_at, review_created_at)) as last_reviewed_at
 
     from {{ ref('stg_order_reviews') }}
+    {% if is_incremental() %}
+    where order_id in (select order_id from changed_orders)
+    {% endif %}
     group by order_id
 
 )
@@ -81,7 +140,13 @@ select
 
     -- Reviews
     r.avg_review_score,
-    coalesce(r.review_count, 0) as review_count
+    coalesce(r.review_count, 0) as review_count,
+
+    -- Latest activity on the order; drives incremental runs
+    greatest(
+        {{ order_activity_at('o') }},
+        coalesce(r.last_reviewed_at, o.purchased_at)
+    ) as last_updated_at
 
 from orders o
 left join items_summary i on o.order_id = i.order_id
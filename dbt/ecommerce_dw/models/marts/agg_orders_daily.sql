@@ -0,0 +1,42 @@
+-- Daily rollup of fct_orders at the grain the dashboard filters and groups
+-- by. Only additive measures are kept, so any coarser grain (month, state,
+-- status, ...) is a sum over this table and averages are ratios of sums.
+-- Distinct customer counts are not additive and stay on fct_orders.
+
+with orders as (
+
+    select * from {{ ref('fct_orders') }}
+
+)
+
+select
+    order_date,
+    order_month,
+    order_status,
+    customer_state,
+    primary_payment_type,
+    round(avg_review_score)::int as review_bucket,
+
+    count(*) as orders,
+    sum(item_count) as items,
+    sum(order_total) as revenue,
+    sum(payment_total) as payment_value,
+
+    -- Reviews: avg_review_score = review_score_sum / reviewed_orders
+    sum(avg_review_score) as review_score_sum,
+    count(avg_review_score) as reviewed_orders,
+
+    -- Delivery
+    count_if(is_delivered_on_time) as on_time_orders,
+    count_if(not is_delivered_on_time and days_to_deliver is not null) as late_deliveries,
+    sum(days_to_deliver) as delivery_days_sum,
+    count(days_to_deliver) as delivered_with_days
+
+from orders
+group by
+    order_date,
+    order_month,
+    order_status,
+    customer_state,
+    primary_payment_type,
+    round(avg_review_score)::int
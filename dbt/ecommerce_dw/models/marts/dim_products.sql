@@ -11,23 +11,15 @@ product_sales as (
         count(distinct order_id) as total_orders,
         sum(price) as total_revenue,
         sum(freight_value) as total_freight,
-        avg(price)::decimal(10, 2) as avg_price
+        avg(price)::decimal(10, 2) as avg_price,
 
-    from {{ ref('stg_order_items') }}
-    group by product_id
-
-),
-
-product_reviews as (
+        -- Review metrics, weighted per item like an item-review join
+        (sum(order_review_score_sum) / nullif(sum(order_review_count), 0))::decimal(3, 2)
+            as avg_review_score,
+        sum(order_review_count) as review_count
 
-    select
-        oi.product_id,
-        avg(r.review_score)::decimal(3, 2) as avg_review_score,
-        count(r.review_id) as review_count
-
-    from {{ ref('stg_order_items') }} oi
-    inner join {{ ref('stg_order_reviews') }} r on oi.order_id = r.order_id
-    group by oi.product_id
+    from {{ ref('int_order_items_enriched') }}
+    group by product_id
 
 )
 
@@ -51,9 +43,8 @@ select
     s.avg_price,
 
     -- Review metrics
-    r.avg_review_score,
-    coalesce(r.review_count, 0) as review_count
+    s.avg_review_score,
+    coalesce(s.review_count, 0) as review_count
 
 from products p
 left join product_sales s on p.product_id = s.product_id
-left join product_reviews r on p.product_id = r.product_id
@@ -14,35 +14,26 @@ seller_performance as (
         sum(freight_value) as total_freight,
         avg(price)::decimal(10, 2) as avg_item_price,
         min(shipping_limit_at) as first_sale_at,
-        max(shipping_limit_at) as last_sale_at
+        max(shipping_limit_at) as last_sale_at,
 
-    from {{ ref('stg_order_items') }}
-    group by seller_id
-
-),
-
-seller_reviews as (
-
-    select
-        oi.seller_id,
-        avg(r.review_score)::decimal(3, 2) as avg_review_score,
-        count(r.review_id) as review_count
+        -- Fulfillment, from the status of the order each item belongs to
+        count_if(order_status = 'delivered') as delivered_items,
+        count_if(order_status = 'canceled') as canceled_items,
+        count(distinct case when order_status = 'delivered' then order_id end)
+            as delivered_orders,
+        count(distinct case when order_status = 'canceled' then order_id end)
+            as canceled_orders,
 
-    from {{ ref('stg_order_items') }} oi
-    inner join {{ ref('stg_order_reviews') }} r on oi.order_id = r.order_id
-    group by oi.seller_id
+        -- Review metrics, weighted per item like an item-review join
+        (sum(order_review_score_sum) / nullif(sum(order_review_count), 0))::decimal(3, 2)
+            as avg_review_score,
+        sum(order_review_count) as review_count,
 
-),
-
-seller_categories as (
-
-    select
-        oi.seller_id,
-        count(distinct p.category_name_en) as category_count
+        -- Diversity
+        count(distinct product_category) as category_count
 
-    from {{ ref('stg_order_items') }} oi
-    inner join {{ ref('stg_products') }} p on oi.product_id = p.product_id
-    group by oi.seller_id
+    from {{ ref('int_order_items_enriched') }}
+    group by seller_id
 
 )
 
@@ -61,14 +52,19 @@ select
     sp.first_sale_at,
     sp.last_sale_at,
 
+    -- Fulfillment metrics
+    coalesce(sp.delivered_items, 0) as delivered_items,
+    coalesce(sp.canceled_items, 0) as canceled_items,
+    coalesce(sp.delivered_orders, 0) as delivered_orders,
+    coalesce(sp.canceled_orders, 0) as canceled_orders,
+    round(sp.delivered_items * 100.0 / nullif(sp.total_items_sold, 0), 1) as fulfillment_rate,
+
     -- Review metrics
-    r.avg_review_score,
-    coalesce(r.review_count, 0) as review_count,
+    sp.avg_review_score,
+    coalesce(sp.review_count, 0) as review_count,
 
     -- Diversity
-    coalesce(sc.category_count, 0) as category_count
+    coalesce(sp.category_count, 0) as category_count
 
 from sellers s
 left join seller_performance sp on s.seller_id = sp.seller_id
-left join seller_reviews r on s.seller_id = r.seller_id
-left join seller_categories sc on s.seller_id = sc.seller_id
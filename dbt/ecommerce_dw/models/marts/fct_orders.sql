@@ -1,6 +1,24 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='order_id',
+        incremental_strategy='merge',
+        on_schema_change='append_new_columns'
+    )
+}}
+
 with orders_enriched as (
 
     select * from {{ ref('int_orders_enriched') }}
+    {% if is_incremental() %}
+    -- Orders int_orders_enriched rebuilt since this table was last merged
+    where last_updated_at > (
+        select dateadd(
+            'day', -{{ var('incremental_lookback_days') }}, max(last_updated_at)
+        )
+        from {{ this }}
+    )
+    {% endif %}
 
 ),
 
@@ -52,7 +70,9 @@ select
     date_trunc('day', o.purchased_at)::date as order_date,
     date_trunc('month', o.purchased_at)::date as order_month,
     dayofweek(o.purchased_at) as order_day_of_week,
-    hour(o.purchased_at) as order_hour
+    hour(o.purchased_at) as order_hour,
+
+    o.last_updated_at
 
 from orders_enriched o
 left join customers c on o.customer_id = c.customer_id
@@ -0,0 +1,26 @@
+-- Sellers ranked by lifetime revenue, for the dashboard's top sellers
+-- widget. Stored in rank order so a lookup on revenue_rank reads only the
+-- first micro-partition.
+
+with sellers as (
+
+    select * from {{ ref('dim_sellers') }}
+    where total_orders > 0
+
+)
+
+select
+    row_number() over (order by total_revenue desc, seller_id) as revenue_rank,
+    seller_id,
+    city,
+    state,
+    total_revenue,
+    total_orders,
+    total_items_sold,
+    avg_review_score,
+    delivered_items,
+    canceled_items,
+    fulfillment_rate
+
+from sellers
+order by revenue_rank
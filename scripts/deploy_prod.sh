@@ -6,6 +6,20 @@ PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
 DBT_DIR="$PROJECT_ROOT/dbt/ecommerce_dw"
 PROFILES_DIR="$PROJECT_ROOT/dbt"
 
+# Incremental models merge only recent changes; --full-refresh (or
+# DBT_FULL_REFRESH=true) rebuilds them from scratch
+FULL_REFRESH="${DBT_FULL_REFRESH:-false}"
+for arg in "$@"; do
+    case "$arg" in
+        --full-refresh) FULL_REFRESH=true ;;
+        *) echo "Usage: $0 [--full-refresh]"; exit 1 ;;
+    esac
+done
+RUN_FLAGS=()
+if [ "$FULL_REFRESH" = "true" ]; then
+    RUN_FLAGS+=(--full-refresh)
+fi
+
 # Load environment variables
 if [ -f "$PROJECT_ROOT/.env" ]; then
     set -a
@@ -22,6 +36,7 @@ echo "=========================================="
 echo ""
 echo "Database: ECOMMERCE_PROD"
 echo "Profiles: $PROFILES_DIR"
+echo "Full refresh: $FULL_REFRESH"
 echo ""
 
 # Confirm before proceeding
@@ -34,17 +49,28 @@ fi
 cd "$DBT_DIR"
 
 echo ""
-echo "[1/3] Installing dbt dependencies..."
+echo "[1/5] Installing dbt dependencies..."
 dbt deps --profiles-dir "$PROFILES_DIR"
 
 echo ""
-echo "[2/3] Running dbt models (target: prod)..."
-dbt run --target prod --profiles-dir "$PROFILES_DIR"
+echo "[2/5] Running dbt models (target: prod)..."
+dbt run --target prod --profiles-dir "$PROFILES_DIR" ${RUN_FLAGS[@]+"${RUN_FLAGS[@]}"}
+
+# Before dbt test, which overwrites run_results.json. Regressions are
+# reported, not fatal.
+echo ""
+echo "[3/5] Profiling the dbt run..."
+(cd "$PROJECT_ROOT" && python -m src.ecommerce_analytics.profiling.dbt_run_profile \
+    --target-dir "$DBT_DIR/target") || echo "WARNING: dbt run profile failed"
 
 echo ""
-echo "[3/3] Running dbt tests (target: prod)..."
+echo "[4/5] Running dbt tests (target: prod)..."
 dbt test --target prod --profiles-dir "$PROFILES_DIR"
 
+echo ""
+echo "[5/5] Building dashboard snapshot..."
+python "$PROJECT_ROOT/api/snapshot.py"
+
 echo ""
 echo "=========================================="
 echo "  Production deploy complete!"
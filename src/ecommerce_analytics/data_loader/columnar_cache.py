@@ -0,0 +1,203 @@
+"""
+Local cache of parsed source CSVs as Arrow IPC files.
+
+The first read of a CSV parses it with the registry types and writes the
+result, uncompressed, to an Arrow IPC file. Later reads memory-map that file:
+no parsing, and the returned columns point into the mapped pages instead of
+being copied. An entry is rebuilt when the CSV's content (its SHA-256) or
+the table's registered schema changes. Size and modification time are not
+trusted on their own: a file rewritten within the mtime resolution, or
+copied with its timestamps preserved, would otherwise be served stale.
+Hashing costs one sequential read, far less than parsing; callers that
+already hashed the file (the incremental loader) pass the digest in.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from .manifest import file_digest
+from .schema import TABLE_SCHEMAS, read_source_table, to_pandas
+
+CACHE_VERSION = 2
+
+
+class ColumnarCache:
+    """Arrow IPC copies of source CSV files, one file per source and table."""
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached ``.arrow`` files. Created
+                on first write.
+        """
+        self.cache_dir: Path = Path(cache_dir)
+
+    def entry_path(self, path: str | Path, table_name: str) -> Path:
+        """
+        Location of the cached copy of a CSV file.
+
+        Args:
+            path: Source CSV file.
+            table_name: RAW table name the file is parsed as.
+
+        Returns:
+            Path of the ``.arrow`` file, whether or not it exists.
+        """
+        path = Path(path)
+        key = hashlib.sha256(f"{path.resolve()}|{table_name.upper()}".encode()).hexdigest()
+        return self.cache_dir / f"{path.stem}-{key[:12]}.arrow"
+
+    def read_table(
+        self,
+        path: str | Path,
+        table_name: str,
+        columns: list[str] | None = None,
+        digest: str | None = None
+    ) -> pa.Table:
+        """
+        Read a source CSV as Arrow, from the cache when it is fresh.
+
+        Args:
+            path: Source CSV file.
+            table_name: RAW table name the file belongs to.
+            columns: Only return these columns. The cache always holds the
+                whole file.
+            digest: SHA-256 of the file, if the caller already computed it.
+
+        Returns:
+            Arrow table using the registry types. Cached reads are backed
+            by the memory-mapped file.
+        """
+        fingerprint = _fingerprint(path, table_name, digest)
+        entry = self.entry_path(path, table_name)
+        table = self._read_entry(entry, fingerprint)
+        if table is None:
+            # Chunks parsed in parallel carry their own dictionaries; an IPC
+            # file allows one dictionary per column
+            table = read_source_table(path, table_name).unify_dictionaries()
+            self._write_entry(entry, table, fingerprint)
+        return table.select(columns) if columns is not None else table
+
+    def lookup(
+        self,
+        path: str | Path,
+        table_name: str,
+        digest: str | None = None
+    ) -> pa.Table | None:
+        """
+        Cached copy of a source CSV, without parsing it on a miss.
+
+        Args:
+            path: Source CSV file.
+            table_name: RAW table name the file belongs to.
+            digest: SHA-256 of the file, if the caller already computed it.
+
+        Returns:
+            The memory-mapped table, or None if there is no fresh entry.
+        """
+        entry = self.entry_path(path, table_name)
+        if not entry.exists():
+            # Nothing to validate, so do not hash the file
+            return None
+        return self._read_entry(entry, _fingerprint(path, table_name, digest))
+
+    def read_csv(
+        self,
+        path: str | Path,
+        table_name: str,
+        columns: list[str] | None = None,
+        digest: str | None = None
+    ) -> pd.DataFrame:
+        """
+        Read a source CSV as a DataFrame, from the cache when it is fresh.
+
+        Args:
+            path: Source CSV file.
+            table_name: RAW table name the file belongs to.
+            columns: Only return these columns.
+            digest: SHA-256 of the file, if the caller already computed it.
+
+        Returns:
+            DataFrame using the registry dtypes.
+        """
+        return to_pandas(self.read_table(path, table_name, columns, digest))
+
+    def clear(self) -> None:
+        """Remove all cached files."""
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob('*.arrow'):
+                path.unlink(missing_ok=True)
+
+    def _read_entry(self, entry: Path, fingerprint: str) -> pa.Table | None:
+        """
+        Memory-map a cached file if it matches the source.
+
+        Args:
+            entry: Cached file.
+            fingerprint: Expected fingerprint of the source.
+
+        Returns:
+            The cached table, or None if it is missing, stale or unreadable.
+        """
+        if not entry.exists():
+            return None
+        try:
+            reader = ipc.open_file(pa.memory_map(str(entry)))
+            metadata = reader.schema.metadata or {}
+            if metadata.get(b'source_fingerprint', b'').decode() != fingerprint:
+                return None
+            table = reader.read_all()
+        except (OSError, pa.ArrowInvalid):
+            return None
+        return table.replace_schema_metadata(None)
+
+    def _write_entry(self, entry: Path, table: pa.Table, fingerprint: str) -> None:
+        """
+        Write a cached file atomically, so concurrent readers never see a partial one.
+
+        Args:
+            entry: Cached file to write.
+            table: Parsed source data.
+            fingerprint: Fingerprint of the source, stored in the file.
+        """
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        schema = table.schema.with_metadata({'source_fingerprint': fingerprint})
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, prefix='.cache-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # Uncompressed, so reads can map the buffers without copying
+                with ipc.new_file(f, schema) as writer:
+                    writer.write_table(table.replace_schema_metadata(schema.metadata))
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def _fingerprint(path: str | Path, table_name: str, digest: str | None = None) -> str:
+    """
+    Identify the content of a source file and the types it is parsed with.
+
+    Args:
+        path: Source CSV file.
+        table_name: RAW table name the file belongs to.
+        digest: SHA-256 of the file; computed if not given.
+
+    Returns:
+        String that changes when the file or its registered schema changes.
+    """
+    return json.dumps({
+        'version': CACHE_VERSION,
+        'sha256': digest or file_digest(path),
+        'schema': TABLE_SCHEMAS.get(table_name.upper()),
+    }, sort_keys=True)
@@ -3,15 +3,57 @@ Load Brazilian E-Commerce CSV files to Snowflake RAW layer
 """
 from __future__ import annotations
 
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, TypedDict
+from typing import Any, Iterator, TypedDict
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from ecommerce_analytics.data_loader.columnar_cache import ColumnarCache
+from ecommerce_analytics.data_loader.manifest import (
+    LoadManifest,
+    ManifestEntry,
+    file_digest,
+    row_hashes,
+    rows_digest,
+)
+from ecommerce_analytics.data_loader.preaggregate import PREAGGREGATIONS, compare_to_model
+from ecommerce_analytics.data_loader.run_report import (
+    PhaseTimer,
+    Regression,
+    RunReport,
+    build_run_report,
+    compare_runs,
+    latest_report,
+    load_report,
+    print_regressions,
+    save_report,
+)
+from ecommerce_analytics.data_loader.schema import (
+    arrow_column_types,
+    iter_source_csv,
+    read_source_csv,
+    read_source_table,
+    snowflake_columns,
+    stream_source_table,
+    to_pandas,
+)
+from ecommerce_analytics.data_loader.validation import (
+    ValidationReport,
+    print_validation,
+    validate_files,
+)
+from ecommerce_analytics.snowflake.bulk_load import BulkLoader, SnowflakeStageClient
+from ecommerce_analytics.snowflake.checkpoint import LoadCheckpoint
 from ecommerce_analytics.snowflake.connector import SnowflakeConnector
 
 
@@ -21,6 +63,14 @@ class LoadResult(TypedDict, total=False):
     reason: str
     rows: int
     columns: int
+    chunks: int
+    source_rows: int
+    timings: dict[str, float]
+    seconds: float
+    bytes_read: int
+    bytes_uploaded: int
+    bytes_in_memory: int
+    since: str
     error: str
 
 
@@ -40,31 +90,150 @@ class EcommerceDataLoader:
         'product_category_name_translation.csv': 'PRODUCT_CATEGORY_TRANSLATION'
     }
 
-    def __init__(self, data_dir: str = 'data/raw') -> None:
+    # Append-only tables and the column new rows are detected by
+    INCREMENTAL_COLUMNS: dict[str, str] = {
+        'ORDERS': 'order_purchase_timestamp',
+        'ORDER_ITEMS': 'shipping_limit_date',
+        'ORDER_REVIEWS': 'review_creation_date'
+    }
+
+    # Rows sampled to estimate the in-memory size of a CSV row
+    SAMPLE_ROWS: int = 1000
+    # A chunk is held as a DataFrame and, during upload, as a Parquet buffer
+    # alongside it; size chunks to a fraction of the budget to leave room.
+    CHUNK_MEMORY_FACTOR: int = 3
+    # Rows per checkpointed chunk when a whole file is read into memory
+    CHECKPOINT_CHUNK_ROWS: int = 500_000
+    # CSV bytes per block when scanning a file for incremental planning
+    SCAN_BLOCK_BYTES: int = 16 * 1024 * 1024
+
+    def __init__(
+        self,
+        data_dir: str = 'data/raw',
+        max_workers: int = 1,
+        memory_limit_mb: float | None = None,
+        use_stage: bool = False,
+        incremental: bool = False,
+        manifest_path: str | None = None,
+        preaggregate: bool = False,
+        report_dir: str | None = None,
+        validate: bool = False,
+        use_cache: bool = False
+    ) -> None:
         """
         Initialize the data loader.
 
         Args:
             data_dir: Path to directory containing CSV files.
+            max_workers: Number of tables loaded concurrently. Defaults to 1
+                (sequential).
+            memory_limit_mb: If set, stream each CSV in chunks sized so that
+                all workers together stay within this many MB of DataFrame
+                memory. If None, each file is read whole.
+            use_stage: If True, load through local Parquet files, a stage
+                and COPY INTO (see BulkLoader) instead of write_pandas.
+            incremental: If True, skip files unchanged since their last load
+                and append only rows past the stored watermark for the
+                INCREMENTAL_COLUMNS tables.
+            manifest_path: Load manifest location. Defaults to
+                load_manifest.json next to the data directory.
+            preaggregate: If True, tables listed in PREAGGREGATIONS (e.g.
+                GEOLOCATION) are aggregated locally the way their staging
+                model does and only the aggregate is loaded.
+            report_dir: Where JSON run reports are written and the previous
+                run is looked up for comparison. Defaults to load_reports/
+                next to the data directory.
+            validate: If True, check the CSV files (not-null columns, primary
+                keys, relationships) before loading and upload nothing if a
+                check fails.
+            use_cache: If True, whole-file reads go through a ColumnarCache in
+                cache/ next to the data directory: each CSV is parsed once
+                and later runs memory-map the cached Arrow file.
         """
         self.data_dir: Path = Path(data_dir)
         self.sf: SnowflakeConnector = SnowflakeConnector(use_key_auth=True)
         self.file_table_mapping: dict[str, str] = self.FILE_TABLE_MAPPING.copy()
+        self.max_workers: int = max_workers
+        self.memory_limit_mb: float | None = memory_limit_mb
+        self.use_stage: bool = use_stage
+        self.parquet_dir: Path = self.data_dir.parent / 'parquet'
+        self.incremental: bool = incremental
+        self.manifest_path: Path = (
+            Path(manifest_path) if manifest_path else self.data_dir.parent / 'load_manifest.json'
+        )
+        self.preaggregate: bool = preaggregate
+        self.checkpoint_dir: Path = self.data_dir.parent / 'load_checkpoints'
+        self.report_dir: Path = (
+            Path(report_dir) if report_dir else self.data_dir.parent / 'load_reports'
+        )
+        self.last_report: RunReport | None = None
+        self.validate: bool = validate
+        self.validation: ValidationReport | None = None
+        self.regressions: list[Regression] = []
+        self.cache: ColumnarCache | None = (
+            ColumnarCache(self.data_dir.parent / 'cache') if use_cache else None
+        )
+        self._warn_option_conflicts()
+
+    def _warn_option_conflicts(self) -> None:
+        """
+        Warn about load options that override each other.
 
-    def load_all_files(self, schema: str = 'RAW') -> dict[str, LoadResult]:
+        A full load takes one path per table: pre-aggregation first, then
+        the stage, then streaming within the memory limit.
+        """
+        if self.use_stage and self.memory_limit_mb:
+            print("⚠ LOADER_USE_STAGE is set, the memory limit only applies to delta loads")
+        if self.preaggregate and (self.use_stage or self.memory_limit_mb):
+            tables = ', '.join(PREAGGREGATIONS)
+            print(
+                f"⚠ LOADER_PREAGGREGATE is set, {tables} will be read whole and loaded "
+                f"with write_pandas, ignoring the stage and memory limit"
+            )
+
+    def load_all_files(
+        self,
+        schema: str = 'RAW',
+        max_workers: int | None = None
+    ) -> dict[str, LoadResult]:
         """
         Load all CSV files to Snowflake.
 
+        With more than one worker, tables are read and uploaded concurrently,
+        each on its own connection, largest files first so the biggest table
+        starts immediately and the small ones fill in around it.
+
         Args:
             schema: Target Snowflake schema. Defaults to 'RAW'.
+            max_workers: Overrides the instance worker count for this run.
+
+        The run's throughput is written as a JSON report to report_dir
+        (also kept in ``last_report``) and compared with the previous
+        report; regressions are printed and kept in ``regressions``.
 
         Returns:
-            Dictionary mapping table names to their load results.
+            Dictionary mapping table names to their load results, in
+            file_table_mapping order.
         """
+        max_workers = max_workers or self.max_workers
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+
         print(f"\nLoading Brazilian E-Commerce data to Snowflake...")
         print(f"Database: {self.sf.database}")
         print(f"Schema: {schema}")
-        print(f"Data directory: {self.data_dir.absolute()}\n")
+        print(f"Data directory: {self.data_dir.absolute()}")
+        print(f"Workers: {max_workers}")
+        print(f"Mode: {'incremental' if self.incremental else 'full reload'}")
+        if self.use_stage:
+            print(f"Load path: stage + COPY INTO via {self.parquet_dir}")
+        elif self.memory_limit_mb:
+            print(f"Memory limit: {self.memory_limit_mb:,} MB (streaming)")
+        if self.preaggregate:
+            print(f"Pre-aggregated: {', '.join(PREAGGREGATIONS)}")
+        if self.cache is not None:
+            print(f"Columnar cache: {self.cache.cache_dir}")
+        print()
 
         if not self.data_dir.exists():
             print(f"✗ Data directory does not exist: {self.data_dir.absolute()}")
@@ -72,45 +241,726 @@ class EcommerceDataLoader:
             return {}
 
         results: dict[str, LoadResult] = {}
+        pending: list[tuple[str, str]] = []
+        manifest = LoadManifest(self.manifest_path)
+        previous: dict[str, ManifestEntry | None] = {}
 
         for csv_file, table_name in self.file_table_mapping.items():
-            file_path = self.data_dir / csv_file
-
-            if not file_path.exists():
+            if not (self.data_dir / csv_file).exists():
                 print(f"⚠ File not found: {csv_file}")
                 results[table_name] = {'status': 'skipped', 'reason': 'file not found'}
                 continue
 
-            try:
-                print(f"Loading {csv_file} → {table_name}...")
+            key = self._manifest_key(schema, table_name)
+            entry = manifest.get(key)
+            # A table loaded in the other (pre-aggregated or full) form is reloaded
+            if entry is not None and (
+                entry.get('preaggregated', False) != self._preaggregates(table_name)
+            ):
+                entry = None
+            # Files are only hashed by the load workers; a stat call decides here
+            file_path = self.data_dir / csv_file
+            if self.incremental and entry and manifest.stat_unchanged(key, file_path):
+                print(f"✓ {table_name}: unchanged since {entry.get('loaded_at')}, skipped")
+                results[table_name] = {'status': 'unchanged', 'rows': entry['rows']}
+                continue
+            previous[table_name] = entry
+            pending.append((csv_file, table_name))
+
+        if self.validate and pending:
+            self.validation = validate_files(
+                self.data_dir, self.file_table_mapping, max_workers, cache=self.cache
+            )
+            print_validation(self.validation)
+            if self.validation['failures']:
+                print("✗ Source files failed validation, nothing was uploaded")
+                for _, table_name in pending:
+                    results[table_name] = {'status': 'invalid', 'reason': 'validation failed'}
+                pending = []
+            print()
+
+        # Split the memory budget across the tables loading at the same time
+        memory_budget: int | None = None
+        if self.memory_limit_mb:
+            concurrent = max(1, min(max_workers, len(pending)))
+            memory_budget = int(self.memory_limit_mb * 1024 * 1024 / concurrent)
+
+        entries: dict[str, ManifestEntry | None] = {}
+        if max_workers > 1 and len(pending) > 1:
+            pending.sort(key=lambda item: (self.data_dir / item[0]).stat().st_size, reverse=True)
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='table-load'
+            ) as executor:
+                futures = {
+                    table_name: executor.submit(
+                        self._timed_load, csv_file, table_name, schema, memory_budget,
+                        previous[table_name]
+                    )
+                    for csv_file, table_name in pending
+                }
+            for table_name, future in futures.items():
+                results[table_name], entries[table_name] = future.result()
+        else:
+            for csv_file, table_name in pending:
+                results[table_name], entries[table_name] = self._timed_load(
+                    csv_file, table_name, schema, memory_budget, previous[table_name]
+                )
+
+        # Record successful loads so the next incremental run can skip them
+        for table_name, entry in entries.items():
+            result = results[table_name]
+            if result['status'] != 'success':
+                continue
+            key = self._manifest_key(schema, table_name)
+            if entry is None:
+                # A full load without a fingerprint: forget the old one, so an
+                # incremental run cannot append rows this load already has
+                manifest.discard(key)
+                continue
+            entry.setdefault('rows', result['rows'])
+            manifest.update(key, entry)
+        manifest.save()
+
+        results = {
+            table_name: results[table_name]
+            for table_name in self.file_table_mapping.values()
+            if table_name in results
+        }
+
+        # Print summary
+        self._print_summary(results)
+        self._write_report(results, schema, started_at, time.perf_counter() - started, {
+            'max_workers': max_workers,
+            'memory_limit_mb': self.memory_limit_mb,
+            'use_stage': self.use_stage,
+            'incremental': self.incremental,
+            'preaggregate': self.preaggregate,
+            'validate': self.validate,
+            'cache': self.cache is not None,
+        })
+
+        return results
+
+    def _write_report(
+        self,
+        results: dict[str, LoadResult],
+        schema: str,
+        started_at: datetime,
+        seconds: float,
+        settings: dict[str, Any]
+    ) -> None:
+        """
+        Save the run report and compare it with the previous comparable run.
+
+        Args:
+            results: Load results of this run.
+            schema: Target Snowflake schema.
+            started_at: When the run started.
+            seconds: Wall time of the run.
+            settings: Loader settings recorded with the report.
+        """
+        report = build_run_report(
+            results, started_at, seconds, self.sf.database, schema, settings
+        )
+        path = save_report(report, self.report_dir)
+        print(f"Run report: {path}")
+        self.last_report = report
+
+        previous = latest_report(self.report_dir, exclude=path, settings=settings)
+        self.regressions = compare_runs(load_report(previous), report) if previous else []
+        if previous:
+            print_regressions(self.regressions, previous.name)
+
+    def _timed_load(
+        self,
+        csv_file: str,
+        table_name: str,
+        schema: str,
+        memory_budget: int | None = None,
+        previous: ManifestEntry | None = None
+    ) -> tuple[LoadResult, ManifestEntry | None]:
+        """
+        Plan and load one CSV file and record its wall time and bytes read.
+
+        Runs on a load worker, so incremental planning (hashing the file and
+        scanning its watermark) runs in parallel across tables. Peak memory
+        is process-wide, so it is reported once per run (see
+        build_run_report) rather than per table.
 
-                # Read CSV
-                df: pd.DataFrame = pd.read_csv(file_path)
-                print(f"  Rows: {len(df):,} | Columns: {len(df.columns)}")
+        Args:
+            csv_file: CSV file name inside the data directory.
+            table_name: Target Snowflake table name.
+            schema: Target Snowflake schema.
+            memory_budget: Passed to _load_file.
+            previous: Manifest entry of the last load of the same form, used
+                by incremental runs.
+
+        Returns:
+            Tuple of (load result of _load_file with the measurements added,
+            manifest entry to record on success or None outside incremental
+            runs).
+        """
+        started = time.perf_counter()
+        file_path = self.data_dir / csv_file
+        entry: ManifestEntry | None = None
+        since: str | None = None
+        if self.incremental:
+            plan = self._plan_file(csv_file, table_name, previous, memory_budget)
+            if plan is None:
+                print(f"✓ {table_name}: same content as the last load, skipped")
+                return {'status': 'unchanged', 'rows': previous['rows']}, None
+            entry, since = plan
+            digest = entry['sha256']
+        else:
+            # Outside incremental runs files are not hashed; size and mtime
+            # identify a file for checkpoints
+            stat = file_path.stat()
+            digest = f"{stat.st_size}-{stat.st_mtime_ns}"
+
+        result = self._load_file(csv_file, table_name, schema, memory_budget, since, digest)
+        result['seconds'] = round(time.perf_counter() - started, 4)
+        result['bytes_read'] = file_path.stat().st_size
+        return result, entry
+
+    def _load_file(
+        self,
+        csv_file: str,
+        table_name: str,
+        schema: str,
+        memory_budget: int | None = None,
+        since: str | None = None,
+        digest: str | None = None
+    ) -> LoadResult:
+        """
+        Read one CSV file and load it to Snowflake.
+
+        Full loads are staged and swapped into place by the connector. With
+        a file digest they are also checkpointed per chunk, so a failed
+        load of the same file resumes instead of starting over. Only one
+        path is taken: pre-aggregation, then the stage, then streaming
+        within the memory budget (see _warn_option_conflicts).
+
+        Args:
+            csv_file: CSV file name inside the data directory.
+            table_name: Target Snowflake table name.
+            schema: Target Snowflake schema.
+            memory_budget: Bytes available to this table. If set, the file
+                is streamed in chunks instead of read whole.
+            since: If set, only rows whose incremental column is past this
+                watermark are appended.
+            digest: Identifies the file for checkpoints: its SHA-256 in
+                incremental runs, which the columnar cache also reuses, or
+                its size and mtime otherwise.
 
-                # Load to Snowflake
+        Returns:
+            The load result for the table. Errors are captured, not raised.
+        """
+        try:
+            sha256 = digest if self.incremental else None
+            if since is not None:
+                print(f"Loading {csv_file} → {table_name} (rows after {since})...")
+                return self._load_delta(
+                    csv_file, table_name, schema, since, memory_budget, sha256
+                )
+
+            print(f"Loading {csv_file} → {table_name}...")
+
+            if self._preaggregates(table_name):
+                return self._preaggregate_file(csv_file, table_name, schema)
+            if self.use_stage:
+                return self._bulk_load_file(csv_file, table_name, schema)
+            if memory_budget is not None:
+                return self._stream_file(csv_file, table_name, schema, memory_budget, digest)
+
+            checkpoint = None
+            if digest is not None:
+                checkpoint = self._checkpoint(
+                    schema, table_name, f"{digest}:full", self.CHECKPOINT_CHUNK_ROWS
+                )
+
+            # Read CSV
+            timer = PhaseTimer()
+            with timer.phase('parse'):
+                table = self._read_table(self.data_dir / csv_file, table_name, digest=sha256)
+            with timer.phase('convert'):
+                df: pd.DataFrame = to_pandas(table)
+                del table
+            print(f"  {table_name} rows: {len(df):,} | Columns: {len(df.columns)}")
+
+            # Load to Snowflake
+            upload: dict[str, Any] = {}
+            with timer.phase('upload'):
                 success: bool = self.sf.load_csv_to_snowflake(
                     df=df,
                     table_name=table_name,
                     schema=schema,
-                    if_exists='replace'
+                    if_exists='replace',
+                    columns=snowflake_columns(table_name),
+                    checkpoint=checkpoint,
+                    stats=upload
                 )
 
-                results[table_name] = {
-                    'status': 'success' if success else 'failed',
-                    'rows': len(df),
-                    'columns': len(df.columns)
-                }
+            return {
+                'status': 'success' if success else 'failed',
+                'rows': len(df),
+                'columns': len(df.columns),
+                'bytes_in_memory': int(df.memory_usage(index=False, deep=True).sum()),
+                **upload,
+                'timings': timer.phases
+            }
+
+        except Exception as e:
+            print(f"✗ Error loading {csv_file}: {e}")
+            return {'status': 'error', 'error': str(e)}
+
+    def _read_table(
+        self,
+        file_path: Path,
+        table_name: str,
+        columns: list[str] | None = None,
+        digest: str | None = None
+    ) -> pa.Table:
+        """Parse a whole CSV file into Arrow, through the cache if enabled."""
+        if self.cache is not None:
+            return self.cache.read_table(file_path, table_name, columns, digest)
+        return read_source_table(file_path, table_name, columns)
+
+    def _read_csv(
+        self,
+        file_path: Path,
+        table_name: str,
+        columns: list[str] | None = None,
+        digest: str | None = None
+    ) -> pd.DataFrame:
+        """Read a whole CSV file into pandas, through the cache if enabled."""
+        if self.cache is not None:
+            return self.cache.read_csv(file_path, table_name, columns, digest)
+        return read_source_csv(file_path, table_name, columns)
+
+    def _checkpoint(
+        self,
+        schema: str,
+        table_name: str,
+        source: str,
+        chunk_rows: int
+    ) -> LoadCheckpoint:
+        """
+        Open the checkpoint of a full table load.
 
-            except Exception as e:
-                print(f"✗ Error loading {csv_file}: {e}")
-                results[table_name] = {'status': 'error', 'error': str(e)}
+        Args:
+            schema: Target Snowflake schema.
+            table_name: Target Snowflake table name.
+            source: File digest and read mode; a checkpoint only resumes a
+                load with the same source.
+            chunk_rows: Rows per chunk if the load starts from scratch.
 
-        # Print summary
-        self._print_summary(results)
+        Returns:
+            The checkpoint, resuming an earlier load of the same file if any.
+        """
+        key = self._manifest_key(schema, table_name)
+        return LoadCheckpoint(self.checkpoint_dir / f"{key}.json", source, chunk_rows)
+
+    def _manifest_key(self, schema: str, table_name: str) -> str:
+        """
+        Manifest key of a target table.
 
+        Args:
+            schema: Target Snowflake schema.
+            table_name: Target Snowflake table name.
+
+        Returns:
+            Fully qualified table name.
+        """
+        return f"{self.sf.database}.{schema}.{table_name}".upper()
+
+    def _plan_file(
+        self,
+        csv_file: str,
+        table_name: str,
+        previous: ManifestEntry | None,
+        memory_budget: int | None = None
+    ) -> tuple[ManifestEntry, str | None] | None:
+        """
+        Fingerprint a changed file and decide between a full and a delta load.
+
+        A delta load is only used when the rows at or before the stored
+        watermark have the same count and content hash as the rows loaded
+        last time, i.e. the file only grew by rows past the watermark.
+        Anything else, including manifests without a content hash, falls
+        back to a full reload.
+
+        Args:
+            csv_file: CSV file name inside the data directory.
+            table_name: Target Snowflake table name.
+            previous: Manifest entry of the last load, if any.
+            memory_budget: Bytes available to this table; bounds the blocks
+                the watermark scan reads.
+
+        Returns:
+            Tuple of (manifest entry to record on success, watermark to load
+            rows after or None for a full load), or None if the file has the
+            same SHA-256 as the last load.
+        """
+        file_path = self.data_dir / csv_file
+        stat = file_path.stat()
+        digest = file_digest(file_path)
+        if previous is not None and previous.get('sha256') == digest:
+            return None
+        entry: ManifestEntry = {
+            'sha256': digest,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'watermark': None
+        }
+        if self._preaggregates(table_name):
+            entry['preaggregated'] = True
+
+        column = self.INCREMENTAL_COLUMNS.get(table_name)
+        if column is None:
+            return entry, None
+
+        try:
+            values, hashes = self._scan_rows(file_path, table_name, column, memory_budget)
+        except (KeyError, ValueError) as e:
+            print(f"⚠ {table_name}: cannot read watermark column {column} ({e})")
+            return entry, None
+
+        entry['rows'] = len(values)
+        if values.notna().any():
+            entry['watermark'] = values.max().isoformat()
+            entry['rows_digest'] = rows_digest(hashes[(values <= values.max()).to_numpy()])
+
+        if not previous or not previous.get('watermark'):
+            return entry, None
+
+        watermark = pd.Timestamp(previous['watermark'])
+        loaded = (values <= watermark).to_numpy()
+        old = int(loaded.sum())
+        new = int((values > watermark).sum())
+        if (
+            old != previous['rows']
+            or old + new != len(values)
+            or new == 0
+            or rows_digest(hashes[loaded]) != previous.get('rows_digest')
+        ):
+            print(f"⚠ {table_name}: rows changed before watermark, full reload")
+            return entry, None
+        return entry, previous['watermark']
+
+    def _scan_rows(
+        self,
+        file_path: Path,
+        table_name: str,
+        column: str,
+        memory_budget: int | None = None
+    ) -> tuple[pd.Series, np.ndarray]:
+        """
+        Stream a CSV file once for its watermark column and row hashes.
+
+        Only one block of the file is held as a DataFrame at a time, so the
+        scan stays within the memory limit of streamed loads.
+
+        Args:
+            file_path: CSV file to scan.
+            table_name: RAW table name the file belongs to.
+            column: Incremental column.
+            memory_budget: Bytes available to this table, if limited.
+
+        Returns:
+            Tuple of (watermark column as timestamps, one hash per row).
+        """
+        block_size = self.SCAN_BLOCK_BYTES
+        if memory_budget is not None:
+            block_size = max(
+                1024 * 1024, min(block_size, memory_budget // self.CHUNK_MEMORY_FACTOR)
+            )
+        values: list[pd.Series] = []
+        hashes: list[np.ndarray] = []
+        for batch in stream_source_table(file_path, table_name, block_size):
+            df = to_pandas(batch)
+            values.append(pd.to_datetime(df[column]))
+            hashes.append(row_hashes(df))
+        if not values:
+            return pd.Series([], dtype='datetime64[ns]'), np.array([], dtype=np.uint64)
+        return pd.concat(values, ignore_index=True), np.concatenate(hashes)
+
+    def _load_delta(
+        self,
+        csv_file: str,
+        table_name: str,
+        schema: str,
+        since: str,
+        memory_budget: int | None = None,
+        digest: str | None = None
+    ) -> LoadResult:
+        """
+        Append the rows of a CSV file past a watermark.
+
+        Args:
+            csv_file: CSV file name inside the data directory.
+            table_name: Target Snowflake table name.
+            schema: Target Snowflake schema.
+            since: Watermark; rows with a later incremental column are loaded.
+            memory_budget: Bytes available to this table. If set, the file
+                is filtered chunk by chunk instead of read whole.
+            digest: SHA-256 of the file, passed on to the columnar cache.
+
+        Returns:
+            The load result for the appended rows.
+        """
+        file_path = self.data_dir / csv_file
+        column = self.INCREMENTAL_COLUMNS[table_name]
+        watermark = pd.Timestamp(since)
+        stats = {'columns': 0, 'chunks': 0, 'bytes': 0}
+        timer = PhaseTimer()
+
+        def read() -> Iterator[pd.DataFrame]:
+            if memory_budget is not None:
+                reader = iter_source_csv(
+                    file_path, table_name, self._chunk_rows(file_path, memory_budget)
+                )
+            else:
+                reader = iter([self._read_csv(file_path, table_name, digest=digest)])
+            for df in reader:
+                stats['columns'] = len(df.columns)
+                new_rows = df[pd.to_datetime(df[column]) > watermark]
+                if len(new_rows):
+                    yield new_rows
+
+        def chunks() -> Iterator[pd.DataFrame]:
+            for df in timer.iterate(read(), 'parse'):
+                stats['chunks'] += 1
+                stats['bytes'] += int(df.memory_usage(index=False, deep=True).sum())
+                yield df
+
+        upload: dict[str, Any] = {}
+        with timer.phase('upload'):
+            success, rows = self.sf.load_chunks_to_snowflake(
+                chunks=chunks(),
+                table_name=table_name,
+                schema=schema,
+                if_exists='append',
+                columns=snowflake_columns(table_name),
+                stats=upload
+            )
+        # Reading happens while the upload pulls chunks
+        timer.phases['upload'] -= timer.phases.get('parse', 0.0)
+        print(f"  {table_name} new rows: {rows:,}")
+
+        return {
+            'status': 'success' if success else 'failed',
+            'rows': rows,
+            'columns': stats['columns'],
+            'chunks': stats['chunks'],
+            'since': since,
+            'bytes_in_memory': stats['bytes'],
+            **upload,
+            'timings': timer.phases
+        }
+
+    def _preaggregates(self, table_name: str) -> bool:
+        """Whether a table is loaded in pre-aggregated form."""
+        return self.preaggregate and table_name in PREAGGREGATIONS
+
+    def _preaggregate_file(self, csv_file: str, table_name: str, schema: str) -> LoadResult:
+        """
+        Aggregate one CSV file locally and load only the aggregate.
+
+        Args:
+            csv_file: CSV file name inside the data directory.
+            table_name: Target Snowflake table name, a PREAGGREGATIONS key.
+            schema: Target Snowflake schema.
+
+        Returns:
+            The load result, with the source row count in ``source_rows``.
+        """
+        timer = PhaseTimer()
+        with timer.phase('parse'):
+            table = self._read_table(self.data_dir / csv_file, table_name)
+        with timer.phase('convert'):
+            df = to_pandas(table)
+            del table
+        with timer.phase('aggregate'):
+            aggregated = PREAGGREGATIONS[table_name]['aggregate'](df)
+        print(
+            f"  {table_name} rows: {len(df):,} → {len(aggregated):,} pre-aggregated "
+            f"({len(df) / max(len(aggregated), 1):,.0f}x fewer)"
+        )
+
+        upload: dict[str, Any] = {}
+        with timer.phase('upload'):
+            success = self.sf.load_csv_to_snowflake(
+                df=aggregated,
+                table_name=table_name,
+                schema=schema,
+                if_exists='replace',
+                columns=snowflake_columns(table_name),
+                stats=upload
+            )
+
+        return {
+            'status': 'success' if success else 'failed',
+            'rows': len(aggregated),
+            'columns': len(aggregated.columns),
+            'source_rows': len(df),
+            'bytes_in_memory': int(aggregated.memory_usage(index=False, deep=True).sum()),
+            **upload,
+            'timings': timer.phases
+        }
+
+    def check_preaggregations(self, schema: str = 'STAGING') -> dict[str, list[str]]:
+        """
+        Check local pre-aggregation against the dbt staging models.
+
+        Each pre-aggregatable CSV is aggregated locally and compared with the
+        rows of its staging model (e.g. STG_GEOLOCATION), which should have
+        been built from a full, not pre-aggregated, RAW table.
+
+        Args:
+            schema: Schema holding the staging models.
+
+        Returns:
+            Dictionary mapping table names to the differences found; an
+            empty list means the table is equivalent.
+        """
+        results: dict[str, list[str]] = {}
+        for csv_file, table_name in self.file_table_mapping.items():
+            spec = PREAGGREGATIONS.get(table_name)
+            if spec is None or not (self.data_dir / csv_file).exists():
+                continue
+
+            expected = spec['model'](spec['aggregate'](
+                self._read_csv(self.data_dir / csv_file, table_name)
+            ))
+            columns = list(expected.columns)
+            rows = self.sf.execute_query(
+                f"select {', '.join(columns)} from {self.sf.database}.{schema}.{spec['model_name']}"
+            ) or []
+            actual = pd.DataFrame(rows, columns=columns)
+
+            results[table_name] = compare_to_model(expected, actual, spec['key'])
+            if results[table_name]:
+                print(f"✗ {table_name} differs from {spec['model_name']}:")
+                for problem in results[table_name]:
+                    print(f"   {problem}")
+            else:
+                print(f"✓ {table_name} pre-aggregation matches {spec['model_name']} "
+                      f"({len(expected):,} rows)")
         return results
 
+    def _bulk_load_file(self, csv_file: str, table_name: str, schema: str) -> LoadResult:
+        """
+        Load one CSV file through local Parquet files, a stage and COPY INTO.
+
+        Args:
+            csv_file: CSV file name inside the data directory.
+            table_name: Target Snowflake table name.
+            schema: Target Snowflake schema.
+
+        Returns:
+            The load result for the table, with per-phase timings.
+        """
+        with self.sf.connection(schema=schema) as conn:
+            loader = BulkLoader(SnowflakeStageClient(conn), work_dir=self.parquet_dir)
+            result = loader.load_csv(
+                self.data_dir / csv_file,
+                table_name,
+                column_types=arrow_column_types(table_name),
+                columns=snowflake_columns(table_name)
+            )
+
+        return {
+            'status': 'success',
+            'rows': result['rows'],
+            'columns': result['columns'],
+            'bytes_uploaded': result['uploaded_bytes'],
+            'timings': dict(result['timings'])
+        }
+
+    def _stream_file(
+        self,
+        csv_file: str,
+        table_name: str,
+        schema: str,
+        memory_budget: int,
+        digest: str | None = None
+    ) -> LoadResult:
+        """
+        Stream one CSV file to Snowflake in chunks that fit the memory budget.
+
+        Args:
+            csv_file: CSV file name inside the data directory.
+            table_name: Target Snowflake table name.
+            schema: Target Snowflake schema.
+            memory_budget: Bytes available to this table.
+            digest: SHA-256 of the file. If set, the load is checkpointed
+                and a resumed load keeps the chunk size it started with.
+
+        Returns:
+            The load result for the table.
+        """
+        file_path = self.data_dir / csv_file
+        chunk_rows = self._chunk_rows(file_path, memory_budget)
+        checkpoint = None
+        if digest is not None:
+            checkpoint = self._checkpoint(schema, table_name, f"{digest}:stream", chunk_rows)
+            chunk_rows = checkpoint.chunk_rows
+        stats = {'columns': 0, 'chunks': 0, 'bytes': 0}
+        timer = PhaseTimer()
+
+        def chunks() -> Iterator[pd.DataFrame]:
+            reader = iter_source_csv(file_path, table_name, chunk_rows)
+            for df in timer.iterate(reader, 'parse'):
+                stats['columns'] = len(df.columns)
+                stats['chunks'] += 1
+                stats['bytes'] += int(df.memory_usage(index=False, deep=True).sum())
+                yield df
+
+        print(f"  {table_name} streaming in chunks of {chunk_rows:,} rows")
+        upload: dict[str, Any] = {}
+        with timer.phase('upload'):
+            success, rows = self.sf.load_chunks_to_snowflake(
+                chunks=chunks(),
+                table_name=table_name,
+                schema=schema,
+                if_exists='replace',
+                columns=snowflake_columns(table_name),
+                checkpoint=checkpoint,
+                stats=upload
+            )
+        # Parsing happens while the upload pulls chunks
+        timer.phases['upload'] -= timer.phases.get('parse', 0.0)
+        print(f"  {table_name} rows: {rows:,} | Chunks: {stats['chunks']}")
+
+        return {
+            'status': 'success' if success else 'failed',
+            'rows': rows,
+            'columns': stats['columns'],
+            'chunks': stats['chunks'],
+            'bytes_in_memory': stats['bytes'],
+            **upload,
+            'timings': timer.phases
+        }
+
+    def _chunk_rows(self, file_path: Path, memory_budget: int) -> int:
+        """
+        Estimate how many CSV rows fit in a memory budget.
+
+        Args:
+            file_path: CSV file to sample.
+            memory_budget: Bytes available to one chunk and its upload.
+
+        Returns:
+            Rows per chunk, at least 1.
+        """
+        # Sized by the raw strings the parser holds before converting them to
+        # the registry dtypes; the converted chunk is much smaller.
+        sample = pd.read_csv(file_path, nrows=self.SAMPLE_ROWS, dtype=object)
+        if sample.empty:
+            return self.SAMPLE_ROWS
+        row_bytes = sample.memory_usage(index=False, deep=True).sum() / len(sample)
+        return max(1, int(memory_budget / (row_bytes * self.CHUNK_MEMORY_FACTOR)))
+
     def _print_summary(self, results: dict[str, LoadResult]) -> None:
         """
         Print a summary of load results.
@@ -123,10 +973,25 @@ class EcommerceDataLoader:
         print("=" * 70)
         for table, info in results.items():
             status = info['status']
-            symbol = '✓' if status == 'success' else '✗'
+            symbol = '✓' if status in ('success', 'unchanged') else '✗'
             print(f"{symbol} {table}: {status}")
             if 'rows' in info:
-                print(f"   {info['rows']:,} rows loaded")
+                if status == 'unchanged':
+                    print(f"   {info['rows']:,} rows, not reloaded")
+                elif 'since' in info:
+                    print(f"   {info['rows']:,} new rows appended after {info['since']}")
+                elif 'source_rows' in info:
+                    print(f"   {info['rows']:,} rows loaded "
+                          f"(pre-aggregated from {info['source_rows']:,})")
+                else:
+                    print(f"   {info['rows']:,} rows loaded")
+            if info.get('seconds') and status == 'success':
+                phases = ', '.join(
+                    f"{name} {seconds:.1f}s" for name, seconds in info.get('timings', {}).items()
+                )
+                rate = info.get('rows', 0) / info['seconds']
+                print(f"   {info['seconds']:.1f}s, {rate:,.0f} rows/s"
+                      + (f" ({phases})" if phases else ''))
         print("=" * 70)
 
 
@@ -139,7 +1004,16 @@ def main() -> None:
         return
 
     # Load data
-    loader = EcommerceDataLoader(data_dir='data/raw')
+    loader = EcommerceDataLoader(
+        data_dir='data/raw',
+        max_workers=int(os.getenv('LOADER_MAX_WORKERS', '4')),
+        memory_limit_mb=float(os.getenv('LOADER_MEMORY_LIMIT_MB') or 0) or None,
+        use_stage=os.getenv('LOADER_USE_STAGE', 'false').lower() == 'true',
+        incremental=os.getenv('LOADER_INCREMENTAL', 'false').lower() == 'true',
+        preaggregate=os.getenv('LOADER_PREAGGREGATE', 'false').lower() == 'true',
+        validate=os.getenv('LOADER_VALIDATE', 'false').lower() == 'true',
+        use_cache=os.getenv('LOADER_CACHE', 'true').lower() == 'true'
+    )
     loader.load_all_files(schema='RAW')
 
 
@@ -0,0 +1,173 @@
+"""
+Persisted manifest of RAW loads, used to skip unchanged files and load deltas
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypedDict
+
+import numpy as np
+import pandas as pd
+
+MANIFEST_VERSION = 1
+
+
+class ManifestEntry(TypedDict, total=False):
+    """What was last loaded from one CSV file into one table."""
+    sha256: str
+    size: int
+    mtime: float
+    rows: int
+    rows_digest: str
+    watermark: str | None
+    preaggregated: bool
+    loaded_at: str
+
+
+def file_digest(path: str | Path) -> str:
+    """
+    Compute the SHA-256 of a file without reading it into memory.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex digest of the file contents.
+    """
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    Hash each row of a DataFrame.
+
+    Args:
+        df: Rows to hash; chunks of one file hash like the whole file.
+
+    Returns:
+        One uint64 hash per row.
+    """
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def rows_digest(hashes: np.ndarray) -> str:
+    """
+    Combine row hashes into a SHA-256 independent of row order.
+
+    Args:
+        hashes: Output of row_hashes, possibly concatenated over chunks.
+
+    Returns:
+        Hex digest of the sorted row hashes.
+    """
+    return hashlib.sha256(np.sort(hashes).tobytes()).hexdigest()
+
+
+class LoadManifest:
+    """JSON manifest keyed by target table (``DATABASE.SCHEMA.TABLE``)."""
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Load the manifest, starting empty if the file does not exist.
+
+        Args:
+            path: Location of the manifest JSON file.
+        """
+        self.path: Path = Path(path)
+        self.entries: dict[str, ManifestEntry] = {}
+
+        if self.path.exists():
+            with open(self.path) as f:
+                data: dict[str, Any] = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('entries', {})
+
+    def get(self, key: str) -> ManifestEntry | None:
+        """
+        Get the entry for a table.
+
+        Args:
+            key: Target table key.
+
+        Returns:
+            The manifest entry, or None if the table was never loaded.
+        """
+        return self.entries.get(key)
+
+    def update(self, key: str, entry: ManifestEntry) -> None:
+        """
+        Record a successful load.
+
+        Args:
+            key: Target table key.
+            entry: Fingerprint, row count and watermark of the loaded file.
+        """
+        self.entries[key] = {**entry, 'loaded_at': datetime.now(timezone.utc).isoformat()}
+
+    def discard(self, key: str) -> None:
+        """
+        Forget what was loaded into a table.
+
+        Args:
+            key: Target table key.
+        """
+        self.entries.pop(key, None)
+
+    def stat_unchanged(self, key: str, path: str | Path) -> bool:
+        """
+        Check whether a file has the size and mtime last loaded into a table.
+
+        Args:
+            key: Target table key.
+            path: CSV file to check.
+
+        Returns:
+            True if the stat matches; False means the file must be hashed.
+        """
+        entry = self.get(key)
+        stat = os.stat(path)
+        return bool(
+            entry and entry.get('size') == stat.st_size and entry.get('mtime') == stat.st_mtime
+        )
+
+    def is_unchanged(self, key: str, path: str | Path) -> tuple[bool, str | None]:
+        """
+        Check whether a file matches what was last loaded into a table.
+
+        Size and mtime are compared first; the file is only hashed when they
+        differ, so an untouched file costs a stat call.
+
+        Args:
+            key: Target table key.
+            path: CSV file to check.
+
+        Returns:
+            Tuple of (unchanged, sha256). The digest is None when the stat
+            shortcut was enough to decide.
+        """
+        if self.stat_unchanged(key, path):
+            return True, None
+        entry = self.get(key)
+        digest = file_digest(path)
+        return entry is not None and entry.get('sha256') == digest, digest
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix='.manifest-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'version': MANIFEST_VERSION, 'entries': self.entries}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
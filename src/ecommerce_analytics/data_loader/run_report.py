@@ -0,0 +1,335 @@
+"""
+Throughput instrumentation and JSON run reports for the RAW loader.
+
+Each load records per-phase wall time (parse, convert, upload, ...) and
+bytes read and uploaded per table. A run report collects them, with the
+peak memory of the whole run, into a JSON file that can be compared
+against a previous run with the same load mode to flag regressions.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Generator, Iterable, Iterator, TypedDict, TypeVar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT_VERSION = 1
+
+# Settings that change what a run does, not just how fast: an incremental or
+# staged run is only comparable with a run made the same way
+COMPARABLE_SETTINGS = (
+    'incremental', 'use_stage', 'preaggregate', 'validate', 'cache', 'memory_limit_mb'
+)
+
+T = TypeVar('T')
+
+
+class TableReport(TypedDict, total=False):
+    """Throughput of one table load."""
+    status: str
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    bytes_read: int
+    bytes_uploaded: int
+    bytes_in_memory: int
+    phases: dict[str, float]
+
+
+class RunReport(TypedDict):
+    """Machine-readable record of one loader run."""
+    version: int
+    started_at: str
+    seconds: float
+    database: str
+    schema: str
+    settings: dict[str, Any]
+    peak_rss_mb: float | None
+    tables: dict[str, TableReport]
+
+
+class Regression(TypedDict):
+    """A metric that got worse between two runs."""
+    table: str
+    metric: str
+    previous: float
+    current: float
+    change: float
+
+
+def peak_rss_mb() -> float | None:
+    """
+    Peak resident memory of this process so far.
+
+    Returns:
+        Peak RSS in MB, or None where the platform does not report it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+class PhaseTimer:
+    """Accumulate wall time per named phase."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """
+        Time a block and add it to a phase.
+
+        Args:
+            name: Phase name, e.g. 'parse' or 'upload'.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add seconds to a phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def iterate(self, items: Iterable[T], name: str) -> Iterator[T]:
+        """
+        Iterate, timing only the time spent producing each item.
+
+        Used for chunk readers consumed by the upload, so the reading can
+        be told apart from the upload it is interleaved with.
+
+        Args:
+            items: Iterable to time, e.g. a chunked CSV reader.
+            name: Phase the production time is added to.
+
+        Yields:
+            The items of ``items``.
+        """
+        iterator = iter(items)
+        done = object()
+        while True:
+            with self.phase(name):
+                item = next(iterator, done)
+            if item is done:
+                return
+            yield item
+
+
+def table_report(result: dict[str, Any]) -> TableReport:
+    """
+    Build the report entry of one table from its load result.
+
+    Args:
+        result: LoadResult of the table.
+
+    Returns:
+        The table's throughput metrics.
+    """
+    report: TableReport = {'status': result['status']}
+    for key in ('rows', 'seconds', 'bytes_read', 'bytes_uploaded', 'bytes_in_memory'):
+        if result.get(key) is not None:
+            report[key] = result[key]
+    if 'timings' in result:
+        report['phases'] = {name: round(seconds, 4) for name, seconds in result['timings'].items()}
+    if result.get('seconds') and 'rows' in result and result['status'] == 'success':
+        report['rows_per_sec'] = round(result['rows'] / result['seconds'], 1)
+    return report
+
+
+def build_run_report(
+    results: dict[str, dict[str, Any]],
+    started_at: datetime,
+    seconds: float,
+    database: str,
+    schema: str,
+    settings: dict[str, Any]
+) -> RunReport:
+    """
+    Collect the load results of a run into a report.
+
+    Args:
+        results: LoadResult per table.
+        started_at: When the run started.
+        seconds: Wall time of the whole run.
+        database: Target database.
+        schema: Target schema.
+        settings: Loader settings that affect throughput (workers, mode...).
+
+    Returns:
+        The run report.
+    """
+    return {
+        'version': REPORT_VERSION,
+        'started_at': started_at.isoformat(),
+        'seconds': round(seconds, 3),
+        'database': database,
+        'schema': schema,
+        'settings': settings,
+        'peak_rss_mb': peak_rss_mb(),
+        'tables': {table: table_report(result) for table, result in results.items()},
+    }
+
+
+def save_report(report: RunReport, report_dir: str | Path) -> Path:
+    """
+    Write a run report as ``run-<UTC timestamp>.json``.
+
+    Args:
+        report: Report to write.
+        report_dir: Directory holding the run reports.
+
+    Returns:
+        Path of the written file.
+    """
+    report_dir = Path(report_dir)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.fromisoformat(report['started_at']).astimezone(timezone.utc)
+    path = report_dir / f"run-{stamp.strftime('%Y%m%dT%H%M%S%fZ')}.json"
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+    return path
+
+
+def load_report(path: str | Path) -> RunReport:
+    """Read a run report."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def latest_report(
+    report_dir: str | Path,
+    exclude: Path | None = None,
+    settings: dict[str, Any] | None = None
+) -> Path | None:
+    """
+    Most recent run report in a directory.
+
+    Args:
+        report_dir: Directory holding the run reports.
+        exclude: Report to ignore, e.g. the one just written.
+        settings: If given, only consider reports whose COMPARABLE_SETTINGS
+            match these: a full reload is expected to be slower than an
+            incremental run.
+
+    Returns:
+        Path of the newest matching report, or None if there is none.
+    """
+    report_dir = Path(report_dir)
+    if not report_dir.exists():
+        return None
+    reports = sorted(path for path in report_dir.glob('run-*.json') if path != exclude)
+    for path in reversed(reports):
+        if settings is None:
+            return path
+        recorded = load_report(path).get('settings', {})
+        if all(recorded.get(key) == settings.get(key) for key in COMPARABLE_SETTINGS):
+            return path
+    return None
+
+
+def compare_runs(
+    previous: RunReport,
+    current: RunReport,
+    threshold: float = 0.25,
+    min_seconds: float = 1.0
+) -> list[Regression]:
+    """
+    Flag metrics that got worse by more than a threshold.
+
+    Only tables loaded successfully in both runs are compared. Durations
+    shorter than ``min_seconds`` in both runs are ignored as noise.
+
+    Args:
+        previous: Baseline run.
+        current: Run to check.
+        threshold: Relative change that counts as a regression (0.25 = 25%).
+        min_seconds: Smallest duration worth comparing.
+
+    Returns:
+        Regressions found, worst first.
+    """
+    regressions: list[Regression] = []
+
+    def check(table: str, metric: str, before: float | None, after: float | None,
+              higher_is_worse: bool = True) -> None:
+        if not before or after is None:
+            return
+        change = (after - before) / before
+        if (change if higher_is_worse else -change) > threshold:
+            regressions.append({
+                'table': table,
+                'metric': metric,
+                'previous': before,
+                'current': after,
+                'change': round(change, 4),
+            })
+
+    for table, after in current['tables'].items():
+        before = previous['tables'].get(table)
+        if before is None or before.get('status') != 'success' or after.get('status') != 'success':
+            continue
+        if max(before.get('seconds', 0), after.get('seconds', 0)) < min_seconds:
+            continue
+        check(table, 'seconds', before.get('seconds'), after.get('seconds'))
+        check(table, 'rows_per_sec', before.get('rows_per_sec'), after.get('rows_per_sec'),
+              higher_is_worse=False)
+        for phase, seconds in after.get('phases', {}).items():
+            previous_seconds = before.get('phases', {}).get(phase)
+            if previous_seconds is not None and max(previous_seconds, seconds) >= min_seconds:
+                check(table, f'phases.{phase}', previous_seconds, seconds)
+
+    if max(previous['seconds'], current['seconds']) >= min_seconds:
+        check('*', 'seconds', previous['seconds'], current['seconds'])
+    check('*', 'peak_rss_mb', previous.get('peak_rss_mb'), current.get('peak_rss_mb'))
+
+    return sorted(regressions, key=lambda r: abs(r['change']), reverse=True)
+
+
+def print_regressions(regressions: list[Regression], baseline: str | Path) -> None:
+    """
+    Print the outcome of a run comparison.
+
+    Args:
+        regressions: Output of compare_runs.
+        baseline: What the run was compared against, for the message.
+    """
+    if not regressions:
+        print(f"✓ No regressions against {baseline}")
+        return
+    print(f"⚠ {len(regressions)} regression(s) against {baseline}:")
+    for r in regressions:
+        print(f"   {r['table']} {r['metric']}: {r['previous']:,.2f} → {r['current']:,.2f} "
+              f"({r['change']:+.0%})")
+
+
+def main() -> None:
+    """Compare two run reports from the command line."""
+    parser = argparse.ArgumentParser(description='Compare two loader run reports.')
+    parser.add_argument('previous', help='Baseline run report')
+    parser.add_argument('current', help='Run report to check')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative change flagged as a regression (default: 0.25)')
+    args = parser.parse_args()
+
+    regressions = compare_runs(
+        load_report(args.previous), load_report(args.current), threshold=args.threshold
+    )
+    print_regressions(regressions, args.previous)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
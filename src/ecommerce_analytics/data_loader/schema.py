@@ -0,0 +1,309 @@
+"""
+Explicit column types for the Olist source CSV files.
+
+The registry replaces per-read type inference: CSVs are parsed straight into
+compact types (categoricals, narrow ints, Arrow-backed strings, parsed
+timestamps), and the same declarations drive the DDL of the RAW tables.
+Whole files are parsed by pyarrow; streamed reads use pandas' chunked
+reader, whose memory stays bounded by the chunk size.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+# Source column -> logical type, per RAW table. Zip code prefixes are strings
+# so leading zeros survive; low-cardinality text is 'category'.
+TABLE_SCHEMAS: dict[str, dict[str, str]] = {
+    'CUSTOMERS': {
+        'customer_id': 'string',
+        'customer_unique_id': 'string',
+        'customer_zip_code_prefix': 'string',
+        'customer_city': 'category',
+        'customer_state': 'category',
+    },
+    'GEOLOCATION': {
+        'geolocation_zip_code_prefix': 'string',
+        'geolocation_lat': 'float64',
+        'geolocation_lng': 'float64',
+        'geolocation_city': 'category',
+        'geolocation_state': 'category',
+    },
+    'ORDER_ITEMS': {
+        'order_id': 'string',
+        'order_item_id': 'int16',
+        'product_id': 'string',
+        'seller_id': 'string',
+        'shipping_limit_date': 'timestamp',
+        'price': 'float64',
+        'freight_value': 'float64',
+    },
+    'ORDER_PAYMENTS': {
+        'order_id': 'string',
+        'payment_sequential': 'int16',
+        'payment_type': 'category',
+        'payment_installments': 'int16',
+        'payment_value': 'float64',
+    },
+    'ORDER_REVIEWS': {
+        'review_id': 'string',
+        'order_id': 'string',
+        'review_score': 'int8',
+        'review_comment_title': 'string',
+        'review_comment_message': 'string',
+        'review_creation_date': 'timestamp',
+        'review_answer_timestamp': 'timestamp',
+    },
+    'ORDERS': {
+        'order_id': 'string',
+        'customer_id': 'string',
+        'order_status': 'category',
+        'order_purchase_timestamp': 'timestamp',
+        'order_approved_at': 'timestamp',
+        'order_delivered_carrier_date': 'timestamp',
+        'order_delivered_customer_date': 'timestamp',
+        'order_estimated_delivery_date': 'timestamp',
+    },
+    'PRODUCTS': {
+        'product_id': 'string',
+        'product_category_name': 'category',
+        # Counts and dimensions have gaps, so they are floats
+        'product_name_lenght': 'float32',
+        'product_description_lenght': 'float32',
+        'product_photos_qty': 'float32',
+        'product_weight_g': 'float32',
+        'product_length_cm': 'float32',
+        'product_height_cm': 'float32',
+        'product_width_cm': 'float32',
+    },
+    'SELLERS': {
+        'seller_id': 'string',
+        'seller_zip_code_prefix': 'string',
+        'seller_city': 'category',
+        'seller_state': 'category',
+    },
+    'PRODUCT_CATEGORY_TRANSLATION': {
+        'product_category_name': 'string',
+        'product_category_name_english': 'string',
+    },
+}
+
+ARROW_TYPES: dict[str, pa.DataType] = {
+    'string': pa.string(),
+    'category': pa.dictionary(pa.int32(), pa.string()),
+    'int8': pa.int8(),
+    'int16': pa.int16(),
+    'int32': pa.int32(),
+    'float32': pa.float32(),
+    'float64': pa.float64(),
+    'timestamp': pa.timestamp('ns'),
+}
+
+PANDAS_DTYPES: dict[str, str] = {
+    'string': 'string[pyarrow]',
+    'category': 'category',
+    'int8': 'int8',
+    'int16': 'int16',
+    'int32': 'int32',
+    'float32': 'float32',
+    'float64': 'float64',
+}
+
+SNOWFLAKE_TYPES: dict[str, str] = {
+    'string': 'VARCHAR',
+    'category': 'VARCHAR',
+    'int8': 'NUMBER(3, 0)',
+    'int16': 'NUMBER(5, 0)',
+    'int32': 'NUMBER(10, 0)',
+    'float32': 'FLOAT',
+    'float64': 'FLOAT',
+    'timestamp': 'TIMESTAMP_NTZ',
+}
+
+
+def arrow_column_types(table_name: str) -> dict[str, pa.DataType] | None:
+    """
+    Arrow types to parse a source CSV with.
+
+    Args:
+        table_name: RAW table name.
+
+    Returns:
+        Column -> Arrow type, or None if the table is not registered.
+    """
+    columns = TABLE_SCHEMAS.get(table_name.upper())
+    if columns is None:
+        return None
+    return {name: ARROW_TYPES[logical] for name, logical in columns.items()}
+
+
+def snowflake_columns(table_name: str) -> list[tuple[str, str]] | None:
+    """
+    Column definitions for the RAW table DDL.
+
+    Args:
+        table_name: RAW table name.
+
+    Returns:
+        List of (column, Snowflake type), or None if the table is not registered.
+    """
+    columns = TABLE_SCHEMAS.get(table_name.upper())
+    if columns is None:
+        return None
+    return [(name, SNOWFLAKE_TYPES[logical]) for name, logical in columns.items()]
+
+
+def pandas_read_options(table_name: str) -> dict[str, Any]:
+    """
+    Keyword arguments for pd.read_csv that apply the registered types.
+
+    Args:
+        table_name: RAW table name.
+
+    Returns:
+        ``dtype`` and ``parse_dates`` arguments, or {} if the table is not
+        registered.
+    """
+    columns = TABLE_SCHEMAS.get(table_name.upper())
+    if columns is None:
+        return {}
+    return {
+        'dtype': {
+            name: PANDAS_DTYPES[logical]
+            for name, logical in columns.items() if logical != 'timestamp'
+        },
+        'parse_dates': [name for name, logical in columns.items() if logical == 'timestamp'],
+    }
+
+
+# Quoted fields may span lines (review comments do). This stops pyarrow from
+# splitting blocks at arbitrary newlines, so files are parsed serially.
+PARSE_OPTIONS = pa_csv.ParseOptions(newlines_in_values=True)
+
+
+def _convert_options(
+    table_name: str,
+    columns: list[str] | None = None
+) -> pa_csv.ConvertOptions:
+    return pa_csv.ConvertOptions(
+        column_types=arrow_column_types(table_name),
+        # Empty fields are NULL, as with pandas
+        strings_can_be_null=True,
+        include_columns=columns,
+    )
+
+
+def to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert parsed Arrow data to pandas without materializing Python strings.
+
+    Dictionary columns become categoricals and strings stay Arrow-backed.
+
+    Args:
+        table: Arrow table or record batch.
+
+    Returns:
+        DataFrame using compact dtypes.
+    """
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+
+
+def read_source_table(
+    path: str | Path,
+    table_name: str,
+    columns: list[str] | None = None
+) -> pa.Table:
+    """
+    Parse a whole source CSV into Arrow with the registered types.
+
+    Args:
+        path: CSV file.
+        table_name: RAW table name the file belongs to.
+        columns: Only read these columns.
+
+    Returns:
+        Arrow table using the registry types.
+    """
+    return pa_csv.read_csv(
+        path,
+        parse_options=PARSE_OPTIONS,
+        convert_options=_convert_options(table_name, columns),
+    )
+
+
+def stream_source_table(
+    path: str | Path,
+    table_name: str,
+    block_size: int = 16 * 1024 * 1024
+) -> pa.RecordBatchReader:
+    """
+    Parse a source CSV into Arrow record batches with the registered types.
+
+    The reader parses ahead on several threads, so memory is a few blocks
+    rather than one; use iter_source_csv where it must stay bounded.
+
+    Args:
+        path: CSV file.
+        table_name: RAW table name the file belongs to.
+        block_size: Bytes of CSV per record batch.
+
+    Returns:
+        Reader yielding record batches using the registry types.
+    """
+    return pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=block_size),
+        parse_options=PARSE_OPTIONS,
+        convert_options=_convert_options(table_name),
+    )
+
+
+def read_source_csv(
+    path: str | Path,
+    table_name: str,
+    columns: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    Read a whole source CSV with the registered types.
+
+    Args:
+        path: CSV file.
+        table_name: RAW table name the file belongs to.
+        columns: Only read these columns.
+
+    Returns:
+        DataFrame using the registry dtypes.
+    """
+    return to_pandas(read_source_table(path, table_name, columns))
+
+
+def iter_source_csv(
+    path: str | Path,
+    table_name: str,
+    chunk_rows: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a source CSV as DataFrames of ``chunk_rows`` rows.
+
+    pyarrow's streaming CSV reader reads many blocks ahead, so chunks come
+    from pandas' C parser with the registered dtypes instead.
+
+    Args:
+        path: CSV file.
+        table_name: RAW table name the file belongs to.
+        chunk_rows: Rows per chunk.
+
+    Yields:
+        DataFrames using the registry dtypes.
+    """
+    options = pandas_read_options(table_name)
+    header = pd.read_csv(path, nrows=0).columns
+    if 'parse_dates' in options:
+        # parse_dates fails on columns the file does not have
+        options['parse_dates'] = [c for c in options['parse_dates'] if c in header]
+    with pd.read_csv(path, chunksize=chunk_rows, **options) as reader:
+        yield from reader
@@ -0,0 +1,260 @@
+"""
+Pre-load validation of the Olist source CSV files.
+
+Runs the checks the dbt staging tests would run in the warehouse (not-null
+columns, primary-key uniqueness, referential integrity) locally before any
+upload. Tables are parsed and checked in parallel; keys are compared as
+64-bit hashes, so the relationship checks are vectorized set lookups.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TypedDict
+
+import numpy as np
+import pandas as pd
+
+from .columnar_cache import ColumnarCache
+from .schema import read_source_table
+
+# Columns that must not be NULL, as tested on the staging models
+NOT_NULL: dict[str, list[str]] = {
+    'CUSTOMERS': ['customer_id', 'customer_unique_id', 'customer_state'],
+    'ORDERS': ['order_id', 'customer_id', 'order_status'],
+    'ORDER_ITEMS': ['order_id', 'product_id', 'seller_id', 'price'],
+    'ORDER_PAYMENTS': ['order_id', 'payment_type', 'payment_value'],
+    'ORDER_REVIEWS': ['review_id', 'order_id', 'review_score'],
+    'PRODUCTS': ['product_id'],
+    'SELLERS': ['seller_id', 'seller_state'],
+}
+
+PRIMARY_KEYS: dict[str, str] = {
+    'CUSTOMERS': 'customer_id',
+    'ORDERS': 'order_id',
+    'PRODUCTS': 'product_id',
+    'SELLERS': 'seller_id',
+}
+
+# (table, column) -> (referenced table, referenced column)
+FOREIGN_KEYS: dict[tuple[str, str], tuple[str, str]] = {
+    ('ORDERS', 'customer_id'): ('CUSTOMERS', 'customer_id'),
+    ('ORDER_ITEMS', 'order_id'): ('ORDERS', 'order_id'),
+    ('ORDER_ITEMS', 'product_id'): ('PRODUCTS', 'product_id'),
+    ('ORDER_ITEMS', 'seller_id'): ('SELLERS', 'seller_id'),
+}
+
+
+class CheckFailure(TypedDict):
+    """A validation check that found bad rows."""
+    table: str
+    check: str
+    column: str
+    failures: int
+    examples: list[str]
+
+
+class TableValidation(TypedDict):
+    """Column profile of one validated table."""
+    rows: int
+    null_rates: dict[str, float]
+    seconds: float
+
+
+class ValidationReport(TypedDict):
+    """Outcome of validating a set of source files."""
+    tables: dict[str, TableValidation]
+    failures: list[CheckFailure]
+    seconds: float
+
+
+def hash_keys(values: pd.Series) -> np.ndarray:
+    """
+    Hash key values to 64-bit integers.
+
+    Args:
+        values: Key column without NULLs.
+
+    Returns:
+        uint64 hash per value.
+    """
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def _examples(values: pd.Series, mask: np.ndarray, limit: int = 5) -> list[str]:
+    return [str(value) for value in values[mask].unique()[:limit]]
+
+
+def _validate_table(
+    path: Path,
+    table_name: str,
+    key_columns: set[str],
+    cache: ColumnarCache | None = None
+) -> tuple[TableValidation, list[CheckFailure], dict[str, tuple[pd.Series, np.ndarray]]]:
+    """
+    Run the single-table checks and hash the columns used by relationships.
+
+    Args:
+        path: CSV file.
+        table_name: RAW table name.
+        key_columns: Columns of this table taking part in relationships.
+        cache: Read the file through this cache if given.
+
+    Returns:
+        Tuple of (profile, failures, column -> (values, hashes)) where the
+        values and hashes exclude NULLs.
+    """
+    started = time.perf_counter()
+    if cache is not None:
+        table = cache.read_table(path, table_name)
+    else:
+        table = read_source_table(path, table_name)
+    rows = table.num_rows
+    failures: list[CheckFailure] = []
+
+    # Arrow tracks null counts per column, so null rates cost nothing
+    null_rates = {
+        name: round(table.column(name).null_count / rows, 6) if rows else 0.0
+        for name in table.column_names
+    }
+    for column in NOT_NULL.get(table_name, []):
+        if column not in table.column_names:
+            failures.append({'table': table_name, 'check': 'exists', 'column': column,
+                             'failures': rows, 'examples': []})
+        elif table.column(column).null_count:
+            failures.append({'table': table_name, 'check': 'not_null', 'column': column,
+                             'failures': table.column(column).null_count, 'examples': []})
+
+    keys: dict[str, tuple[pd.Series, np.ndarray]] = {}
+    primary_key = PRIMARY_KEYS.get(table_name)
+    for column in key_columns | ({primary_key} if primary_key else set()):
+        if column not in table.column_names:
+            continue
+        values = table.column(column).drop_null().to_pandas()
+        hashes = hash_keys(values)
+        keys[column] = (values, hashes)
+
+        if column == primary_key:
+            # Rows whose hash occurs more than once
+            order = np.argsort(hashes, kind='stable')
+            same = hashes[order[1:]] == hashes[order[:-1]]
+            repeated = np.zeros(len(hashes), dtype=bool)
+            repeated[order[1:][same]] = True
+            repeated[order[:-1][same]] = True
+            if repeated.any():
+                # Confirm on the values themselves; hashes only narrow it down
+                candidates = values[repeated]
+                duplicated = candidates.duplicated().to_numpy()
+                if duplicated.any():
+                    failures.append({'table': table_name, 'check': 'unique', 'column': column,
+                                     'failures': int(duplicated.sum()),
+                                     'examples': _examples(candidates, duplicated)})
+
+    profile: TableValidation = {
+        'rows': rows,
+        'null_rates': null_rates,
+        'seconds': round(time.perf_counter() - started, 4),
+    }
+    return profile, failures, keys
+
+
+def validate_files(
+    data_dir: str | Path,
+    file_table_mapping: dict[str, str],
+    max_workers: int = 4,
+    cache: ColumnarCache | None = None
+) -> ValidationReport:
+    """
+    Validate the source CSV files before loading them.
+
+    Args:
+        data_dir: Directory with the CSV files.
+        file_table_mapping: CSV file name -> RAW table name. Missing files
+            are skipped, as are relationships to them.
+        max_workers: Tables parsed and checked concurrently.
+        cache: Read the files through this cache if given.
+
+    Returns:
+        Per-table profiles and every failed check.
+    """
+    started = time.perf_counter()
+    data_dir = Path(data_dir)
+    files = {
+        table_name: data_dir / csv_file
+        for csv_file, table_name in file_table_mapping.items()
+        if (data_dir / csv_file).exists()
+    }
+
+    key_columns: dict[str, set[str]] = {table_name: set() for table_name in files}
+    for (table_name, column), (ref_table, ref_column) in FOREIGN_KEYS.items():
+        if table_name in files and ref_table in files:
+            key_columns[table_name].add(column)
+            key_columns[ref_table].add(ref_column)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers),
+                            thread_name_prefix='validate') as executor:
+        futures = {
+            table_name: executor.submit(
+                _validate_table, path, table_name, key_columns[table_name], cache
+            )
+            for table_name, path in files.items()
+        }
+        outcomes = {table_name: future.result() for table_name, future in futures.items()}
+
+    tables = {table_name: outcome[0] for table_name, outcome in outcomes.items()}
+    failures = [failure for outcome in outcomes.values() for failure in outcome[1]]
+
+    for (table_name, column), (ref_table, ref_column) in FOREIGN_KEYS.items():
+        child = outcomes.get(table_name, (None, None, {}))[2].get(column)
+        parent = outcomes.get(ref_table, (None, None, {}))[2].get(ref_column)
+        if child is None or parent is None:
+            continue
+        values, hashes = child
+        orphans = ~np.isin(hashes, parent[1])
+        if orphans.any():
+            failures.append({'table': table_name, 'check': f'relationship:{ref_table}',
+                             'column': column, 'failures': int(orphans.sum()),
+                             'examples': _examples(values, orphans)})
+
+    return {
+        'tables': tables,
+        'failures': failures,
+        'seconds': round(time.perf_counter() - started, 4),
+    }
+
+
+def print_validation(report: ValidationReport) -> None:
+    """
+    Print the outcome of a validation run.
+
+    Args:
+        report: Output of validate_files.
+    """
+    for failure in report['failures']:
+        examples = f" e.g. {', '.join(failure['examples'])}" if failure['examples'] else ''
+        print(f"✗ {failure['table']}.{failure['column']} {failure['check']}: "
+              f"{failure['failures']:,} rows{examples}")
+    status = '✓' if not report['failures'] else '✗'
+    print(f"{status} Validated {len(report['tables'])} table(s) in {report['seconds']:.1f}s, "
+          f"{len(report['failures'])} failed check(s)")
+
+
+def main() -> None:
+    """Validate the source files from the command line."""
+    from .load_to_snowflake import EcommerceDataLoader
+
+    parser = argparse.ArgumentParser(description='Validate the source CSV files.')
+    parser.add_argument('data_dir', nargs='?', default='data/raw', help='CSV directory')
+    parser.add_argument('--workers', type=int, default=4, help='Tables checked concurrently')
+    args = parser.parse_args()
+
+    report = validate_files(args.data_dir, EcommerceDataLoader.FILE_TABLE_MAPPING, args.workers)
+    print_validation(report)
+    sys.exit(1 if report['failures'] else 0)
+
+
+if __name__ == "__main__":
+    main()
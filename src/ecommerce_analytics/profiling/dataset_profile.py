@@ -0,0 +1,400 @@
+"""
+Single-pass profile of the source CSV files.
+
+Each file is parsed once, as Arrow record batches with the schema registry
+types, and files are profiled in parallel. Per column the profile has the
+null rate, an approximate distinct count (k-minimum-values sketch over
+64-bit hashes), min/max and the bytes it takes in memory under the compact
+types. The cross-file key metrics (orders, unique customers, purchase date
+range) are derived from the same pass.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, TypedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ..data_loader.columnar_cache import ColumnarCache
+from ..data_loader.schema import stream_source_table
+
+PROFILE_VERSION = 1
+
+# Hashes kept per column by the distinct count sketch; the estimate's
+# relative error is about 1 / sqrt(KMV_SIZE)
+KMV_SIZE = 4096
+
+# Distinct values of a column kept in Arrow before switching to hashes.
+# Hashing strings goes through Python objects, so low-cardinality columns
+# are deduplicated across batches first and hashed once.
+DISTINCT_BUFFER = 65_536
+
+# Columns whose distinct count is kept exact, for the key metrics
+EXACT_DISTINCT: dict[str, list[str]] = {
+    'CUSTOMERS': ['customer_unique_id'],
+}
+
+# Key metric -> (table, column or None for the table, profile field)
+KEY_METRICS: dict[str, tuple[str, str | None, str]] = {
+    'total_orders': ('ORDERS', None, 'rows'),
+    'total_order_items': ('ORDER_ITEMS', None, 'rows'),
+    'unique_customers': ('CUSTOMERS', 'customer_unique_id', 'distinct'),
+    'first_purchase': ('ORDERS', 'order_purchase_timestamp', 'min'),
+    'last_purchase': ('ORDERS', 'order_purchase_timestamp', 'max'),
+}
+
+
+class ColumnProfile(TypedDict, total=False):
+    """Statistics of one column."""
+    type: str
+    null_rate: float
+    approx_distinct: int
+    distinct: int
+    min: Any
+    max: Any
+    bytes: int
+
+
+class TableProfile(TypedDict):
+    """Statistics of one source file."""
+    file: str
+    rows: int
+    bytes: int
+    source: str
+    seconds: float
+    columns: dict[str, ColumnProfile]
+
+
+class DatasetProfile(TypedDict):
+    """Profile of all source files of a data directory."""
+    version: int
+    created_at: str
+    data_dir: str
+    seconds: float
+    tables: dict[str, TableProfile]
+    metrics: dict[str, Any]
+
+
+def hash_values(values: pa.Array) -> np.ndarray:
+    """
+    Hash non-null values to 64-bit integers.
+
+    Args:
+        values: Arrow array without NULLs.
+
+    Returns:
+        uint64 hash per value.
+    """
+    # categorize only pays off for repeated values; callers mostly pass
+    # values that are already distinct
+    return pd.util.hash_array(values.to_numpy(zero_copy_only=False), categorize=False)
+
+
+class DistinctSketch:
+    """K-minimum-values estimate of a distinct count.
+
+    Keeps the ``k`` smallest distinct hashes seen. While fewer than ``k``
+    distinct values were seen the count is exact; past that, the spread of
+    the ``k`` smallest hashes over the hash space gives the estimate.
+    """
+
+    def __init__(self, k: int = KMV_SIZE) -> None:
+        self.k: int = k
+        self.hashes: np.ndarray = np.empty(0, dtype=np.uint64)
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Add hashed values; duplicates are allowed."""
+        if len(self.hashes) == self.k:
+            # Only hashes below the current k-th smallest can enter
+            hashes = hashes[hashes < self.hashes[-1]]
+        self.hashes = np.union1d(self.hashes, np.unique(hashes)[:self.k])[:self.k]
+
+    def estimate(self) -> int:
+        """Estimated number of distinct values added."""
+        if len(self.hashes) < self.k:
+            return len(self.hashes)
+        kth = float(self.hashes[-1]) + 1.0
+        return int(round((self.k - 1) * 2.0**64 / kth))
+
+
+class _ColumnStats:
+    """Accumulates a column's statistics over record batches."""
+
+    def __init__(self, exact: bool) -> None:
+        self.type: pa.DataType | None = None
+        self.nulls: int = 0
+        self.bytes: int = 0
+        self.dictionary_bytes: int = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.sketch: DistinctSketch = DistinctSketch()
+        self.exact: list[np.ndarray] | None = [] if exact else None
+        self.distinct: pa.Array | None = None
+        self.buffering: bool = True
+
+    def update(self, array: pa.Array) -> None:
+        """Add one batch of the column."""
+        self.type = array.type
+        self.nulls += array.null_count
+        if pa.types.is_dictionary(array.type):
+            # Categories are stored once, the codes per row
+            self.bytes += array.indices.nbytes
+            self.dictionary_bytes = max(self.dictionary_bytes, array.dictionary.nbytes)
+            used = pc.unique(array.indices.drop_null())
+            values = pc.take(array.dictionary, used)
+        else:
+            self.bytes += array.nbytes
+            values = pc.unique(array.drop_null()) if self.buffering else array.drop_null()
+        if not len(values):
+            return
+
+        if not pa.types.is_null(values.type):
+            bounds = pc.min_max(values)
+            low, high = bounds['min'].as_py(), bounds['max'].as_py()
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+
+        if self.buffering:
+            if self.distinct is not None:
+                values = pc.unique(pa.concat_arrays([self.distinct, values]))
+            if len(values) <= DISTINCT_BUFFER:
+                self.distinct = values
+                return
+            self.distinct = None
+            self.buffering = False
+        self._add(values)
+
+    def _add(self, values: pa.Array) -> None:
+        """Hash values into the distinct count sketch."""
+        hashes = hash_values(values)
+        self.sketch.update(hashes)
+        if self.exact is not None:
+            self.exact.append(np.unique(hashes))
+
+    def profile(self, rows: int) -> ColumnProfile:
+        """Statistics of the column over all batches."""
+        if self.distinct is not None:
+            self._add(self.distinct)
+            self.distinct = None
+        profile: ColumnProfile = {
+            'type': str(self.type),
+            'null_rate': round(self.nulls / rows, 6) if rows else 0.0,
+            'approx_distinct': self.sketch.estimate(),
+            'min': self.min,
+            'max': self.max,
+            'bytes': self.bytes + self.dictionary_bytes,
+        }
+        if self.exact is not None:
+            profile['distinct'] = (
+                len(np.unique(np.concatenate(self.exact))) if self.exact else 0
+            )
+        return profile
+
+
+def profile_batches(
+    batches: Iterable[pa.RecordBatch],
+    exact_distinct: Iterable[str] = ()
+) -> tuple[int, dict[str, ColumnProfile]]:
+    """
+    Profile a stream of record batches in one pass.
+
+    Args:
+        batches: Record batches of one table.
+        exact_distinct: Columns whose distinct count is kept exact.
+
+    Returns:
+        Tuple of (row count, column -> statistics).
+    """
+    exact = set(exact_distinct)
+    rows = 0
+    stats: dict[str, _ColumnStats] = {}
+    for batch in batches:
+        rows += batch.num_rows
+        for name, array in zip(batch.schema.names, batch.columns):
+            if name not in stats:
+                stats[name] = _ColumnStats(exact=name in exact)
+            stats[name].update(array)
+    return rows, {name: column.profile(rows) for name, column in stats.items()}
+
+
+def profile_file(
+    path: str | Path,
+    table_name: str,
+    cache: ColumnarCache | None = None
+) -> TableProfile:
+    """
+    Profile one source CSV file.
+
+    Args:
+        path: CSV file.
+        table_name: RAW table name the file belongs to.
+        cache: If given and it holds a fresh copy of the file, profile the
+            memory-mapped copy instead of parsing the CSV.
+
+    Returns:
+        The file's statistics.
+    """
+    started = time.perf_counter()
+    path = Path(path)
+    cached = cache.lookup(path, table_name) if cache is not None else None
+    if cached is not None:
+        batches: Iterable[pa.RecordBatch] = cached.to_batches()
+    else:
+        batches = stream_source_table(path, table_name)
+    rows, columns = profile_batches(batches, EXACT_DISTINCT.get(table_name, []))
+
+    return {
+        'file': path.name,
+        'rows': rows,
+        'bytes': sum(column['bytes'] for column in columns.values()),
+        'source': 'cache' if cached is not None else 'csv',
+        'seconds': round(time.perf_counter() - started, 4),
+        'columns': columns,
+    }
+
+
+def key_metrics(tables: dict[str, TableProfile]) -> dict[str, Any]:
+    """
+    Derive the KEY_METRICS from table profiles.
+
+    Args:
+        tables: Profile per RAW table name.
+
+    Returns:
+        Metric name -> value, None where the file was not profiled.
+    """
+    metrics: dict[str, Any] = {}
+    for metric, (table_name, column, field) in KEY_METRICS.items():
+        table = tables.get(table_name)
+        if table is None:
+            metrics[metric] = None
+        elif column is None:
+            metrics[metric] = table[field]
+        else:
+            metrics[metric] = table['columns'].get(column, {}).get(field)
+    return metrics
+
+
+def profile_dataset(
+    data_dir: str | Path,
+    file_table_mapping: dict[str, str],
+    max_workers: int = 4,
+    cache: ColumnarCache | None = None
+) -> DatasetProfile:
+    """
+    Profile every CSV file of a data directory, files in parallel.
+
+    Args:
+        data_dir: Directory with the CSV files.
+        file_table_mapping: CSV file name -> RAW table name. Other CSV files
+            are profiled under their file stem, with inferred types.
+        max_workers: Files profiled concurrently.
+        cache: Columnar cache to read fresh copies from; see profile_file.
+
+    Returns:
+        The dataset profile.
+    """
+    started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    data_dir = Path(data_dir)
+    files = {
+        file_table_mapping.get(path.name, path.stem): path
+        for path in sorted(data_dir.glob('*.csv'))
+    }
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers),
+                            thread_name_prefix='profile') as executor:
+        futures = {
+            table_name: executor.submit(profile_file, path, table_name, cache)
+            for table_name, path in files.items()
+        }
+        tables = {table_name: future.result() for table_name, future in futures.items()}
+
+    return {
+        'version': PROFILE_VERSION,
+        'created_at': started_at.isoformat(),
+        'data_dir': str(data_dir),
+        'seconds': round(time.perf_counter() - started, 4),
+        'tables': tables,
+        'metrics': key_metrics(tables),
+    }
+
+
+def save_profile(profile: DatasetProfile, path: str | Path) -> Path:
+    """
+    Write a dataset profile as JSON.
+
+    Args:
+        profile: Output of profile_dataset.
+        path: File to write.
+
+    Returns:
+        The written path.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(profile, f, indent=2, default=str)
+    return path
+
+
+def print_profile(profile: DatasetProfile) -> None:
+    """
+    Print a dataset profile.
+
+    Args:
+        profile: Output of profile_dataset.
+    """
+    print("Dataset Overview\n" + "=" * 50)
+    for table in profile['tables'].values():
+        columns = table['columns']
+        print(f"\n{table['file']}")
+        print(f"Rows: {table['rows']:,} | Columns: {len(columns)}")
+        print(f"Columns: {', '.join(list(columns)[:5])}...")
+        print(f"Memory: {table['bytes'] / 1024**2:.2f} MB")
+        nullable = {name: c['null_rate'] for name, c in columns.items() if c['null_rate']}
+        if nullable:
+            print("Nulls: " + ', '.join(f"{name} {rate:.1%}" for name, rate in nullable.items()))
+
+    metrics = profile['metrics']
+    print("\n\nKey Metrics\n" + "=" * 50)
+    for label, metric in (('Total Orders', 'total_orders'),
+                          ('Total Order Items', 'total_order_items'),
+                          ('Unique Customers', 'unique_customers')):
+        if metrics.get(metric) is not None:
+            print(f"{label}: {metrics[metric]:,}")
+    if metrics.get('first_purchase') is not None:
+        print(f"Date Range: {metrics['first_purchase']} to {metrics['last_purchase']}")
+    print(f"\n✓ Profiled {len(profile['tables'])} file(s) in {profile['seconds']:.1f}s")
+
+
+def main() -> None:
+    """Profile the source files from the command line."""
+    from ..data_loader.load_to_snowflake import EcommerceDataLoader
+
+    parser = argparse.ArgumentParser(description='Profile the source CSV files.')
+    parser.add_argument('data_dir', nargs='?', default='data/raw', help='CSV directory')
+    parser.add_argument('--output', default='data/profiles/dataset_profile.json',
+                        help='JSON file the profile is written to')
+    parser.add_argument('--workers', type=int, default=4, help='Files profiled concurrently')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always parse the CSVs, even if the columnar cache has them')
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    cache = None if args.no_cache else ColumnarCache(data_dir.parent / 'cache')
+    profile = profile_dataset(data_dir, EcommerceDataLoader.FILE_TABLE_MAPPING, args.workers, cache)
+    print_profile(profile)
+    print(f"✓ Profile written to {save_profile(profile, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
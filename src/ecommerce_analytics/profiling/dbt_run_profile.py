@@ -0,0 +1,486 @@
+"""
+Profile of a dbt invocation from its saved artifacts.
+
+Reads ``run_results.json`` and ``manifest.json`` from a dbt target directory
+and reports per-node execution time, the critical path (the chain of
+dependent nodes with the largest summed execution time, which bounds the
+wall time whatever the thread count) and the parallelism the run achieved
+against what the DAG and thread count allow. Each profile is appended to a
+JSONL history and compared with the previous comparable run to flag
+regressions. Only the artifact files are read, so saved artifacts can be
+profiled offline.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import Any, TypedDict
+
+PROFILE_VERSION = 1
+
+# Result statuses of nodes that ran to completion, for models and tests
+COMPLETED = {'success', 'pass', 'warn'}
+
+
+class NodeTiming(TypedDict, total=False):
+    """Execution of one dbt node."""
+    name: str
+    resource_type: str
+    materialized: str | None
+    status: str
+    seconds: float
+    thread: str | None
+    started_at: str | None
+    completed_at: str | None
+    wait_seconds: float | None
+
+
+class CriticalPath(TypedDict):
+    """Longest chain of dependent nodes, by execution time."""
+    seconds: float
+    nodes: list[str]
+
+
+class RunProfile(TypedDict):
+    """Timing summary of one dbt invocation."""
+    version: int
+    invocation_id: str | None
+    generated_at: str | None
+    command: str | None
+    full_refresh: bool
+    threads: int
+    elapsed_seconds: float
+    span_seconds: float
+    busy_seconds: float
+    achieved_parallelism: float
+    possible_parallelism: float
+    ideal_seconds: float
+    critical_path: CriticalPath
+    nodes: dict[str, NodeTiming]
+
+
+class Regression(TypedDict):
+    """A timing that got worse between two runs."""
+    node: str
+    metric: str
+    previous: float
+    current: float
+    change: float
+
+
+def load_artifacts(target_dir: str | Path) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Read the artifacts of the last dbt invocation.
+
+    Args:
+        target_dir: dbt target directory.
+
+    Returns:
+        Parsed ``run_results.json`` and ``manifest.json``.
+    """
+    target_dir = Path(target_dir)
+    with open(target_dir / 'run_results.json') as f:
+        run_results = json.load(f)
+    with open(target_dir / 'manifest.json') as f:
+        manifest = json.load(f)
+    return run_results, manifest
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    """Parse a dbt artifact timestamp (ISO 8601, 'Z' suffix)."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _window(result: dict[str, Any]) -> tuple[datetime | None, datetime | None]:
+    """
+    Start and end of a node, over its compile and execute steps.
+
+    Args:
+        result: Entry of ``run_results.json``.
+
+    Returns:
+        Start and end, or None where dbt recorded no timing (skipped nodes).
+    """
+    starts = [_parse_time(t.get('started_at')) for t in result.get('timing', [])]
+    ends = [_parse_time(t.get('completed_at')) for t in result.get('timing', [])]
+    starts = [s for s in starts if s is not None]
+    ends = [e for e in ends if e is not None]
+    return (min(starts) if starts else None, max(ends) if ends else None)
+
+
+def run_parents(unique_id: str, executed: set[str], manifest: dict[str, Any]) -> set[str]:
+    """
+    Executed nodes a node waits for.
+
+    Dependencies that were not part of the invocation (ephemeral or
+    unselected models) are followed through to their own dependencies, so
+    the ordering between executed nodes is kept. Sources end the walk.
+
+    Args:
+        unique_id: Node to look up.
+        executed: Unique ids of the nodes in the invocation.
+        manifest: Parsed ``manifest.json``.
+
+    Returns:
+        Unique ids of the executed upstream nodes it depends on directly.
+    """
+    nodes = manifest.get('nodes', {})
+    parent_map = manifest.get('parent_map', {})
+
+    def dependencies(node_id: str) -> list[str]:
+        node = nodes.get(node_id)
+        if node is not None:
+            return node.get('depends_on', {}).get('nodes', [])
+        return parent_map.get(node_id, [])
+
+    parents: set[str] = set()
+    seen: set[str] = set()
+    stack = list(dependencies(unique_id))
+    while stack:
+        node_id = stack.pop()
+        if node_id in seen:
+            continue
+        seen.add(node_id)
+        if node_id in executed:
+            parents.add(node_id)
+        elif node_id in nodes:
+            stack.extend(dependencies(node_id))
+    return parents
+
+
+def critical_path(seconds: dict[str, float], parents: dict[str, set[str]]) -> CriticalPath:
+    """
+    Longest chain of dependent nodes, weighted by execution time.
+
+    Args:
+        seconds: Execution time per node.
+        parents: Executed upstream nodes per node.
+
+    Returns:
+        The chain, upstream first, and its summed execution time.
+    """
+    finish: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+    for node in TopologicalSorter(parents).static_order():
+        before = max(parents.get(node, ()), key=lambda p: finish[p], default=None)
+        finish[node] = seconds.get(node, 0.0) + (finish[before] if before else 0.0)
+        previous[node] = before
+
+    if not finish:
+        return {'seconds': 0.0, 'nodes': []}
+    node: str | None = max(finish, key=lambda n: finish[n])
+    total = finish[node]
+    chain: list[str] = []
+    while node is not None:
+        chain.append(node)
+        node = previous[node]
+    return {'seconds': round(total, 3), 'nodes': chain[::-1]}
+
+
+def profile_run(
+    run_results: dict[str, Any],
+    manifest: dict[str, Any],
+    threads: int | None = None
+) -> RunProfile:
+    """
+    Summarize the timings of a dbt invocation.
+
+    Achieved parallelism is the summed node execution time over the wall
+    time the nodes spanned. Possible parallelism is the same sum over the
+    critical path, capped at the thread count: what the DAG would allow
+    with perfect scheduling. ``ideal_seconds`` is the matching lower bound
+    on the wall time.
+
+    Args:
+        run_results: Parsed ``run_results.json``.
+        manifest: Parsed ``manifest.json``.
+        threads: Thread count of the run. Defaults to the one recorded in
+            the artifacts, else the number of threads that ran nodes.
+
+    Returns:
+        The run profile.
+    """
+    manifest_nodes = manifest.get('nodes', {})
+    results = run_results.get('results', [])
+    executed = {result['unique_id'] for result in results}
+    invocation_args = run_results.get('args', {})
+
+    nodes: dict[str, NodeTiming] = {}
+    windows: dict[str, tuple[datetime | None, datetime | None]] = {}
+    parents: dict[str, set[str]] = {}
+    for result in results:
+        unique_id = result['unique_id']
+        node = manifest_nodes.get(unique_id, {})
+        start, end = _window(result)
+        windows[unique_id] = (start, end)
+        parents[unique_id] = run_parents(unique_id, executed, manifest)
+        nodes[unique_id] = {
+            'name': node.get('name', unique_id.split('.')[-1]),
+            'resource_type': node.get('resource_type', unique_id.split('.')[0]),
+            'materialized': node.get('config', {}).get('materialized'),
+            'status': result.get('status'),
+            'seconds': round(result.get('execution_time') or 0.0, 3),
+            'thread': result.get('thread_id'),
+            'started_at': start.isoformat() if start else None,
+            'completed_at': end.isoformat() if end else None,
+        }
+
+    starts = [start for start, _ in windows.values() if start is not None]
+    ends = [end for _, end in windows.values() if end is not None]
+    run_start = min(starts) if starts else None
+    for unique_id, (start, _) in windows.items():
+        # Time ready to run but not started: a sign of too few threads
+        parent_ends = [windows[p][1] for p in parents[unique_id] if windows[p][1] is not None]
+        ready = max(parent_ends, default=run_start)
+        nodes[unique_id]['wait_seconds'] = (
+            round(max((start - ready).total_seconds(), 0.0), 3)
+            if start is not None and ready is not None else None
+        )
+
+    elapsed = run_results.get('elapsed_time') or 0.0
+    span = (max(ends) - run_start).total_seconds() if starts and ends else elapsed
+    busy = sum(node['seconds'] for node in nodes.values())
+    if threads is None:
+        threads = invocation_args.get('threads') or len(
+            {node['thread'] for node in nodes.values() if node['thread']}
+        ) or 1
+    path = critical_path({uid: node['seconds'] for uid, node in nodes.items()}, parents)
+
+    return {
+        'version': PROFILE_VERSION,
+        'invocation_id': run_results.get('metadata', {}).get('invocation_id'),
+        'generated_at': run_results.get('metadata', {}).get('generated_at'),
+        'command': invocation_args.get('which'),
+        'full_refresh': bool(invocation_args.get('full_refresh')),
+        'threads': threads,
+        'elapsed_seconds': round(elapsed, 3),
+        'span_seconds': round(span, 3),
+        'busy_seconds': round(busy, 3),
+        'achieved_parallelism': round(busy / span, 2) if span else 0.0,
+        'possible_parallelism': (
+            round(min(threads, busy / path['seconds']), 2) if path['seconds'] else 0.0
+        ),
+        'ideal_seconds': round(max(path['seconds'], busy / threads), 3),
+        'critical_path': path,
+        'nodes': nodes,
+    }
+
+
+def load_history(path: str | Path) -> list[RunProfile]:
+    """
+    Read the profile history, oldest first.
+
+    Args:
+        path: JSONL file with one profile per line.
+
+    Returns:
+        The profiles; unreadable lines are skipped.
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    history: list[RunProfile] = []
+    with open(path) as f:
+        for line in f:
+            try:
+                history.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return history
+
+
+def append_history(profile: RunProfile, path: str | Path) -> bool:
+    """
+    Append a profile to the history, once per dbt invocation.
+
+    Args:
+        profile: Profile to record.
+        path: JSONL history file.
+
+    Returns:
+        True if it was appended, False if the invocation was already there.
+    """
+    path = Path(path)
+    invocation_id = profile['invocation_id']
+    if invocation_id and any(p.get('invocation_id') == invocation_id
+                             for p in load_history(path)):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(profile, default=str) + '\n')
+    return True
+
+
+def previous_profile(history: list[RunProfile], profile: RunProfile) -> RunProfile | None:
+    """
+    Latest earlier run comparable with a profile.
+
+    Runs are comparable when they ran the same command with the same
+    full-refresh setting: a full refresh is expected to be slower than an
+    incremental run.
+
+    Args:
+        history: Profiles, oldest first.
+        profile: Profile to find a baseline for.
+
+    Returns:
+        The baseline, or None if there is none.
+    """
+    for candidate in reversed(history):
+        if (candidate.get('invocation_id') != profile['invocation_id']
+                and candidate.get('command') == profile['command']
+                and candidate.get('full_refresh') == profile['full_refresh']):
+            return candidate
+    return None
+
+
+def compare_profiles(
+    previous: RunProfile,
+    current: RunProfile,
+    threshold: float = 0.25,
+    min_seconds: float = 1.0
+) -> list[Regression]:
+    """
+    Flag timings that got worse by more than a threshold.
+
+    Only nodes that completed in both runs are compared. Durations shorter
+    than ``min_seconds`` in both runs are ignored as noise.
+
+    Args:
+        previous: Baseline run.
+        current: Run to check.
+        threshold: Relative change that counts as a regression (0.25 = 25%).
+        min_seconds: Smallest duration worth comparing.
+
+    Returns:
+        Regressions found, worst first.
+    """
+    regressions: list[Regression] = []
+
+    def check(node: str, metric: str, before: float, after: float) -> None:
+        if not before or max(before, after) < min_seconds:
+            return
+        change = (after - before) / before
+        if change > threshold:
+            regressions.append({
+                'node': node,
+                'metric': metric,
+                'previous': before,
+                'current': after,
+                'change': round(change, 4),
+            })
+
+    for unique_id, after in current['nodes'].items():
+        before = previous['nodes'].get(unique_id)
+        if before is None or before.get('status') not in COMPLETED \
+                or after.get('status') not in COMPLETED:
+            continue
+        check(after['name'], 'seconds', before['seconds'], after['seconds'])
+
+    check('*', 'elapsed_seconds', previous['elapsed_seconds'], current['elapsed_seconds'])
+    check('*', 'critical_path_seconds',
+          previous['critical_path']['seconds'], current['critical_path']['seconds'])
+
+    return sorted(regressions, key=lambda r: abs(r['change']), reverse=True)
+
+
+def print_profile(profile: RunProfile, top: int = 10) -> None:
+    """
+    Print a run profile.
+
+    Args:
+        profile: Output of profile_run.
+        top: Number of slowest nodes to list.
+    """
+    nodes = profile['nodes']
+    mode = ' --full-refresh' if profile['full_refresh'] else ''
+    print(f"dbt {profile['command'] or 'invocation'}{mode}: {len(nodes)} node(s) in "
+          f"{profile['elapsed_seconds']:.1f}s on {profile['threads']} thread(s)")
+    print(f"Parallelism: {profile['achieved_parallelism']:.2f} achieved, "
+          f"{profile['possible_parallelism']:.2f} possible "
+          f"(ideal wall time {profile['ideal_seconds']:.1f}s)")
+
+    slowest = sorted(nodes.values(), key=lambda n: n['seconds'], reverse=True)[:top]
+    if slowest:
+        print("\nSlowest nodes:")
+        for node in slowest:
+            waited = node.get('wait_seconds')
+            line = (f"   {node['name']:<40} {node['seconds']:>9.2f}s  "
+                    f"{node.get('materialized') or node['resource_type']:<12}"
+                    + (f" waited {waited:.2f}s" if waited else ''))
+            print(line.rstrip())
+
+    path = profile['critical_path']
+    if path['nodes']:
+        print(f"\nCritical path ({path['seconds']:.1f}s):")
+        print("   " + ' → '.join(nodes[uid]['name'] for uid in path['nodes']))
+
+    failed = [n['name'] for n in nodes.values() if n['status'] not in COMPLETED]
+    if failed:
+        print(f"\n✗ {len(failed)} node(s) did not complete: {', '.join(failed)}")
+
+
+def print_regressions(regressions: list[Regression], baseline: RunProfile) -> None:
+    """
+    Print the outcome of a profile comparison.
+
+    Args:
+        regressions: Output of compare_profiles.
+        baseline: Run the profile was compared against.
+    """
+    label = f"run {baseline.get('invocation_id')} ({baseline.get('generated_at')})"
+    if not regressions:
+        print(f"✓ No regressions against {label}")
+        return
+    print(f"⚠ {len(regressions)} regression(s) against {label}:")
+    for r in regressions:
+        print(f"   {r['node']} {r['metric']}: {r['previous']:,.2f}s → {r['current']:,.2f}s "
+              f"({r['change']:+.0%})")
+
+
+def main() -> None:
+    """Profile the last dbt invocation from the command line."""
+    parser = argparse.ArgumentParser(description='Profile a dbt run from its artifacts.')
+    parser.add_argument('--target-dir', default='dbt/ecommerce_dw/target',
+                        help='dbt target directory with run_results.json and manifest.json')
+    parser.add_argument('--history', default='data/profiles/dbt_run_history.jsonl',
+                        help='JSONL file profiles are appended to and compared against')
+    parser.add_argument('--threads', type=int, help='Thread count, if not in the artifacts')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative change flagged as a regression (default: 0.25)')
+    parser.add_argument('--top', type=int, default=10, help='Slowest nodes to list')
+    parser.add_argument('--no-history', action='store_true',
+                        help='Compare with the history but do not append to it')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Exit with status 1 if a regression is flagged')
+    args = parser.parse_args()
+
+    try:
+        run_results, manifest = load_artifacts(args.target_dir)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"✗ Cannot read dbt artifacts in {args.target_dir}: {e}")
+        sys.exit(1)
+
+    profile = profile_run(run_results, manifest, args.threads)
+    print_profile(profile, args.top)
+
+    regressions: list[Regression] = []
+    baseline = previous_profile(load_history(args.history), profile)
+    if baseline is not None:
+        regressions = compare_profiles(baseline, profile, threshold=args.threshold)
+        print()
+        print_regressions(regressions, baseline)
+    if not args.no_history and append_history(profile, args.history):
+        print(f"✓ Profile appended to {args.history}")
+
+    sys.exit(1 if args.fail_on_regression and regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
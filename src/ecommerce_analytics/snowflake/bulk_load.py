@@ -0,0 +1,371 @@
+"""
+Stage-and-COPY bulk load path for Snowflake.
+
+CSV files are converted locally to compressed, right-sized Parquet files,
+PUT to an internal stage in parallel and loaded with COPY INTO into a staging
+table created with an explicit schema, which is then swapped into place.
+Parquet files are named after a digest of their source CSV, so unchanged
+files are neither rewritten nor re-uploaded.
+"""
+from __future__ import annotations
+
+import hashlib
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Protocol, TypedDict
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from snowflake.connector import SnowflakeConnection
+
+from ..data_loader.schema import PARSE_OPTIONS
+from .connector import STAGING_SUFFIX, publish_table, staging_is_transient
+
+# Bump when the Parquet layout changes so existing local files are rebuilt.
+PARQUET_FORMAT_VERSION = 1
+
+
+class PhaseTimings(TypedDict):
+    """Seconds spent in each bulk load phase."""
+    write: float
+    put: float
+    copy: float
+
+
+class BulkLoadResult(TypedDict):
+    """Type definition for bulk load results."""
+    table: str
+    rows: int
+    columns: int
+    files: int
+    bytes: int
+    reused_local_files: bool
+    uploaded_files: int
+    uploaded_bytes: int
+    timings: PhaseTimings
+
+
+class StageClient(Protocol):
+    """Operations the bulk loader needs from a stage and its warehouse."""
+
+    def list_files(self, prefix: str) -> set[str]:
+        """Return the names of the files staged under ``prefix``."""
+        ...
+
+    def put(self, paths: list[Path], prefix: str, parallel: int) -> None:
+        """Upload local files to the stage under ``prefix``."""
+        ...
+
+    def create_staging_table(
+        self, staging_table: str, table_name: str, columns: list[tuple[str, str]]
+    ) -> None:
+        """Create or replace ``staging_table``, of the same kind as ``table_name``."""
+        ...
+
+    def copy_into(self, table_name: str, prefix: str, files: list[str]) -> int:
+        """Load staged Parquet files into ``table_name`` and return the rows loaded."""
+        ...
+
+    def publish(self, staging_table: str, table_name: str) -> None:
+        """Atomically replace ``table_name`` with ``staging_table``."""
+        ...
+
+
+def snowflake_type(data_type: pa.DataType) -> str:
+    """
+    Map an Arrow type to the Snowflake column type used for it.
+
+    Args:
+        data_type: Arrow data type of a Parquet column.
+
+    Returns:
+        Snowflake type name.
+    """
+    if pa.types.is_boolean(data_type):
+        return 'BOOLEAN'
+    if pa.types.is_integer(data_type):
+        return 'NUMBER(38, 0)'
+    if pa.types.is_floating(data_type):
+        return 'FLOAT'
+    if pa.types.is_decimal(data_type):
+        return f'NUMBER({data_type.precision}, {data_type.scale})'
+    if pa.types.is_timestamp(data_type):
+        return 'TIMESTAMP_NTZ' if data_type.tz is None else 'TIMESTAMP_TZ'
+    if pa.types.is_date(data_type):
+        return 'DATE'
+    return 'VARCHAR'
+
+
+class SnowflakeStageClient:
+    """StageClient backed by a Snowflake internal stage."""
+
+    def __init__(self, conn: SnowflakeConnection, stage: str = 'BULK_LOAD_STAGE') -> None:
+        """
+        Initialize the stage client, creating the stage if needed.
+
+        Args:
+            conn: Open Snowflake connection; its schema holds stage and tables.
+            stage: Internal stage name.
+        """
+        self.conn: SnowflakeConnection = conn
+        self.stage: str = stage
+        self._execute(f"CREATE STAGE IF NOT EXISTS {stage} FILE_FORMAT = (TYPE = PARQUET)")
+
+    def _execute(self, query: str) -> list[tuple]:
+        cur = self.conn.cursor()
+        try:
+            cur.execute(query)
+            return cur.fetchall()
+        finally:
+            cur.close()
+
+    def list_files(self, prefix: str) -> set[str]:
+        # LIST returns paths relative to the stage root, e.g. stage/prefix/file
+        return {Path(row[0]).name for row in self._execute(f"LIST @{self.stage}/{prefix}/")}
+
+    def put(self, paths: list[Path], prefix: str, parallel: int) -> None:
+        # Parquet pages are already compressed; don't gzip them again.
+        directories = {path.parent for path in paths}
+        if len(directories) == 1 and len(paths) > 1:
+            # One PUT uploads the matching files concurrently
+            sources = [f"{directories.pop().as_posix()}/*.parquet"]
+        else:
+            sources = [path.as_posix() for path in paths]
+        for source in sources:
+            self._execute(
+                f"PUT 'file://{source}' @{self.stage}/{prefix}/ "
+                f"PARALLEL = {parallel} AUTO_COMPRESS = FALSE OVERWRITE = FALSE"
+            )
+
+    def create_staging_table(
+        self, staging_table: str, table_name: str, columns: list[tuple[str, str]]
+    ) -> None:
+        # The staging table is swapped into place, so it keeps the target's kind
+        kind = 'TRANSIENT TABLE' if staging_is_transient(self.conn, table_name, True) else 'TABLE'
+        column_defs = ',\n    '.join(f'"{name}" {col_type}' for name, col_type in columns)
+        self._execute(f"CREATE OR REPLACE {kind} {staging_table} (\n    {column_defs}\n)")
+
+    def copy_into(self, table_name: str, prefix: str, files: list[str]) -> int:
+        file_list = ', '.join(f"'{name}'" for name in files)
+        rows = self._execute(f"""
+            COPY INTO {table_name}
+            FROM @{self.stage}/{prefix}/
+            FILES = ({file_list})
+            FILE_FORMAT = (TYPE = PARQUET)
+            MATCH_BY_COLUMN_NAME = CASE_SENSITIVE
+            FORCE = TRUE
+        """)
+        # One result row per file: (file, status, rows_parsed, rows_loaded, ...)
+        return sum(int(row[3]) for row in rows if len(row) > 3)
+
+    def publish(self, staging_table: str, table_name: str) -> None:
+        publish_table(self.conn, staging_table, table_name)
+
+
+class LocalStageClient:
+    """StageClient backed by a local directory, for tests and dry runs.
+
+    Staged files are copied under ``root``; "tables" are Arrow tables kept
+    in ``self.tables``.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root: Path = Path(root)
+        self.schemas: dict[str, list[tuple[str, str]]] = {}
+        self.tables: dict[str, pa.Table] = {}
+        self.put_calls: int = 0
+
+    def list_files(self, prefix: str) -> set[str]:
+        directory = self.root / prefix
+        return {path.name for path in directory.iterdir()} if directory.exists() else set()
+
+    def put(self, paths: list[Path], prefix: str, parallel: int) -> None:
+        self.put_calls += 1
+        directory = self.root / prefix
+        directory.mkdir(parents=True, exist_ok=True)
+        for path in paths:
+            shutil.copyfile(path, directory / path.name)
+
+    def create_staging_table(
+        self, staging_table: str, table_name: str, columns: list[tuple[str, str]]
+    ) -> None:
+        self.schemas[staging_table] = columns
+        self.tables.pop(staging_table, None)
+
+    def copy_into(self, table_name: str, prefix: str, files: list[str]) -> int:
+        names = [name for name, _ in self.schemas[table_name]]
+        loaded = [pq.read_table(self.root / prefix / name).select(names) for name in files]
+        self.tables[table_name] = pa.concat_tables(loaded)
+        return self.tables[table_name].num_rows
+
+    def publish(self, staging_table: str, table_name: str) -> None:
+        self.schemas[table_name] = self.schemas.pop(staging_table)
+        self.tables[table_name] = self.tables.pop(staging_table)
+
+
+class BulkLoader:
+    """Load CSV files through local Parquet files and a stage."""
+
+    def __init__(
+        self,
+        stage: StageClient,
+        work_dir: str | Path = 'data/parquet',
+        target_file_mb: float = 128,
+        put_parallel: int = 8
+    ) -> None:
+        """
+        Initialize the bulk loader.
+
+        Args:
+            stage: Stage client used to upload files and run DDL/COPY.
+            work_dir: Local directory for the Parquet files.
+            target_file_mb: Target uncompressed size of each Parquet file.
+                Snowflake loads files in parallel, one per thread, so large
+                tables are split rather than written as one file.
+            put_parallel: Upload threads used by PUT.
+        """
+        self.stage: StageClient = stage
+        self.work_dir: Path = Path(work_dir)
+        self.target_file_bytes: int = int(target_file_mb * 1024 * 1024)
+        self.put_parallel: int = put_parallel
+
+    def load_csv(
+        self,
+        csv_path: str | Path,
+        table_name: str,
+        column_types: dict[str, pa.DataType] | None = None,
+        columns: list[tuple[str, str]] | None = None
+    ) -> BulkLoadResult:
+        """
+        Load one CSV file into a table, replacing it.
+
+        The files are copied into a staging table that is then swapped with
+        the target, so a failed COPY leaves the current table untouched.
+
+        Args:
+            csv_path: Source CSV file.
+            table_name: Target Snowflake table name.
+            column_types: Arrow types to parse the CSV with. Inferred if None.
+            columns: Explicit (column, Snowflake type) table definition. If
+                None, it is derived from the Parquet schema.
+
+        Returns:
+            Rows loaded, file counts and per-phase timings.
+        """
+        csv_path = Path(csv_path)
+        table_name = table_name.upper()
+        digest = self._source_digest(csv_path, column_types)
+        prefix = f"{table_name.lower()}/{digest}"
+
+        started = time.perf_counter()
+        parquet_dir = self.work_dir / table_name.lower() / digest
+        reused = parquet_dir.exists()
+        if not reused:
+            self._write_parquet(csv_path, parquet_dir, column_types)
+            # Files from older versions of the CSV are no longer needed
+            for old_dir in parquet_dir.parent.iterdir():
+                if old_dir != parquet_dir and not old_dir.name.startswith('.'):
+                    shutil.rmtree(old_dir, ignore_errors=True)
+        files = sorted(parquet_dir.glob('*.parquet'))
+        write_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        staged = self.stage.list_files(prefix)
+        to_upload = [path for path in files if path.name not in staged]
+        if to_upload:
+            self.stage.put(to_upload, prefix, self.put_parallel)
+        put_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if columns is None:
+            columns = [(field.name, snowflake_type(field.type)) for field in pq.read_schema(files[0])]
+        staging_table = f"{table_name}{STAGING_SUFFIX}"
+        self.stage.create_staging_table(staging_table, table_name, columns)
+        rows = self.stage.copy_into(staging_table, prefix, [path.name for path in files])
+        self.stage.publish(staging_table, table_name)
+        copy_seconds = time.perf_counter() - started
+
+        print(
+            f"✓ Bulk loaded {rows:,} rows to {table_name} from {len(files)} file(s) "
+            f"(write {write_seconds:.1f}s{' reused' if reused else ''}, "
+            f"put {put_seconds:.1f}s, copy {copy_seconds:.1f}s)"
+        )
+
+        return {
+            'table': table_name,
+            'rows': rows,
+            'columns': len(columns),
+            'files': len(files),
+            'bytes': sum(path.stat().st_size for path in files),
+            'reused_local_files': reused,
+            'uploaded_files': len(to_upload),
+            'uploaded_bytes': sum(path.stat().st_size for path in to_upload),
+            'timings': {'write': write_seconds, 'put': put_seconds, 'copy': copy_seconds},
+        }
+
+    def _source_digest(
+        self,
+        csv_path: Path,
+        column_types: dict[str, pa.DataType] | None = None
+    ) -> str:
+        """
+        Digest of the CSV contents and the Parquet layout settings.
+
+        Args:
+            csv_path: Source CSV file.
+            column_types: Arrow types the CSV is parsed with.
+
+        Returns:
+            Hex digest used to name the Parquet files.
+        """
+        types = sorted((name, str(t)) for name, t in (column_types or {}).items())
+        sha = hashlib.sha256(
+            f"{PARQUET_FORMAT_VERSION}:{self.target_file_bytes}:{types}:".encode()
+        )
+        with open(csv_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(block)
+        return sha.hexdigest()[:16]
+
+    def _write_parquet(
+        self,
+        csv_path: Path,
+        parquet_dir: Path,
+        column_types: dict[str, pa.DataType] | None = None
+    ) -> None:
+        """
+        Convert a CSV to Parquet files of roughly target_file_bytes each.
+
+        Files are written to a temporary directory that is renamed into
+        place, so an interrupted run never leaves a partial set behind.
+
+        Args:
+            csv_path: Source CSV file.
+            parquet_dir: Destination directory for the Parquet files.
+            column_types: Arrow types to parse the CSV with.
+        """
+        table = pa_csv.read_csv(
+            csv_path,
+            parse_options=PARSE_OPTIONS,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types, strings_can_be_null=True
+            )
+        )
+        rows_per_file = max(1, int(self.target_file_bytes * table.num_rows / max(table.nbytes, 1)))
+
+        parquet_dir.parent.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(dir=parquet_dir.parent, prefix='.tmp-'))
+        try:
+            for i, offset in enumerate(range(0, max(table.num_rows, 1), rows_per_file)):
+                pq.write_table(
+                    table.slice(offset, rows_per_file),
+                    tmp_dir / f"{parquet_dir.name}-{i:04d}.parquet",
+                    compression='snappy'
+                )
+            tmp_dir.rename(parquet_dir)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
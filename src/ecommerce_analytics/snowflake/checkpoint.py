@@ -0,0 +1,90 @@
+"""
+Per-chunk checkpoints that let an interrupted table load resume.
+"""
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CHECKPOINT_VERSION = 1
+
+
+class LoadCheckpoint:
+    """Progress of one chunked load into a staging table, saved as JSON.
+
+    A checkpoint only resumes a load of the same source read with the same
+    chunk size, so that chunk ``i`` holds the same rows in both runs. A
+    checkpoint for a different source is discarded.
+    """
+
+    def __init__(self, path: str | Path, source: str, chunk_rows: int) -> None:
+        """
+        Open the checkpoint, picking up a previous run of the same source.
+
+        Args:
+            path: Location of the checkpoint JSON file.
+            source: Fingerprint of what is loaded (e.g. file digest and mode).
+            chunk_rows: Rows per chunk for a fresh load. A resumed load keeps
+                the chunk size it was started with; see ``chunk_rows``.
+        """
+        self.path: Path = Path(path)
+        self.source: str = source
+        self.chunk_rows: int = chunk_rows
+        self.completed: int = 0
+        self.rows: int = 0
+
+        if self.path.exists():
+            with open(self.path) as f:
+                data: dict[str, Any] = json.load(f)
+            if data.get('version') == CHECKPOINT_VERSION and data.get('source') == source:
+                self.chunk_rows = data['chunk_rows']
+                self.completed = data['completed']
+                self.rows = data['rows']
+
+    @property
+    def resuming(self) -> bool:
+        """Whether chunks of a previous run are already loaded."""
+        return self.completed > 0
+
+    def record(self, chunk: int, rows: int) -> None:
+        """
+        Mark a chunk as loaded and save.
+
+        Args:
+            chunk: Index of the chunk; chunks are recorded in order.
+            rows: Rows the chunk loaded.
+        """
+        self.completed = chunk + 1
+        self.rows += rows
+        self._save()
+
+    def reset(self) -> None:
+        """Forget all progress, e.g. when the staging table is gone."""
+        self.completed = 0
+        self.rows = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove the checkpoint file after the load was published."""
+        self.path.unlink(missing_ok=True)
+
+    def _save(self) -> None:
+        """Write the checkpoint atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix='.checkpoint-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    'version': CHECKPOINT_VERSION,
+                    'source': self.source,
+                    'chunk_rows': self.chunk_rows,
+                    'completed': self.completed,
+                    'rows': self.rows,
+                }, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
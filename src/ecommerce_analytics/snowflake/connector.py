@@ -4,8 +4,9 @@ Snowflake connection utility for E-Commerce Analytics Platform
 from __future__ import annotations
 
 import os
+import time
 from contextlib import contextmanager
-from typing import Any, Generator, Literal
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Literal
 
 import pandas as pd
 import snowflake.connector
@@ -14,15 +15,154 @@ from cryptography.hazmat.primitives import serialization
 from dotenv import load_dotenv
 from snowflake.connector import SnowflakeConnection
 
+if TYPE_CHECKING:
+    from ecommerce_analytics.snowflake.checkpoint import LoadCheckpoint
+
 # Load environment variables
 load_dotenv()
 
 os.environ['SF_OCSP_FAIL_OPEN'] = 'true'
 
+# Suffix of the table a load is staged in before it is published
+STAGING_SUFFIX = '__LOADING'
+# Column tagging staged rows with their chunk, so a failed chunk can be removed
+CHUNK_COLUMN = '_load_chunk'
+
+
+def _execute(
+    conn: SnowflakeConnection,
+    query: str,
+    params: dict[str, Any] | None = None
+) -> list[tuple[Any, ...]]:
+    """Run one statement on its own cursor and return its rows."""
+    cur = conn.cursor()
+    try:
+        cur.execute(query, params or {})
+        return cur.fetchall()
+    finally:
+        cur.close()
+
+
+def table_exists(conn: SnowflakeConnection, table_name: str) -> bool:
+    """
+    Check whether a table exists in the connection's current schema.
+
+    Args:
+        conn: Open Snowflake connection.
+        table_name: Table name.
+
+    Returns:
+        True if the table exists.
+    """
+    rows = _execute(conn, """
+        SELECT COUNT(*) FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = CURRENT_SCHEMA() AND TABLE_NAME = %(table)s
+    """, {'table': table_name.upper()})
+    return bool(rows and rows[0][0])
+
+
+def table_is_transient(conn: SnowflakeConnection, table_name: str) -> bool | None:
+    """
+    Check whether a table in the connection's current schema is transient.
+
+    Args:
+        conn: Open Snowflake connection.
+        table_name: Table name.
+
+    Returns:
+        True or False for an existing table, None if it does not exist.
+    """
+    rows = _execute(conn, """
+        SELECT IS_TRANSIENT FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = CURRENT_SCHEMA() AND TABLE_NAME = %(table)s
+    """, {'table': table_name.upper()})
+    if not rows:
+        return None
+    return rows[0][0] == 'YES'
+
+
+def staging_is_transient(conn: SnowflakeConnection, table_name: str, replace: bool) -> bool:
+    """
+    Decide whether the staging table of a load can be transient.
+
+    On a replace or a first load the staging table is swapped or renamed
+    into place, so it must be of the target's kind; a new target is
+    permanent, like the tables write_pandas creates. When appending, the
+    staging table is dropped after the insert and only buffers the load.
+
+    Args:
+        conn: Open Snowflake connection.
+        table_name: Target table name.
+        replace: Whether the load replaces the target.
+
+    Returns:
+        True if the staging table should be transient.
+    """
+    transient = table_is_transient(conn, table_name)
+    if transient is None:
+        return False
+    return transient or not replace
+
+
+def copied_bytes(conn: SnowflakeConnection, table_name: str, since: Any) -> int | None:
+    """
+    Sum the size of the files copied into a table since a point in time.
+
+    write_pandas does not report what it uploads, but every file it PUTs
+    is copied into the table and recorded in COPY_HISTORY.
+
+    Args:
+        conn: Open Snowflake connection.
+        table_name: Table the files were copied into.
+        since: Server timestamp the load started at.
+
+    Returns:
+        Bytes of the staged (compressed) files, or None if the history
+        cannot be read.
+    """
+    try:
+        rows = _execute(conn, """
+            SELECT COALESCE(SUM(FILE_SIZE), 0)
+            FROM TABLE(INFORMATION_SCHEMA.COPY_HISTORY(
+                TABLE_NAME => %(table)s, START_TIME => %(since)s
+            ))
+        """, {'table': table_name.upper(), 'since': since})
+    except Exception as e:
+        print(f"⚠ Cannot read the copy history of {table_name}: {e}")
+        return None
+    return int(rows[0][0]) if rows else None
+
+
+def publish_table(conn: SnowflakeConnection, staging_table: str, table_name: str) -> None:
+    """
+    Replace a table with a fully loaded staging table.
+
+    ALTER TABLE ... SWAP WITH exchanges the two tables in one metadata
+    operation, so readers see either the old or the new contents. The old
+    contents end up in the staging table, which is then dropped. If the
+    target does not exist yet, the staging table is renamed instead.
+
+    Args:
+        conn: Open Snowflake connection.
+        staging_table: Loaded staging table.
+        table_name: Table to replace.
+    """
+    if not table_exists(conn, table_name):
+        _execute(conn, f'ALTER TABLE "{staging_table}" RENAME TO "{table_name}"')
+        return
+    _execute(conn, f'ALTER TABLE "{table_name}" SWAP WITH "{staging_table}"')
+    _execute(conn, f'DROP TABLE "{staging_table}"')
+
 
 class SnowflakeConnector:
     """Manages Snowflake connections for the e-commerce analytics platform."""
 
+    # Retries of a failed chunk; the wait doubles from RETRY_BACKOFF_SECONDS
+    CHUNK_RETRIES: int = 3
+    RETRY_BACKOFF_SECONDS: float = 1.0
+    # Rows per staged chunk when loading a whole DataFrame
+    DATAFRAME_CHUNK_ROWS: int = 500_000
+
     def __init__(self, use_key_auth: bool = True) -> None:
         """
         Initialize the Snowflake connector.
@@ -148,34 +288,252 @@ class SnowflakeConnector:
             cur.close()
             return results
 
+    def create_table(
+        self,
+        conn: SnowflakeConnection,
+        table_name: str,
+        columns: list[tuple[str, str]],
+        replace: bool = True,
+        transient: bool = False
+    ) -> None:
+        """
+        Create a table from explicit column definitions.
+
+        Column names are quoted, matching the identifiers write_pandas uses.
+
+        Args:
+            conn: Open Snowflake connection.
+            table_name: Table name.
+            columns: List of (column name, Snowflake type).
+            replace: If True, replace an existing table; otherwise keep it.
+            transient: If True, create a transient table (no Fail-safe).
+        """
+        column_defs = ', '.join(f'"{name}" {col_type}' for name, col_type in columns)
+        kind = 'TRANSIENT TABLE' if transient else 'TABLE'
+        create = f'CREATE OR REPLACE {kind}' if replace else f'CREATE {kind} IF NOT EXISTS'
+        _execute(conn, f'{create} "{table_name.upper()}" ({column_defs})')
+
+    def _write_chunk(
+        self,
+        conn: SnowflakeConnection,
+        df: pd.DataFrame,
+        table_name: str,
+        chunk: int,
+        create: bool,
+        transient: bool = False
+    ) -> tuple[bool, int]:
+        """
+        Write one tagged chunk to a staging table, retrying with backoff.
+
+        Before a retry the rows of the chunk are deleted, so a chunk that
+        was copied but reported as failed is not loaded twice.
+
+        Args:
+            conn: Open Snowflake connection.
+            df: Chunk, including the CHUNK_COLUMN tag.
+            table_name: Staging table name.
+            chunk: Index of the chunk.
+            create: If True, write_pandas creates the staging table from
+                the chunk's dtypes.
+            transient: Create the staging table as a transient table.
+
+        Returns:
+            Tuple of (success, rows loaded).
+        """
+        from snowflake.connector.pandas_tools import write_pandas
+
+        for attempt in range(self.CHUNK_RETRIES + 1):
+            try:
+                if attempt:
+                    delay = self.RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+                    print(f"⚠ Retrying chunk {chunk + 1} of {table_name} in {delay:.0f}s "
+                          f"(attempt {attempt + 1}/{self.CHUNK_RETRIES + 1})")
+                    time.sleep(delay)
+                    if not create:
+                        _execute(
+                            conn,
+                            f'DELETE FROM "{table_name}" WHERE "{CHUNK_COLUMN}" = %(chunk)s',
+                            {'chunk': chunk}
+                        )
+                success, _, nrows, _ = write_pandas(
+                    conn=conn,
+                    df=df,
+                    table_name=table_name,
+                    auto_create_table=create,
+                    overwrite=create,
+                    table_type='transient' if transient else '',
+                    use_logical_type=True
+                )
+                if success:
+                    return True, nrows
+            except Exception as e:
+                print(f"⚠ Chunk {chunk + 1} of {table_name} failed: {e}")
+        return False, 0
+
+    def _publish(
+        self,
+        conn: SnowflakeConnection,
+        staging_table: str,
+        table_name: str,
+        columns: list[str],
+        replace: bool
+    ) -> None:
+        """
+        Move a fully loaded staging table into place in one statement.
+
+        Args:
+            conn: Open Snowflake connection.
+            staging_table: Loaded staging table; dropped afterwards.
+            table_name: Target table name.
+            columns: Columns to copy when appending.
+            replace: Replace the target (SWAP) instead of appending to it.
+        """
+        _execute(conn, f'ALTER TABLE "{staging_table}" DROP COLUMN "{CHUNK_COLUMN}"')
+        if replace or not table_exists(conn, table_name):
+            publish_table(conn, staging_table, table_name)
+            return
+        column_list = ', '.join(f'"{name}"' for name in columns)
+        _execute(
+            conn,
+            f'INSERT INTO "{table_name}" ({column_list}) '
+            f'SELECT {column_list} FROM "{staging_table}"'
+        )
+        _execute(conn, f'DROP TABLE "{staging_table}"')
+
+    def _load_atomically(
+        self,
+        conn: SnowflakeConnection,
+        chunks: Iterable[pd.DataFrame],
+        table_name: str,
+        if_exists: Literal['replace', 'append'],
+        columns: list[tuple[str, str]] | None = None,
+        checkpoint: LoadCheckpoint | None = None,
+        stats: dict[str, Any] | None = None
+    ) -> tuple[bool, int]:
+        """
+        Load chunks into a staging table, then publish it in one statement.
+
+        Chunks go to a ``<TABLE>__LOADING`` table of the target's kind (see
+        staging_is_transient), each tagged
+        with its index in CHUNK_COLUMN. Failed chunks are retried with
+        exponential backoff. Once all chunks are in, the staging table is
+        swapped with the target (replace) or inserted into it (append), so
+        readers never see a partially loaded table.
+
+        With a checkpoint, each loaded chunk is recorded. If the load
+        fails, the staging table is kept; the next load of the same source
+        skips the recorded chunks and continues with the first missing one.
+
+        Args:
+            conn: Open Snowflake connection.
+            chunks: DataFrames with identical columns, in a stable order.
+            table_name: Target table name.
+            if_exists: Behavior if table exists ('replace' or 'append').
+            columns: Explicit (column, Snowflake type) table definition. If
+                None, the table is created from the first chunk's dtypes.
+            checkpoint: Progress record used to resume a failed load.
+            stats: If given, receives ``bytes_uploaded`` of a successful
+                load (chunks staged by this call only), at the cost of two
+                extra metadata queries.
+
+        Returns:
+            Tuple of (success, rows loaded, including resumed chunks).
+        """
+        table_name = table_name.upper()
+        staging_table = f"{table_name}{STAGING_SUFFIX}"
+        start, total_rows = 0, 0
+        started_at = None
+        if stats is not None:
+            started_at = _execute(conn, 'SELECT CURRENT_TIMESTAMP()')[0][0]
+
+        transient = staging_is_transient(conn, table_name, if_exists == 'replace')
+
+        if checkpoint is not None and checkpoint.resuming:
+            # A staging table of the wrong kind (e.g. left by an older
+            # version) is rebuilt rather than published
+            if table_is_transient(conn, staging_table) == transient:
+                # Rows of a chunk that was copied but never recorded
+                _execute(
+                    conn,
+                    f'DELETE FROM "{staging_table}" WHERE "{CHUNK_COLUMN}" >= %(chunk)s',
+                    {'chunk': checkpoint.completed}
+                )
+                start, total_rows = checkpoint.completed, checkpoint.rows
+                print(f"↻ Resuming {table_name} at chunk {start + 1} "
+                      f"({total_rows:,} rows already staged)")
+            else:
+                checkpoint.reset()
+
+        if start == 0 and columns is not None:
+            self.create_table(
+                conn, staging_table, columns + [(CHUNK_COLUMN, 'NUMBER(10, 0)')],
+                transient=transient
+            )
+
+        names = [name for name, _ in columns] if columns is not None else []
+        loaded = start > 0 or columns is not None
+        for i, df in enumerate(chunks):
+            if i < start:
+                continue
+            names = names or list(df.columns)
+            success, nrows = self._write_chunk(
+                conn, df.assign(**{CHUNK_COLUMN: i}), staging_table, i,
+                create=(i == 0 and columns is None), transient=transient
+            )
+            if not success:
+                print(f"✗ Failed to load chunk {i + 1} of {table_name}; "
+                      f"{'it will resume from here' if checkpoint else 'load abandoned'}")
+                return False, total_rows
+            loaded = True
+            total_rows += nrows
+            if checkpoint is not None:
+                checkpoint.record(i, nrows)
+
+        if stats is not None and loaded:
+            stats['bytes_uploaded'] = copied_bytes(conn, staging_table, started_at)
+        if loaded:
+            self._publish(conn, staging_table, table_name, names, if_exists == 'replace')
+        if checkpoint is not None:
+            checkpoint.clear()
+        return True, total_rows
+
     def load_csv_to_snowflake(
         self,
         df: pd.DataFrame,
         table_name: str,
         schema: str | None = None,
-        if_exists: Literal['replace', 'append'] = 'replace'
+        if_exists: Literal['replace', 'append'] = 'replace',
+        columns: list[tuple[str, str]] | None = None,
+        checkpoint: LoadCheckpoint | None = None,
+        stats: dict[str, Any] | None = None
     ) -> bool:
         """
         Load a pandas DataFrame to Snowflake.
 
+        The DataFrame is uploaded in chunks of ``checkpoint.chunk_rows`` (or
+        DATAFRAME_CHUNK_ROWS) rows to a staging table and published
+        atomically; see _load_atomically.
+
         Args:
             df: DataFrame to load.
             table_name: Target table name.
             schema: Target schema. Defaults to instance schema.
             if_exists: Behavior if table exists ('replace' or 'append').
+            columns: Explicit (column, Snowflake type) table definition. If
+                None, the table is created from the DataFrame's dtypes.
+            checkpoint: Progress record used to resume a failed load.
+            stats: If given, receives ``bytes_uploaded``; see
+                _load_atomically.
 
         Returns:
             True if load was successful, False otherwise.
         """
-        from snowflake.connector.pandas_tools import write_pandas
+        chunk_rows = checkpoint.chunk_rows if checkpoint else self.DATAFRAME_CHUNK_ROWS
+        chunks = (df.iloc[i:i + chunk_rows] for i in range(0, max(len(df), 1), chunk_rows))
 
         with self.connection(schema=schema) as conn:
-            success, nchunks, nrows, _ = write_pandas(
-                conn=conn,
-                df=df,
-                table_name=table_name.upper(),
-                auto_create_table=True,
-                overwrite=(if_exists == 'replace')
+            success, nrows = self._load_atomically(
+                conn, chunks, table_name, if_exists, columns, checkpoint, stats
             )
 
             if success:
@@ -185,6 +543,48 @@ class SnowflakeConnector:
 
             return success
 
+    def load_chunks_to_snowflake(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        table_name: str,
+        schema: str | None = None,
+        if_exists: Literal['replace', 'append'] = 'replace',
+        columns: list[tuple[str, str]] | None = None,
+        checkpoint: LoadCheckpoint | None = None,
+        stats: dict[str, Any] | None = None
+    ) -> tuple[bool, int]:
+        """
+        Load a stream of DataFrames into one table over a single connection.
+
+        Chunks are pulled from ``chunks`` one at a time and uploaded before
+        the next is read, so only one chunk is held in memory. They are
+        staged and published atomically; see _load_atomically.
+
+        Args:
+            chunks: DataFrames with identical columns, e.g. a chunked read_csv.
+            table_name: Target table name.
+            schema: Target schema. Defaults to instance schema.
+            if_exists: Behavior if table exists ('replace' or 'append').
+            columns: Explicit (column, Snowflake type) table definition. If
+                None, the table is created from the first chunk's dtypes.
+            checkpoint: Progress record used to resume a failed load. The
+                chunks must be read with ``checkpoint.chunk_rows`` rows.
+            stats: If given, receives ``bytes_uploaded``; see
+                _load_atomically.
+
+        Returns:
+            Tuple of (success, rows loaded). Loading stops at the first
+            chunk that still fails after retries.
+        """
+        with self.connection(schema=schema) as conn:
+            success, total_rows = self._load_atomically(
+                conn, chunks, table_name, if_exists, columns, checkpoint, stats
+            )
+
+        if success:
+            print(f"✓ Loaded {total_rows} rows to {table_name}")
+        return success, total_rows
+
     def test_connection(self) -> bool:
         """
         Test the connection and print details.
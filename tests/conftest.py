@@ -1,10 +1,19 @@
 """
 Pytest configuration and fixtures for e-commerce analytics tests.
 """
+import sys
+from pathlib import Path
+
 import pytest
 from unittest.mock import MagicMock, patch
 import pandas as pd
 
+# The API modules import each other as top-level modules (uvicorn runs from
+# api/), so the API tests need api/ on the path.
+API_DIR = Path(__file__).parent.parent / 'api'
+if str(API_DIR) not in sys.path:
+    sys.path.append(str(API_DIR))
+
 
 @pytest.fixture
 def mock_snowflake_connection():
@@ -46,3 +55,68 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv('SNOWFLAKE_DATABASE_PROD', 'ECOMMERCE_PROD')
     monkeypatch.setenv('SNOWFLAKE_SCHEMA', 'RAW')
     monkeypatch.setenv('SNOWFLAKE_ROLE', 'ACCOUNTADMIN')
+
+
+@pytest.fixture
+def dashboard_replica(tmp_path, monkeypatch):
+    """Serve the dashboard queries from a small DuckDB Parquet replica."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    import database
+    from local_backend import DuckDBBackend, replica_path
+
+    dates = [pd.Timestamp('2017-06-03').date(), pd.Timestamp('2018-02-10').date()]
+    months = [pd.Timestamp('2017-06-01').date(), pd.Timestamp('2018-02-01').date()]
+    tables = {
+        ('MARTS', 'FCT_ORDERS'): pa.table({
+            'ORDER_ID': ['o1', 'o2'],
+            'CUSTOMER_UNIQUE_ID': ['u1', 'u2'],
+            'CUSTOMER_STATE': ['SP', 'RJ'],
+            'ORDER_STATUS': ['delivered', 'delivered'],
+            'PRIMARY_PAYMENT_TYPE': ['credit_card', 'boleto'],
+            'ORDER_DATE': dates,
+            'ORDER_MONTH': months,
+        }),
+        ('MARTS', 'AGG_ORDERS_DAILY'): pa.table({
+            'ORDER_DATE': dates,
+            'ORDER_MONTH': months,
+            'ORDER_STATUS': ['delivered', 'delivered'],
+            'CUSTOMER_STATE': ['SP', 'RJ'],
+            'PRIMARY_PAYMENT_TYPE': ['credit_card', 'boleto'],
+            'REVIEW_BUCKET': [5, 4],
+            'ORDERS': [1, 1],
+            'ITEMS': [2, 1],
+            'REVENUE': [100.0, 50.0],
+            'PAYMENT_VALUE': [110.0, 55.0],
+            'REVIEW_SCORE_SUM': [5.0, 4.0],
+            'REVIEWED_ORDERS': [1, 1],
+            'ON_TIME_ORDERS': [1, 0],
+            'LATE_DELIVERIES': [0, 1],
+            'DELIVERY_DAYS_SUM': [7, 12],
+            'DELIVERED_WITH_DAYS': [1, 1],
+        }),
+        ('MARTS', 'DIM_PRODUCTS'): pa.table({
+            'PRODUCT_ID': ['p1'], 'CATEGORY': ['toys'], 'TOTAL_REVENUE': [150.0],
+            'TOTAL_ORDERS': [2], 'AVG_PRICE': [50.0], 'AVG_REVIEW_SCORE': [4.5],
+        }),
+        ('MARTS', 'DIM_SELLERS'): pa.table({'SELLER_ID': ['s1'], 'TOTAL_ORDERS': [2]}),
+        ('MARTS', 'DIM_CUSTOMERS'): pa.table({
+            'ENGAGEMENT_TIER': ['low', 'low'], 'LIFETIME_VALUE': [100.0, 50.0],
+            'AVG_ORDER_VALUE': [100.0, 50.0],
+        }),
+        ('MARTS', 'TOP_SELLERS'): pa.table({
+            'REVENUE_RANK': [1], 'SELLER_ID': ['s1'], 'CITY': ['sao paulo'], 'STATE': ['SP'],
+            'TOTAL_REVENUE': [150.0], 'TOTAL_ORDERS': [2], 'AVG_REVIEW_SCORE': [4.5],
+            'FULFILLMENT_RATE': [100.0],
+        }),
+    }
+    for (schema, table), data in tables.items():
+        path = Path(replica_path(str(tmp_path), schema, table))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(data, path)
+
+    backend = DuckDBBackend(str(tmp_path))
+    monkeypatch.setattr(database, 'get_backend', lambda: backend)
+    yield backend
+    backend.close()
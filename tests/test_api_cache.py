@@ -0,0 +1,98 @@
+"""
+Unit tests for the stale-while-revalidate dashboard cache.
+"""
+import threading
+import time
+from datetime import datetime, timezone
+
+
+def _wait_for_refresh(cache, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while cache.stats()['inflight'] and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert not cache.stats()['inflight']
+
+
+class TestStaleWhileRevalidateCache:
+    """Tests for StaleWhileRevalidateCache."""
+
+    def test_concurrent_misses_share_one_load(self):
+        """Test simultaneous misses of one key reach the loader once."""
+        from cache import StaleWhileRevalidateCache
+
+        cache = StaleWhileRevalidateCache(ttl=60, max_staleness=120)
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            release.wait(5)
+            return 'payload'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load('k', loader)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while cache.stats()['misses'] + cache.stats()['coalesced'] < 8:
+            assert time.monotonic() < deadline
+            time.sleep(0.005)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ['payload'] * 8
+        assert len(calls) == 1
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['coalesced'] == 7
+
+    def test_stale_value_served_while_refreshing(self):
+        """Test expired values are served immediately while one refresh runs."""
+        from cache import StaleWhileRevalidateCache
+
+        cache = StaleWhileRevalidateCache(ttl=0.01, max_staleness=60)
+        cache.get_or_load('k', lambda: 'old')
+        time.sleep(0.02)
+
+        release = threading.Event()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            release.wait(5)
+            return 'new'
+
+        assert cache.get_or_load('k', slow_loader) == 'old'
+        assert cache.get_or_load('k', slow_loader) == 'old'
+        release.set()
+        _wait_for_refresh(cache)
+
+        assert len(calls) == 1
+        assert cache.get_or_load('k', slow_loader) == 'new'
+        assert cache.stats()['stale'] == 2
+        assert cache.stats()['refreshes'] == 1
+
+    def test_unchanged_refresh_keeps_last_modified(self):
+        """Test a refresh with the same body keeps the cached payload and its timestamp."""
+        from cache import StaleWhileRevalidateCache
+        from responses import EncodedPayload
+
+        cache = StaleWhileRevalidateCache(
+            ttl=0.01, max_staleness=60, unchanged=lambda old, new: old.etag == new.etag
+        )
+        first = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        later = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        cache.get_or_load('k', lambda: EncodedPayload.encode({'v': 1}, last_modified=first))
+        time.sleep(0.02)
+        cache.get_or_load('k', lambda: EncodedPayload.encode({'v': 1}, last_modified=later))
+        _wait_for_refresh(cache)
+        assert cache._entries['k'].value.last_modified == first
+
+        time.sleep(0.02)
+        cache.get_or_load('k', lambda: EncodedPayload.encode({'v': 2}, last_modified=later))
+        _wait_for_refresh(cache)
+        assert cache._entries['k'].value.last_modified == later
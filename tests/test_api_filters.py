@@ -0,0 +1,115 @@
+"""
+Unit tests for the dashboard filters and the filtered dashboard queries.
+"""
+from datetime import date
+
+import pytest
+
+
+class TestDashboardFilters:
+    """Tests for DashboardFilters parsing and SQL generation."""
+
+    def test_normalize_is_canonical(self):
+        """Test equivalent filter sets normalize to the same cache key."""
+        from filters import DashboardFilters
+
+        a = DashboardFilters.normalize(states=['rj,sp', 'SP'], payment_types=['Credit Card'])
+        b = DashboardFilters.normalize(states=['SP', ' RJ '], payment_types=['credit_card'])
+
+        assert a.states == ('RJ', 'SP')
+        assert a.payment_types == ('credit_card',)
+        assert a.cache_key() == b.cache_key()
+        assert DashboardFilters.normalize().is_default
+        assert not DashboardFilters.normalize(period_split=date(2017, 6, 1)).selects_orders
+        assert a.selects_orders
+
+    def test_invalid_date_range_is_rejected(self):
+        """Test a start date after the end date is a 422."""
+        from fastapi import HTTPException
+
+        from filters import dashboard_filters
+
+        with pytest.raises(HTTPException) as exc_info:
+            dashboard_filters(date(2018, 2, 1), date(2018, 1, 1), [], [], date(2018, 1, 1))
+
+        assert exc_info.value.status_code == 422
+
+    def test_where_sql_binds_every_value(self):
+        """Test the predicate only uses placeholders, one per value."""
+        from filters import DashboardFilters
+
+        filters = DashboardFilters.normalize(
+            start_date=date(2017, 1, 1), end_date=date(2017, 12, 31),
+            states=["SP", "R'J"], payment_types=['boleto'],
+        )
+
+        assert filters.where_sql() == (
+            'ORDER_DATE >= %(start_date)s AND ORDER_DATE <= %(end_date)s'
+            ' AND CUSTOMER_STATE IN (%(state_0)s, %(state_1)s)'
+            ' AND PRIMARY_PAYMENT_TYPE IN (%(payment_type_0)s)'
+        )
+        assert filters.params() == {
+            'period_split': date(2018, 1, 1),
+            'start_date': date(2017, 1, 1),
+            'end_date': date(2017, 12, 31),
+            'state_0': "R'J",
+            'state_1': 'SP',
+            'payment_type_0': 'boleto',
+        }
+        assert DashboardFilters().where_sql() == 'TRUE'
+
+
+class TestFilteredDashboards:
+    """Tests for the dashboards over a local replica."""
+
+    @pytest.mark.parametrize('single_scan', [True, False])
+    def test_filter_matching_no_orders_returns_empty_payload(
+        self, dashboard_replica, monkeypatch, single_scan
+    ):
+        """Test NULL aggregates of an empty selection become zeros, not a 500."""
+        from config import settings
+        from filters import DashboardFilters
+        from routers.dashboard import load_executive_dashboard
+
+        monkeypatch.setattr(settings, 'executive_single_scan', single_scan)
+
+        payload = load_executive_dashboard(DashboardFilters.normalize(states=['ZZ']))
+
+        assert [kpi['value'] for kpi in payload['kpis']] == [0, 0, 0, 0, 0, 0]
+        assert payload['salesMetrics']['totalRevenue'] == 0
+        assert payload['revenueTimeSeries'] == []
+        assert payload['topStates'] == []
+        assert payload['deliveryMetrics']['lateDeliveries'] == 0
+
+    @pytest.mark.parametrize('single_scan', [True, False])
+    def test_filters_are_applied(self, dashboard_replica, monkeypatch, single_scan):
+        """Test a state filter narrows every executive widget."""
+        from config import settings
+        from filters import DashboardFilters
+        from routers.dashboard import load_executive_dashboard
+
+        monkeypatch.setattr(settings, 'executive_single_scan', single_scan)
+
+        payload = load_executive_dashboard(DashboardFilters.normalize(states=['rj']))
+
+        assert payload['salesMetrics']['totalRevenue'] == 50.0
+        assert [s['state'] for s in payload['topStates']] == ['RJ']
+        assert [p['type'] for p in payload['paymentTypes']] == ['Boleto']
+
+    def test_sales_rejects_order_filters(self, dashboard_replica):
+        """Test the lifetime sales widgets refuse filters instead of ignoring them."""
+        from fastapi.testclient import TestClient
+
+        from filters import DashboardFilters
+        from main import app
+        from routers.dashboard import cache
+
+        cache.clear()
+        client = TestClient(app)
+
+        assert client.get('/api/dashboard/sales?state=SP').status_code == 422
+        response = client.get('/api/dashboard/sales?period_split=2017-06-01')
+        assert response.status_code == 200
+        assert response.json()['kpis'][0]['value'] == 3
+        # period_split is not part of the sales cache key
+        assert list(cache._entries) == [('sales', DashboardFilters().cache_key())]
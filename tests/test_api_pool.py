@@ -0,0 +1,230 @@
+"""
+Unit tests for the API connection pool and the widget query fan-out.
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pytest
+
+
+class FakeConnection:
+    """Connection stub that records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _pool(**kwargs):
+    from pool import ConnectionPool
+
+    created = []
+
+    def factory():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    return ConnectionPool(factory, **kwargs), created
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool checkout, return and overflow."""
+
+    def test_returned_connection_is_reused(self):
+        """Test a connection goes back to the pool and is handed out again."""
+        pool, created = _pool(min_size=0, max_size=2)
+
+        with pool.connection() as first:
+            assert pool.stats()['inUse'] == 1
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert len(created) == 1
+        assert pool.stats()['idle'] == 1
+        assert pool.stats()['checkouts'] == 2
+
+    def test_broken_connection_is_discarded(self):
+        """Test a connection that fails and is no longer alive is not returned."""
+        pool, created = _pool(min_size=0, max_size=2, is_alive=lambda conn: not conn.closed)
+
+        with pytest.raises(RuntimeError):
+            with pool.connection() as conn:
+                conn.closed = True
+                raise RuntimeError('connection reset')
+
+        assert pool.stats()['idle'] == 0
+        assert pool.stats()['discarded'] == 1
+
+    def test_checkout_waits_at_max_size_then_times_out(self):
+        """Test a checkout beyond max_size waits for a return and times out otherwise."""
+        from pool import PoolTimeoutError
+
+        pool, created = _pool(min_size=0, max_size=1, checkout_timeout=0.05)
+
+        with pool.connection():
+            with pytest.raises(PoolTimeoutError):
+                with pool.connection():
+                    pass
+
+        pool._checkout_timeout = 5
+        release = threading.Event()
+
+        def hold():
+            with pool.connection():
+                release.set()
+                time.sleep(0.05)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        release.wait()
+        with pool.connection():
+            pass
+        holder.join()
+
+        assert len(created) == 1
+        assert pool.stats()['waits'] == 1
+
+    def test_warm_never_exceeds_max_size(self):
+        """Test warm() reserves its slots before creating connections."""
+        from pool import ConnectionPool, PoolTimeoutError
+
+        creating = threading.Event()
+        proceed = threading.Event()
+
+        def slow_factory():
+            # Only the first connection, the one warm() creates, is slow
+            if not creating.is_set():
+                creating.set()
+                proceed.wait()
+            return FakeConnection()
+
+        pool = ConnectionPool(slow_factory, min_size=1, max_size=1, checkout_timeout=0.05)
+        warmer = threading.Thread(target=pool.warm, daemon=True)
+        warmer.start()
+        creating.wait()
+
+        try:
+            with pytest.raises(PoolTimeoutError):
+                with pool.connection():
+                    pass
+        finally:
+            proceed.set()
+            warmer.join()
+
+        assert pool.stats()['size'] == 1
+        assert pool.stats()['created'] == 1
+
+    def test_close_closes_checked_out_connections_on_return(self):
+        """Test close() also closes connections that were in use, once returned."""
+        from pool import PoolClosedError
+
+        pool, created = _pool(min_size=0, max_size=2)
+        with pool.connection():
+            pass
+
+        with pool.connection() as in_use:
+            with pool.connection():
+                pass
+            pool.close()
+            assert created[1].closed
+            assert not in_use.closed
+
+        assert in_use.closed
+        assert pool.stats()['size'] == 0
+        with pytest.raises(PoolClosedError):
+            with pool.connection():
+                pass
+
+
+class TestExecuteQueries:
+    """Tests for the concurrent widget queries."""
+
+    @staticmethod
+    def _backend(monkeypatch, execute_arrow):
+        import database
+
+        backend = MagicMock()
+        backend.execute_arrow.side_effect = execute_arrow
+        monkeypatch.setattr(database, 'get_backend', lambda: backend)
+        return backend
+
+    def test_fan_out_is_bounded(self, monkeypatch):
+        """Test queries run concurrently, at most query_max_parallelism at a time."""
+        import database
+
+        lock = threading.Lock()
+        running = {'now': 0, 'max': 0}
+
+        def execute_arrow(query, schema, timeout, params):
+            with lock:
+                running['now'] += 1
+                running['max'] = max(running['max'], running['now'])
+            time.sleep(0.02)
+            with lock:
+                running['now'] -= 1
+            return pa.table({'Q': [query]})
+
+        self._backend(monkeypatch, execute_arrow)
+        monkeypatch.setattr(database.settings, 'query_max_parallelism', 2)
+
+        results = database.execute_queries({f'w{i}': f'q{i}' for i in range(6)})
+
+        assert {name: table['Q'][0].as_py() for name, table in results.items()} == {
+            f'w{i}': f'q{i}' for i in range(6)
+        }
+        assert running['max'] == 2
+
+    def test_first_failure_is_raised_and_cancels_pending(self, monkeypatch):
+        """Test a failing query is re-raised and queued queries are cancelled."""
+        import database
+
+        started = []
+
+        def execute_arrow(query, schema, timeout, params):
+            started.append(query)
+            if query == 'q0':
+                raise TimeoutError('statement timed out')
+            time.sleep(0.05)
+            return pa.table({'Q': [query]})
+
+        self._backend(monkeypatch, execute_arrow)
+        monkeypatch.setattr(database.settings, 'query_max_parallelism', 1)
+
+        with pytest.raises(TimeoutError):
+            database.execute_queries({f'w{i}': f'q{i}' for i in range(4)})
+
+        time.sleep(0.2)
+        # The worker may pick up the next query before the failure is seen
+        assert started[0] == 'q0'
+        assert len(started) <= 2
+
+    def test_snowflake_statements_get_the_query_timeout(self, monkeypatch):
+        """Test statements carry query_timeout_seconds unless a timeout is given."""
+        from contextlib import contextmanager
+
+        import database
+
+        cursor = MagicMock()
+        cursor.description = [('N',)]
+        cursor.fetchall.return_value = [(1,)]
+
+        @contextmanager
+        def get_connection(schema):
+            conn = MagicMock()
+            conn.cursor.return_value = cursor
+            yield conn
+
+        monkeypatch.setattr(database, 'get_connection', get_connection)
+        monkeypatch.setattr(database.settings, 'query_timeout_seconds', 42)
+        backend = database.SnowflakeBackend()
+
+        assert backend.execute('SELECT 1') == [{'N': 1}]
+        assert cursor.execute.call_args.kwargs['timeout'] == 42
+        backend.execute('SELECT 1', timeout=5)
+        assert cursor.execute.call_args.kwargs['timeout'] == 5
@@ -0,0 +1,58 @@
+"""
+Unit tests for the single-scan executive query plan.
+"""
+from datetime import date
+
+import pytest
+
+
+def _executive_payload(monkeypatch, single_scan, filters):
+    from config import settings
+    from routers.dashboard import load_executive_dashboard
+
+    monkeypatch.setattr(settings, 'executive_single_scan', single_scan)
+    return load_executive_dashboard(filters)
+
+
+class TestExecutiveSingleScan:
+    """Tests for EXECUTIVE_SINGLE_SCAN_SQL and split_executive_rows."""
+
+    @pytest.mark.parametrize('filter_args', [
+        {},
+        {'states': ['SP']},
+        {'start_date': date(2018, 1, 1), 'payment_types': ['boleto']},
+        {'period_split': date(2017, 1, 1)},
+    ])
+    def test_single_scan_matches_per_widget_queries(
+        self, dashboard_replica, monkeypatch, filter_args
+    ):
+        """Test the single scan builds the same payload as one query per widget."""
+        from filters import DashboardFilters
+
+        filters = DashboardFilters.normalize(**filter_args)
+
+        single = _executive_payload(monkeypatch, True, filters)
+        per_widget = _executive_payload(monkeypatch, False, filters)
+
+        assert single == per_widget
+        assert single['kpis']
+
+    def test_split_groups_rows_per_widget(self, dashboard_replica):
+        """Test every widget of the per-widget plan gets its rows from the single scan."""
+        from database import execute_query
+        from filters import DashboardFilters
+        from query_plan import EXECUTIVE_SINGLE_SCAN_SQL, split_executive_rows
+
+        filters = DashboardFilters()
+        rows = execute_query(
+            EXECUTIVE_SINGLE_SCAN_SQL.replace('{filters}', filters.where_sql()),
+            params=filters.params(),
+        )
+        split = split_executive_rows(rows)
+
+        assert set(split) == {
+            'kpis', 'revenue_ts', 'order_statuses', 'top_states', 'payment_types',
+            'reviews', 'delivery',
+        }
+        assert split['kpis'][0]['TOTAL_ORDERS'] == 2
+        assert [row['STATE'] for row in split['top_states']] == ['SP', 'RJ']
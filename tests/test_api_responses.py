@@ -0,0 +1,129 @@
+"""
+Unit tests for the pre-encoded JSON responses: validators and content negotiation.
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+LAST_MODIFIED = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _client(payload):
+    from fastapi import FastAPI, Request
+    from fastapi.testclient import TestClient
+
+    from responses import json_response
+
+    app = FastAPI()
+
+    @app.get('/payload')
+    def get_payload(request: Request):
+        return json_response(request, payload)
+
+    return TestClient(app)
+
+
+def _payload():
+    from responses import EncodedPayload
+
+    # Large enough to be stored compressed
+    return EncodedPayload.encode({'rows': [{'id': i} for i in range(500)]}, LAST_MODIFIED)
+
+
+class TestConditionalRequests:
+    """Tests for ETag and Last-Modified validation."""
+
+    def test_matching_etag_is_not_modified(self):
+        """Test If-None-Match with the current ETag, weak or strong, gets an empty 304."""
+        payload = _payload()
+        client = _client(payload)
+
+        for tag in (payload.etag, payload.etag.removeprefix('W/'), f'"other", {payload.etag}'):
+            response = client.get('/payload', headers={'If-None-Match': tag})
+            assert response.status_code == 304
+            assert response.content == b''
+            assert response.headers['etag'] == payload.etag
+
+    def test_stale_etag_gets_the_body(self):
+        """Test If-None-Match with an old ETag returns the payload."""
+        payload = _payload()
+
+        response = _client(payload).get('/payload', headers={'If-None-Match': 'W/"stale"'})
+
+        assert response.status_code == 200
+        assert response.content == payload.body
+
+    def test_if_modified_since(self):
+        """Test If-Modified-Since is honoured unless If-None-Match is present."""
+        client = _client(_payload())
+
+        def get(since, **headers):
+            headers['If-Modified-Since'] = since
+            return client.get('/payload', headers=headers).status_code
+
+        assert get(format_datetime(LAST_MODIFIED, usegmt=True)) == 304
+        assert get(format_datetime(LAST_MODIFIED + timedelta(days=1), usegmt=True)) == 304
+        assert get(format_datetime(LAST_MODIFIED - timedelta(seconds=1), usegmt=True)) == 200
+        assert get('not a date') == 200
+        # If-None-Match takes precedence over the date
+        assert get(format_datetime(LAST_MODIFIED, usegmt=True), **{'If-None-Match': '"x"'}) == 200
+
+
+class TestContentNegotiation:
+    """Tests for choosing the Content-Encoding from Accept-Encoding."""
+
+    @staticmethod
+    def _encoding(client, accept_encoding):
+        response = client.get('/payload', headers={'Accept-Encoding': accept_encoding})
+        assert response.status_code == 200
+        assert response.headers['vary'] == 'Accept-Encoding'
+        return response.headers.get('content-encoding')
+
+    def test_highest_q_value_wins(self):
+        """Test brotli is chosen over gzip on a tie or a higher q, and not on a lower one."""
+        pytest.importorskip('brotli')
+        client = _client(_payload())
+
+        assert self._encoding(client, 'gzip, br') == 'br'
+        assert self._encoding(client, 'gzip;q=0.5, br;q=0.8') == 'br'
+        assert self._encoding(client, 'gzip;q=0.9, br;q=0.1') == 'gzip'
+        assert self._encoding(client, 'br;q=0, gzip') == 'gzip'
+
+    def test_wildcard_and_identity(self):
+        """Test ``*`` accepts any coding and a refused identity still gets a coding."""
+        pytest.importorskip('brotli')
+        client = _client(_payload())
+
+        assert self._encoding(client, '*') == 'br'
+        assert self._encoding(client, 'br;q=0, *;q=0.5') == 'gzip'
+        assert self._encoding(client, '*;q=0, gzip') == 'gzip'
+        assert self._encoding(client, 'identity;q=0, gzip;q=0.5') == 'gzip'
+        # Nothing acceptable: the body goes out uncompressed
+        assert self._encoding(client, '*;q=0') is None
+        assert self._encoding(client, 'identity') is None
+        assert self._encoding(client, '') is None
+
+    def test_small_payload_is_not_compressed(self):
+        """Test payloads under compression_min_bytes are always sent as is."""
+        from responses import EncodedPayload
+
+        payload = EncodedPayload.encode({'kpis': []}, LAST_MODIFIED)
+        client = _client(payload)
+
+        assert payload.gzip_body is None
+        assert self._encoding(client, 'gzip, br') is None
+
+    def test_vary_on_every_response(self):
+        """Test Vary: Accept-Encoding is sent on 200 and 304 responses."""
+        payload = _payload()
+        client = _client(payload)
+
+        not_modified = client.get('/payload', headers={'If-None-Match': payload.etag})
+        compressed = client.get('/payload', headers={'Accept-Encoding': 'gzip'})
+        plain = client.get('/payload', headers={'Accept-Encoding': 'identity'})
+
+        assert [r.status_code for r in (not_modified, compressed, plain)] == [304, 200, 200]
+        assert all(r.headers['vary'] == 'Accept-Encoding'
+                   for r in (not_modified, compressed, plain))
+        assert compressed.json() == plain.json()
@@ -0,0 +1,64 @@
+"""
+Unit tests for the dashboard snapshot store.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+
+def _publish(snapshot_dir, built_at):
+    from snapshot import LATEST_FILENAME, SNAPSHOT_FORMAT_VERSION
+
+    snapshot = {
+        'formatVersion': SNAPSHOT_FORMAT_VERSION,
+        'builtAt': built_at.isoformat(),
+        'database': 'ECOMMERCE_PROD',
+        'payloads': {'executive': {'kpis': []}},
+    }
+    (snapshot_dir / LATEST_FILENAME).write_text(json.dumps(snapshot))
+
+
+class TestSnapshotStore:
+    """Tests for SnapshotStore."""
+
+    def test_fresh_snapshot_is_served(self, tmp_path):
+        """Test a snapshot within the max age is returned."""
+        from snapshot import SnapshotStore
+
+        _publish(tmp_path, datetime.now(timezone.utc) - timedelta(hours=1))
+        store = SnapshotStore(str(tmp_path), max_age_seconds=2 * 3600)
+
+        assert store.get('executive').body == b'{"kpis":[]}'
+        assert store.info()['expired'] is False
+
+    def test_expired_snapshot_is_not_served(self, tmp_path):
+        """Test a snapshot past the max age is ignored."""
+        from snapshot import SnapshotStore
+
+        _publish(tmp_path, datetime.now(timezone.utc) - timedelta(hours=3))
+        store = SnapshotStore(str(tmp_path), max_age_seconds=2 * 3600)
+
+        assert store.get('executive') is None
+        assert store.info()['expired'] is True
+        assert SnapshotStore(str(tmp_path)).get('executive') is not None
+
+    def test_expired_snapshot_falls_back_to_live_queries(
+        self, dashboard_replica, tmp_path, monkeypatch
+    ):
+        """Test the dashboard route queries live data once the snapshot expired."""
+        from fastapi.testclient import TestClient
+
+        from main import app
+        from routers import dashboard
+        from snapshot import SnapshotStore
+
+        snapshot_dir = tmp_path / 'snapshots'
+        snapshot_dir.mkdir()
+        _publish(snapshot_dir, datetime.now(timezone.utc) - timedelta(days=2))
+        monkeypatch.setattr(dashboard, 'snapshots', SnapshotStore(str(snapshot_dir), 3600))
+        dashboard.cache.clear()
+
+        response = TestClient(app).get('/api/dashboard/executive')
+
+        assert response.status_code == 200
+        assert response.json()['kpis']
+        assert list(dashboard.cache._entries)
@@ -0,0 +1,108 @@
+"""
+Unit tests for the column-wise payload building of Arrow query results.
+"""
+from decimal import Decimal
+
+import pyarrow as pa
+
+
+def _table():
+    return pa.table({
+        'TOTAL_REVENUE': pa.array([Decimal('70.60'), Decimal('-2.50'), None],
+                                  pa.decimal128(38, 2)),
+        'ORDER_COUNT': pa.array([Decimal('3.99'), Decimal('-3.99'), None], pa.decimal128(38, 2)),
+        'ITEMS': pa.array([1, None, 3], pa.int64()),
+        'STATE': pa.array(['SP', None, 'RJ']),
+    })
+
+
+class TestConvert:
+    """Tests for _convert."""
+
+    def test_decimal_to_float_goes_through_the_decimal_string(self):
+        """Test DECIMAL 70.6 becomes the double 70.6, not 70.60000000000001."""
+        import pyarrow.compute as pc
+
+        from transform import _convert
+
+        values = _convert(_table(), 'TOTAL_REVENUE', float)
+
+        assert values.to_pylist() == [70.6, -2.5, None]
+        assert values.to_pylist() == [float(v) if v is not None else None
+                                      for v in _table()['TOTAL_REVENUE'].to_pylist()]
+        # The regression the string cast avoids
+        assert pc.cast(_table()['TOTAL_REVENUE'], pa.float64())[0].as_py() == 70.60000000000001
+
+    def test_decimal_to_int_truncates(self):
+        """Test the unsafe DECIMAL -> INT cast truncates towards zero like int(Decimal)."""
+        from transform import _convert
+
+        assert _convert(_table(), 'ORDER_COUNT', int).to_pylist() == [3, -3, None]
+
+    def test_rounding_is_half_away_from_zero(self):
+        """Test Column.round follows Snowflake ROUND(), not banker's rounding."""
+        from transform import Column, _convert
+
+        table = pa.table({
+            'VALUE': pa.array([Decimal('2.5'), Decimal('-2.5'), Decimal('0.125')],
+                              pa.decimal128(10, 3)),
+            'RATE': pa.array([0.125, 2.345, -0.5]),
+        })
+
+        assert _convert(table, 'VALUE', Column(float, round=0)).to_pylist() == [3.0, -3.0, 0.0]
+        assert _convert(table, 'VALUE', Column(float, round=2)).to_pylist() == [2.5, -2.5, 0.13]
+        assert _convert(table, 'RATE', Column(float, round=2)).to_pylist() == [0.13, 2.35, -0.5]
+
+    def test_null_defaults(self):
+        """Test nulls and missing columns take the Column default, or stay None."""
+        from transform import Column, _convert
+
+        table = _table()
+
+        assert _convert(table, 'ITEMS', Column(int, default=0)).to_pylist() == [1, 0, 3]
+        assert _convert(table, 'STATE', Column(str, default='')).to_pylist() == ['SP', '', 'RJ']
+        assert _convert(table, 'MISSING', Column(float, round=1, default=0.0)).to_pylist() == [
+            0.0, 0.0, 0.0
+        ]
+        assert _convert(table, 'MISSING', int).to_pylist() == [None, None, None]
+
+
+class TestRecords:
+    """Tests for records and first_row."""
+
+    def test_records_follow_the_spec(self):
+        """Test output keys are camelCased in spec order with each column converted."""
+        from transform import Column, records
+
+        rows = records(_table(), {
+            'STATE': str,
+            'TOTAL_REVENUE': Column(float, round=1, default=0.0),
+            'ITEMS': int,
+        })
+
+        assert rows == [
+            {'state': 'SP', 'totalRevenue': 70.6, 'items': 1},
+            {'state': None, 'totalRevenue': -2.5, 'items': None},
+            {'state': 'RJ', 'totalRevenue': 0.0, 'items': 3},
+        ]
+        assert list(rows[0]) == ['state', 'totalRevenue', 'items']
+
+    def test_empty_table(self):
+        """Test an empty result gives no records and an empty first row."""
+        from transform import first_row, records
+
+        empty = _table().slice(0, 0)
+
+        assert records(empty, {'STATE': str}) == []
+        assert first_row(empty) == {}
+
+    def test_first_row_keeps_source_values(self):
+        """Test first_row returns the first row unconverted."""
+        from transform import first_row
+
+        assert first_row(_table()) == {
+            'TOTAL_REVENUE': Decimal('70.60'),
+            'ORDER_COUNT': Decimal('3.99'),
+            'ITEMS': 1,
+            'STATE': 'SP',
+        }
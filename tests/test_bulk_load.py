@@ -0,0 +1,128 @@
+"""
+Unit tests for the stage-and-COPY bulk load path.
+"""
+import pytest
+from unittest.mock import MagicMock
+import pandas as pd
+
+
+@pytest.fixture
+def orders_csv(tmp_path):
+    """Write a small orders CSV and return its path."""
+    path = tmp_path / 'olist_orders_dataset.csv'
+    pd.DataFrame({
+        'order_id': [f'o{i}' for i in range(2000)],
+        'order_status': ['delivered'] * 2000,
+        'order_purchase_timestamp': ['2017-10-02 10:56:33'] * 2000,
+        'payment_value': [float(i) / 3 for i in range(2000)],
+    }).to_csv(path, index=False)
+    return path
+
+
+class TestBulkLoader:
+    """Tests for BulkLoader with a directory-backed stage."""
+
+    def test_load_csv_splits_files_and_loads_rows(self, orders_csv, tmp_path):
+        """Test a CSV is split into Parquet files and fully loaded."""
+        from src.ecommerce_analytics.snowflake.bulk_load import BulkLoader, LocalStageClient
+
+        stage = LocalStageClient(tmp_path / 'stage')
+        loader = BulkLoader(stage, work_dir=tmp_path / 'parquet', target_file_mb=0.02)
+
+        result = loader.load_csv(orders_csv, 'orders')
+
+        assert result['table'] == 'ORDERS'
+        assert result['rows'] == 2000
+        assert result['columns'] == 4
+        assert result['files'] > 1
+        assert result['uploaded_files'] == result['files']
+        assert result['reused_local_files'] is False
+        assert set(result['timings']) == {'write', 'put', 'copy'}
+
+        loaded = stage.tables['ORDERS'].to_pandas()
+        assert loaded['order_id'].tolist() == [f'o{i}' for i in range(2000)]
+
+    def test_load_csv_explicit_schema(self, orders_csv, tmp_path):
+        """Test the target table is created from the Parquet schema."""
+        from src.ecommerce_analytics.snowflake.bulk_load import BulkLoader, LocalStageClient
+
+        stage = LocalStageClient(tmp_path / 'stage')
+        BulkLoader(stage, work_dir=tmp_path / 'parquet').load_csv(orders_csv, 'ORDERS')
+
+        assert stage.schemas['ORDERS'] == [
+            ('order_id', 'VARCHAR'),
+            ('order_status', 'VARCHAR'),
+            ('order_purchase_timestamp', 'TIMESTAMP_NTZ'),
+            ('payment_value', 'FLOAT'),
+        ]
+
+    def test_load_csv_quoted_multiline_values(self, tmp_path):
+        """Test quoted values spanning lines are loaded as one row."""
+        from src.ecommerce_analytics.snowflake.bulk_load import BulkLoader, LocalStageClient
+
+        path = tmp_path / 'olist_order_reviews_dataset.csv'
+        path.write_bytes(b'review_id,review_comment_message\n'
+                         b'r1,"chegou\nno prazo"\nr2,"bom\r\nproduto"\nr3,\n')
+        stage = LocalStageClient(tmp_path / 'stage')
+
+        result = BulkLoader(stage, work_dir=tmp_path / 'parquet').load_csv(path, 'ORDER_REVIEWS')
+
+        assert result['rows'] == 3
+        loaded = stage.tables['ORDER_REVIEWS'].to_pandas()
+        messages = loaded['review_comment_message'].tolist()
+        assert messages[:2] == ['chegou\nno prazo', 'bom\r\nproduto']
+
+    def test_unchanged_file_is_reused(self, orders_csv, tmp_path):
+        """Test a second load reuses local and staged files."""
+        from src.ecommerce_analytics.snowflake.bulk_load import BulkLoader, LocalStageClient
+
+        stage = LocalStageClient(tmp_path / 'stage')
+        loader = BulkLoader(stage, work_dir=tmp_path / 'parquet')
+
+        loader.load_csv(orders_csv, 'ORDERS')
+        result = loader.load_csv(orders_csv, 'ORDERS')
+
+        assert result['reused_local_files'] is True
+        assert result['uploaded_files'] == 0
+        assert result['rows'] == 2000
+        assert stage.put_calls == 1
+
+    def test_changed_file_is_rewritten(self, orders_csv, tmp_path):
+        """Test a changed CSV gets new Parquet files and old ones are pruned."""
+        from src.ecommerce_analytics.snowflake.bulk_load import BulkLoader, LocalStageClient
+
+        stage = LocalStageClient(tmp_path / 'stage')
+        loader = BulkLoader(stage, work_dir=tmp_path / 'parquet')
+        loader.load_csv(orders_csv, 'ORDERS')
+
+        with open(orders_csv, 'a') as f:
+            f.write('o2000,shipped,2018-01-01 00:00:00,1.5\n')
+        result = loader.load_csv(orders_csv, 'ORDERS')
+
+        assert result['reused_local_files'] is False
+        assert result['rows'] == 2001
+        assert len(list((tmp_path / 'parquet' / 'orders').iterdir())) == 1
+
+
+class TestSnowflakeStageClient:
+    """Tests for the Snowflake stage client SQL."""
+
+    def test_put_and_copy_statements(self, tmp_path):
+        """Test PUT uses parallel uploads and COPY loads the listed files."""
+        from src.ecommerce_analytics.snowflake.bulk_load import SnowflakeStageClient
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [('orders-0000.parquet', 'LOADED', 10, 10)]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+
+        client = SnowflakeStageClient(mock_conn)
+        client.put([tmp_path / 'a.parquet', tmp_path / 'b.parquet'], 'orders/abc', parallel=4)
+        rows = client.copy_into('ORDERS', 'orders/abc', ['a.parquet', 'b.parquet'])
+
+        statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert statements[0].startswith('CREATE STAGE IF NOT EXISTS BULK_LOAD_STAGE')
+        assert f"PUT 'file://{tmp_path.as_posix()}/*.parquet' @BULK_LOAD_STAGE/orders/abc/" in statements[1]
+        assert 'PARALLEL = 4' in statements[1]
+        assert "FILES = ('a.parquet', 'b.parquet')" in statements[2]
+        assert rows == 10
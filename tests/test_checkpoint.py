@@ -0,0 +1,37 @@
+"""
+Unit tests for resumable load checkpoints.
+"""
+
+
+class TestLoadCheckpoint:
+    """Tests for LoadCheckpoint."""
+
+    def test_resumes_same_source_with_original_chunk_size(self, tmp_path):
+        """Test progress and chunk size survive a restart for the same source."""
+        from src.ecommerce_analytics.snowflake.checkpoint import LoadCheckpoint
+
+        path = tmp_path / 'ORDERS.json'
+        checkpoint = LoadCheckpoint(path, 'sha:abc', chunk_rows=1000)
+        checkpoint.record(0, 1000)
+        checkpoint.record(1, 1000)
+
+        # A later run would pick a different chunk size; the saved one wins
+        resumed = LoadCheckpoint(path, 'sha:abc', chunk_rows=5000)
+        assert resumed.resuming
+        assert resumed.completed == 2
+        assert resumed.rows == 2000
+        assert resumed.chunk_rows == 1000
+
+    def test_other_source_starts_over(self, tmp_path):
+        """Test a checkpoint of a different source is ignored and can be cleared."""
+        from src.ecommerce_analytics.snowflake.checkpoint import LoadCheckpoint
+
+        path = tmp_path / 'ORDERS.json'
+        LoadCheckpoint(path, 'sha:abc', chunk_rows=1000).record(0, 1000)
+
+        fresh = LoadCheckpoint(path, 'sha:def', chunk_rows=5000)
+        assert not fresh.resuming
+        assert fresh.chunk_rows == 5000
+
+        fresh.clear()
+        assert not path.exists()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the Arrow IPC cache of source CSVs.
+"""
+import os
+from unittest.mock import patch
+
+import pandas as pd
+
+
+def _write_orders(path, order_ids):
+    pd.DataFrame({
+        'order_id': order_ids,
+        'order_status': ['delivered'] * len(order_ids),
+        'order_purchase_timestamp': ['2018-01-01 10:00:00'] * len(order_ids),
+    }).to_csv(path, index=False)
+
+
+class TestColumnarCache:
+    """Tests for ColumnarCache."""
+
+    def test_second_read_is_served_from_cache(self, tmp_path):
+        """Test a CSV is parsed once and then read from the mapped Arrow file."""
+        from src.ecommerce_analytics.data_loader.columnar_cache import ColumnarCache
+
+        csv = tmp_path / 'olist_orders_dataset.csv'
+        _write_orders(csv, ['o1', 'o2'])
+        cache = ColumnarCache(tmp_path / 'cache')
+
+        first = cache.read_csv(csv, 'ORDERS')
+        assert cache.entry_path(csv, 'ORDERS').exists()
+
+        with patch('src.ecommerce_analytics.data_loader.columnar_cache.read_source_table') as parse:
+            second = cache.read_csv(csv, 'ORDERS')
+            columns = cache.read_table(csv, 'ORDERS', columns=['order_id'])
+        parse.assert_not_called()
+
+        pd.testing.assert_frame_equal(first, second)
+        assert str(second['order_status'].dtype) == 'category'
+        assert second['order_purchase_timestamp'].dtype.kind == 'M'
+        assert columns.column_names == ['order_id']
+
+    def test_changed_file_is_parsed_again(self, tmp_path):
+        """Test an entry is rebuilt when the CSV changes."""
+        from src.ecommerce_analytics.data_loader.columnar_cache import ColumnarCache
+
+        csv = tmp_path / 'olist_orders_dataset.csv'
+        _write_orders(csv, ['o1', 'o2'])
+        cache = ColumnarCache(tmp_path / 'cache')
+        assert len(cache.read_csv(csv, 'ORDERS')) == 2
+
+        _write_orders(csv, ['o1', 'o2', 'o3'])
+        stat = csv.stat()
+        os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache.read_csv(csv, 'ORDERS')['order_id'].tolist() == ['o1', 'o2', 'o3']
+        assert len(list((tmp_path / 'cache').glob('*.arrow'))) == 1
+
+        cache.clear()
+        assert not cache.entry_path(csv, 'ORDERS').exists()
+
+    def test_corrupt_entry_is_rebuilt(self, tmp_path):
+        """Test an unreadable cache file falls back to parsing the CSV."""
+        from src.ecommerce_analytics.data_loader.columnar_cache import ColumnarCache
+
+        csv = tmp_path / 'olist_orders_dataset.csv'
+        _write_orders(csv, ['o1'])
+        cache = ColumnarCache(tmp_path / 'cache')
+        entry = cache.entry_path(csv, 'ORDERS')
+        entry.parent.mkdir()
+        entry.write_bytes(b'not arrow')
+
+        assert cache.read_csv(csv, 'ORDERS')['order_id'].tolist() == ['o1']
+        assert entry.stat().st_size > len(b'not arrow')
+
+    def test_content_change_with_same_size_and_mtime_is_detected(self, tmp_path):
+        """Test an entry is rebuilt when the content changes but size and mtime do not."""
+        from src.ecommerce_analytics.data_loader.columnar_cache import ColumnarCache
+
+        csv = tmp_path / 'olist_orders_dataset.csv'
+        _write_orders(csv, ['o1', 'o2'])
+        stat = csv.stat()
+        cache = ColumnarCache(tmp_path / 'cache')
+        assert cache.read_csv(csv, 'ORDERS')['order_id'].tolist() == ['o1', 'o2']
+
+        _write_orders(csv, ['o3', 'o4'])
+        os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert csv.stat().st_size == stat.st_size
+
+        assert cache.read_csv(csv, 'ORDERS')['order_id'].tolist() == ['o3', 'o4']
+
+    def test_known_digest_is_not_recomputed(self, tmp_path):
+        """Test a digest passed by the caller is used instead of hashing the file."""
+        from src.ecommerce_analytics.data_loader.columnar_cache import ColumnarCache
+        from src.ecommerce_analytics.data_loader.manifest import file_digest
+
+        csv = tmp_path / 'olist_orders_dataset.csv'
+        _write_orders(csv, ['o1'])
+        digest = file_digest(csv)
+        cache = ColumnarCache(tmp_path / 'cache')
+
+        with patch('src.ecommerce_analytics.data_loader.columnar_cache.file_digest') as hash_file:
+            cache.read_csv(csv, 'ORDERS', digest=digest)
+            assert cache.lookup(csv, 'ORDERS', digest=digest) is not None
+        hash_file.assert_not_called()
+        # Without a digest the file is hashed, and matches the same entry
+        assert cache.lookup(csv, 'ORDERS') is not None
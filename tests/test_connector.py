@@ -147,3 +147,180 @@ class TestSnowflakeConnector:
         assert result is False
         captured = capsys.readouterr()
         assert 'Connection Failed' in captured.out
+
+    @staticmethod
+    def _statements(mock_conn):
+        """SQL statements executed on a mocked connection."""
+        return [c.args[0] for c in mock_conn.cursor.return_value.execute.call_args_list]
+
+    @patch('src.ecommerce_analytics.snowflake.connector.load_dotenv')
+    @patch('snowflake.connector.pandas_tools.write_pandas')
+    @patch('src.ecommerce_analytics.snowflake.connector.snowflake.connector.connect')
+    def test_load_chunks_to_snowflake(self, mock_connect, mock_write_pandas, mock_dotenv, mock_env_vars, monkeypatch):
+        """Test chunks are staged over one connection, then swapped into place."""
+        monkeypatch.setenv('SNOWFLAKE_PASSWORD', 'test_password')
+        import pandas as pd
+        from src.ecommerce_analytics.snowflake.connector import SnowflakeConnector
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.fetchall.return_value = [(1,)]
+        mock_connect.return_value = mock_conn
+        mock_write_pandas.side_effect = lambda conn, df, **kwargs: (True, 1, len(df), [])
+
+        chunks = [pd.DataFrame({'id': [1, 2]}), pd.DataFrame({'id': [3]})]
+        connector = SnowflakeConnector(use_key_auth=False)
+        success, rows = connector.load_chunks_to_snowflake(iter(chunks), 'geolocation')
+
+        assert success is True
+        assert rows == 3
+        mock_connect.assert_called_once()
+        overwrite_flags = [c.kwargs['overwrite'] for c in mock_write_pandas.call_args_list]
+        assert overwrite_flags == [True, False]
+        assert mock_write_pandas.call_args.kwargs['table_name'] == 'GEOLOCATION__LOADING'
+        assert mock_write_pandas.call_args.kwargs['df']['_load_chunk'].tolist() == [1]
+
+        statements = self._statements(mock_conn)
+        assert 'ALTER TABLE "GEOLOCATION" SWAP WITH "GEOLOCATION__LOADING"' in statements
+        assert statements[-1] == 'DROP TABLE "GEOLOCATION__LOADING"'
+
+    @patch('src.ecommerce_analytics.snowflake.connector.load_dotenv')
+    @patch('snowflake.connector.pandas_tools.write_pandas')
+    @patch('src.ecommerce_analytics.snowflake.connector.snowflake.connector.connect')
+    def test_published_table_keeps_its_kind(self, mock_connect, mock_write_pandas, mock_dotenv, mock_env_vars, monkeypatch):
+        """Test a permanent target is not replaced by a transient staging table."""
+        monkeypatch.setenv('SNOWFLAKE_PASSWORD', 'test_password')
+        import pandas as pd
+        from src.ecommerce_analytics.snowflake.connector import SnowflakeConnector
+
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        mock_write_pandas.side_effect = lambda conn, df, **kwargs: (True, 1, len(df), [])
+        connector = SnowflakeConnector(use_key_auth=False)
+        columns = [('ID', 'NUMBER(38, 0)')]
+
+        mock_conn.cursor.return_value.fetchall.return_value = [('NO',)]
+        connector.load_csv_to_snowflake(pd.DataFrame({'ID': [1]}), 'ORDERS', columns=columns)
+
+        assert mock_write_pandas.call_args.kwargs['table_type'] == ''
+        statements = self._statements(mock_conn)
+        assert 'ALTER TABLE "ORDERS" SWAP WITH "ORDERS__LOADING"' in statements
+        assert not any('TRANSIENT' in s for s in statements if s.startswith('CREATE'))
+
+        mock_conn.reset_mock()
+        mock_conn.cursor.return_value.fetchall.return_value = [('YES',)]
+        connector.load_csv_to_snowflake(pd.DataFrame({'ID': [1]}), 'ORDERS', columns=columns)
+
+        assert mock_write_pandas.call_args.kwargs['table_type'] == 'transient'
+        assert any(s.startswith('CREATE OR REPLACE TRANSIENT TABLE')
+                   for s in self._statements(mock_conn))
+
+    @patch('src.ecommerce_analytics.snowflake.connector.load_dotenv')
+    @patch('snowflake.connector.pandas_tools.write_pandas')
+    @patch('src.ecommerce_analytics.snowflake.connector.snowflake.connector.connect')
+    def test_load_reports_uploaded_bytes(self, mock_connect, mock_write_pandas, mock_dotenv, mock_env_vars, monkeypatch):
+        """Test uploaded bytes are read from the staging table's copy history on request."""
+        monkeypatch.setenv('SNOWFLAKE_PASSWORD', 'test_password')
+        import pandas as pd
+        from src.ecommerce_analytics.snowflake.connector import SnowflakeConnector
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.fetchall.return_value = [(2048,)]
+        mock_connect.return_value = mock_conn
+        mock_write_pandas.side_effect = lambda conn, df, **kwargs: (True, 1, len(df), [])
+
+        connector = SnowflakeConnector(use_key_auth=False)
+        connector.load_csv_to_snowflake(pd.DataFrame({'id': [1, 2]}), 'ORDERS')
+        assert not any('COPY_HISTORY' in s for s in self._statements(mock_conn))
+
+        stats = {}
+        connector.load_csv_to_snowflake(pd.DataFrame({'id': [1, 2]}), 'ORDERS', stats=stats)
+
+        assert stats == {'bytes_uploaded': 2048}
+        history = [c for c in mock_conn.cursor.return_value.execute.call_args_list
+                   if 'COPY_HISTORY' in c.args[0]]
+        assert history[0].args[1]['table'] == 'ORDERS__LOADING'
+
+    @patch('src.ecommerce_analytics.snowflake.connector.load_dotenv')
+    @patch('snowflake.connector.pandas_tools.write_pandas')
+    @patch('src.ecommerce_analytics.snowflake.connector.snowflake.connector.connect')
+    def test_failed_chunk_is_retried(self, mock_connect, mock_write_pandas, mock_dotenv, mock_env_vars, monkeypatch):
+        """Test a failed chunk is cleared and retried without restarting the load."""
+        monkeypatch.setenv('SNOWFLAKE_PASSWORD', 'test_password')
+        import pandas as pd
+        from src.ecommerce_analytics.snowflake.connector import SnowflakeConnector
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.fetchall.return_value = [(1,)]
+        mock_connect.return_value = mock_conn
+        mock_write_pandas.side_effect = [
+            (True, 1, 2, []), Exception('connection reset'), (True, 1, 2, [])
+        ]
+
+        connector = SnowflakeConnector(use_key_auth=False)
+        connector.RETRY_BACKOFF_SECONDS = 0
+        success, rows = connector.load_chunks_to_snowflake(
+            iter([pd.DataFrame({'id': [1, 2]})] * 2), 'ORDERS', if_exists='append'
+        )
+
+        assert success is True
+        assert rows == 4
+        statements = self._statements(mock_conn)
+        assert 'DELETE FROM "ORDERS__LOADING" WHERE "_load_chunk" = %(chunk)s' in statements
+        assert any(s.startswith('INSERT INTO "ORDERS"') for s in statements)
+
+    @patch('src.ecommerce_analytics.snowflake.connector.load_dotenv')
+    @patch('snowflake.connector.pandas_tools.write_pandas')
+    @patch('src.ecommerce_analytics.snowflake.connector.snowflake.connector.connect')
+    def test_load_chunks_stops_on_failure(self, mock_connect, mock_write_pandas, mock_dotenv, mock_env_vars, monkeypatch):
+        """Test loading stops at a chunk that keeps failing and the table is not replaced."""
+        monkeypatch.setenv('SNOWFLAKE_PASSWORD', 'test_password')
+        import pandas as pd
+        from src.ecommerce_analytics.snowflake.connector import SnowflakeConnector
+
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        mock_write_pandas.side_effect = [(True, 1, 2, []), (False, 1, 0, []), (False, 1, 0, [])]
+
+        chunks = [pd.DataFrame({'id': [1, 2]})] * 3
+        connector = SnowflakeConnector(use_key_auth=False)
+        connector.CHUNK_RETRIES = 1
+        connector.RETRY_BACKOFF_SECONDS = 0
+        success, rows = connector.load_chunks_to_snowflake(iter(chunks), 'GEOLOCATION')
+
+        assert success is False
+        assert rows == 2
+        assert mock_write_pandas.call_count == 3
+        assert not any('SWAP' in s or 'RENAME' in s for s in self._statements(mock_conn))
+
+    @patch('src.ecommerce_analytics.snowflake.connector.load_dotenv')
+    @patch('snowflake.connector.pandas_tools.write_pandas')
+    @patch('src.ecommerce_analytics.snowflake.connector.snowflake.connector.connect')
+    def test_load_resumes_from_checkpoint(self, mock_connect, mock_write_pandas, mock_dotenv, mock_env_vars, monkeypatch, tmp_path):
+        """Test a checkpointed load only uploads the chunks that are missing."""
+        monkeypatch.setenv('SNOWFLAKE_PASSWORD', 'test_password')
+        import pandas as pd
+        from src.ecommerce_analytics.snowflake.checkpoint import LoadCheckpoint
+        from src.ecommerce_analytics.snowflake.connector import SnowflakeConnector
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.fetchall.return_value = [(1,)]
+        mock_connect.return_value = mock_conn
+        mock_write_pandas.side_effect = lambda conn, df, **kwargs: (True, 1, len(df), [])
+
+        path = tmp_path / 'checkpoint.json'
+        checkpoint = LoadCheckpoint(path, 'sha:abc', chunk_rows=2)
+        checkpoint.record(0, 2)
+        checkpoint.record(1, 2)
+
+        chunks = [pd.DataFrame({'id': [i, i]}) for i in range(4)]
+        connector = SnowflakeConnector(use_key_auth=False)
+        success, rows = connector.load_chunks_to_snowflake(
+            iter(chunks), 'ORDERS', checkpoint=LoadCheckpoint(path, 'sha:abc', chunk_rows=2)
+        )
+
+        assert success is True
+        assert rows == 8
+        uploaded = [c.kwargs['df']['_load_chunk'].iloc[0] for c in mock_write_pandas.call_args_list]
+        assert uploaded == [2, 3]
+        assert 'DELETE FROM "ORDERS__LOADING" WHERE "_load_chunk" >= %(chunk)s' in self._statements(mock_conn)
+        assert not path.exists()
@@ -5,6 +5,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
 
 
 class TestEcommerceDataLoader:
@@ -20,6 +21,35 @@ class TestEcommerceDataLoader:
         assert loader.data_dir == Path('data/raw')
         assert len(loader.file_table_mapping) == 9
 
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_conflicting_options_warn(self, mock_connector_class, capsys):
+        """Test options overridden by another load path are reported."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        EcommerceDataLoader(data_dir='data/raw', memory_limit_mb=64)
+        assert '⚠' not in capsys.readouterr().out
+
+        EcommerceDataLoader(
+            data_dir='data/raw', memory_limit_mb=64, use_stage=True, preaggregate=True
+        )
+        output = capsys.readouterr().out
+        assert 'memory limit only applies to delta loads' in output
+        assert 'GEOLOCATION will be read whole' in output
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.EcommerceDataLoader')
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_main_accepts_empty_memory_limit(
+        self, mock_connector_class, mock_loader_class, monkeypatch
+    ):
+        """Test an empty LOADER_MEMORY_LIMIT_MB, as in .env.example, means no limit."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import main
+
+        monkeypatch.setenv('LOADER_MEMORY_LIMIT_MB', '')
+        mock_connector_class.return_value.test_connection.return_value = True
+        main()
+
+        assert mock_loader_class.call_args.kwargs['memory_limit_mb'] is None
+
     @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
     def test_file_table_mapping_contains_all_files(self, mock_connector_class):
         """Test that all expected CSV files are mapped to tables."""
@@ -69,7 +99,7 @@ class TestEcommerceDataLoader:
             assert info['status'] == 'skipped'
             assert info['reason'] == 'file not found'
 
-    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.pd.read_csv')
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.read_source_table')
     @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
     def test_load_all_files_success(self, mock_connector_class, mock_read_csv, tmp_path, capsys):
         """Test load_all_files successfully loads CSV files."""
@@ -83,12 +113,12 @@ class TestEcommerceDataLoader:
         test_csv = data_dir / 'olist_customers_dataset.csv'
         test_csv.touch()
 
-        # Mock pandas read_csv
+        # Mock the CSV parser
         mock_df = pd.DataFrame({
             'customer_id': ['c1', 'c2'],
             'customer_city': ['São Paulo', 'Rio']
         })
-        mock_read_csv.return_value = mock_df
+        mock_read_csv.return_value = pa.Table.from_pandas(mock_df)
 
         # Mock the connector
         mock_connector = MagicMock()
@@ -104,7 +134,7 @@ class TestEcommerceDataLoader:
         assert results['CUSTOMERS']['status'] == 'success'
         assert results['CUSTOMERS']['rows'] == 2
 
-    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.pd.read_csv')
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.read_source_table')
     @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
     def test_load_all_files_handles_errors(self, mock_connector_class, mock_read_csv, tmp_path, capsys):
         """Test load_all_files handles errors during loading."""
@@ -131,6 +161,421 @@ class TestEcommerceDataLoader:
         assert results['CUSTOMERS']['status'] == 'error'
         assert 'Failed to read CSV' in results['CUSTOMERS']['error']
 
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.read_source_table')
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_load_all_files_parallel(self, mock_connector_class, mock_read_csv, tmp_path):
+        """Test parallel mode loads every table, largest files first."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        data_dir = tmp_path / 'data' / 'raw'
+        data_dir.mkdir(parents=True)
+        sizes = {
+            'olist_customers_dataset.csv': 10,
+            'olist_geolocation_dataset.csv': 500,
+            'olist_order_items_dataset.csv': 300,
+            'olist_sellers_dataset.csv': 20,
+        }
+        for name, size in sizes.items():
+            (data_dir / name).write_text('x' * size)
+
+        mock_read_csv.return_value = pa.table({'id': [1, 2, 3]})
+
+        mock_connector = MagicMock()
+        mock_connector.load_csv_to_snowflake.return_value = True
+        mock_connector.database = 'ECOMMERCE_DEV'
+        mock_connector_class.return_value = mock_connector
+
+        loader = EcommerceDataLoader(data_dir=str(data_dir), max_workers=2)
+        results = loader.load_all_files()
+
+        # Two workers pick up the two largest files first
+        first_reads = {Path(c.args[0]).name for c in mock_read_csv.call_args_list[:2]}
+        assert first_reads == {'olist_geolocation_dataset.csv', 'olist_order_items_dataset.csv'}
+
+        # Results keep the mapping order and cover every table
+        assert list(results) == list(loader.file_table_mapping.values())
+        for table in ('CUSTOMERS', 'GEOLOCATION', 'ORDER_ITEMS', 'SELLERS'):
+            assert results[table]['status'] == 'success'
+            assert results[table]['rows'] == 3
+            assert results[table]['columns'] == 1
+        assert results['ORDERS']['status'] == 'skipped'
+        assert mock_connector.load_csv_to_snowflake.call_count == 4
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.read_source_table')
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_load_all_files_parallel_isolates_errors(self, mock_connector_class, mock_read_csv, tmp_path):
+        """Test a failing table does not affect other tables in parallel mode."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        data_dir = tmp_path / 'data' / 'raw'
+        data_dir.mkdir(parents=True)
+        (data_dir / 'olist_customers_dataset.csv').write_text('bad')
+        (data_dir / 'olist_sellers_dataset.csv').write_text('good')
+
+        def read_csv(path, *args, **kwargs):
+            if Path(path).name == 'olist_customers_dataset.csv':
+                raise Exception("Failed to read CSV")
+            return pa.table({'id': [1]})
+
+        mock_read_csv.side_effect = read_csv
+
+        mock_connector = MagicMock()
+        mock_connector.load_csv_to_snowflake.return_value = True
+        mock_connector.database = 'ECOMMERCE_DEV'
+        mock_connector_class.return_value = mock_connector
+
+        loader = EcommerceDataLoader(data_dir=str(data_dir))
+        results = loader.load_all_files(max_workers=4)
+
+        assert results['CUSTOMERS']['status'] == 'error'
+        assert results['SELLERS']['status'] == 'success'
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_load_all_files_streaming(self, mock_connector_class, tmp_path):
+        """Test streaming mode uploads a CSV in memory-bounded chunks."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        data_dir = tmp_path / 'data' / 'raw'
+        data_dir.mkdir(parents=True)
+        pd.DataFrame({
+            'geolocation_zip_code_prefix': range(5000),
+            'geolocation_city': ['sao paulo'] * 5000,
+        }).to_csv(data_dir / 'olist_geolocation_dataset.csv', index=False)
+
+        chunk_sizes = []
+
+        def load_chunks(chunks, table_name, schema, if_exists, **kwargs):
+            for chunk in chunks:
+                chunk_sizes.append(len(chunk))
+            return True, sum(chunk_sizes)
+
+        mock_connector = MagicMock()
+        mock_connector.load_chunks_to_snowflake.side_effect = load_chunks
+        mock_connector.database = 'ECOMMERCE_DEV'
+        mock_connector_class.return_value = mock_connector
+
+        loader = EcommerceDataLoader(data_dir=str(data_dir), memory_limit_mb=0.1)
+        results = loader.load_all_files()
+
+        assert results['GEOLOCATION']['status'] == 'success'
+        assert results['GEOLOCATION']['rows'] == 5000
+        assert results['GEOLOCATION']['columns'] == 2
+        assert results['GEOLOCATION']['chunks'] == len(chunk_sizes) > 1
+        assert max(chunk_sizes) < 5000
+        mock_connector.load_csv_to_snowflake.assert_not_called()
+
+
+class TestIncrementalLoads:
+    """Tests for manifest-driven incremental loads."""
+
+    @staticmethod
+    def _write_orders(data_dir, timestamps):
+        pd.DataFrame({
+            'order_id': [f'o{i}' for i in range(len(timestamps))],
+            'order_purchase_timestamp': timestamps,
+        }).to_csv(data_dir / 'olist_orders_dataset.csv', index=False)
+
+    @staticmethod
+    def _loader(mock_connector_class, data_dir, **kwargs):
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        mock_connector = MagicMock()
+        mock_connector.database = 'ECOMMERCE_DEV'
+        mock_connector.load_csv_to_snowflake.return_value = True
+        appended = []
+
+        def load_chunks(chunks, table_name, schema, if_exists, **kwargs):
+            frames = list(chunks)
+            appended.extend(frames)
+            return True, sum(len(f) for f in frames)
+
+        mock_connector.load_chunks_to_snowflake.side_effect = load_chunks
+        mock_connector_class.return_value = mock_connector
+        kwargs.setdefault('incremental', True)
+        loader = EcommerceDataLoader(data_dir=str(data_dir), **kwargs)
+        return loader, mock_connector, appended
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_unchanged_files_are_skipped(self, mock_connector_class, tmp_path):
+        """Test a second run skips files that did not change."""
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        self._write_orders(data_dir, ['2017-01-01 10:00:00', '2017-01-02 10:00:00'])
+
+        loader, connector, _ = self._loader(mock_connector_class, data_dir)
+        assert loader.load_all_files()['ORDERS']['status'] == 'success'
+
+        results = loader.load_all_files()
+        assert results['ORDERS'] == {'status': 'unchanged', 'rows': 2}
+        assert connector.load_csv_to_snowflake.call_count == 1
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_touched_file_with_same_content_is_skipped(self, mock_connector_class, tmp_path):
+        """Test a file whose mtime changed but whose content did not is not reloaded."""
+        import os
+
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        self._write_orders(data_dir, ['2017-01-01 10:00:00'])
+
+        loader, connector, _ = self._loader(mock_connector_class, data_dir)
+        loader.load_all_files()
+        path = data_dir / 'olist_orders_dataset.csv'
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 60))
+
+        assert loader.load_all_files()['ORDERS'] == {'status': 'unchanged', 'rows': 1}
+        assert connector.load_csv_to_snowflake.call_count == 1
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.file_digest')
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_full_reload_does_not_hash_files(
+        self, mock_connector_class, mock_file_digest, tmp_path
+    ):
+        """Test runs without incremental neither hash files nor keep stale manifest entries."""
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        self._write_orders(data_dir, ['2017-01-01 10:00:00'])
+        mock_file_digest.return_value = 'digest'
+
+        loader, _, _ = self._loader(mock_connector_class, data_dir)
+        loader.load_all_files()
+        assert loader.load_all_files()['ORDERS']['status'] == 'unchanged'
+        hashed = mock_file_digest.call_count
+
+        self._write_orders(data_dir, ['2017-01-01 10:00:00', '2017-01-02 10:00:00'])
+        full, _, _ = self._loader(mock_connector_class, data_dir, incremental=False)
+        assert full.load_all_files()['ORDERS']['status'] == 'success'
+
+        assert mock_file_digest.call_count == hashed
+        # The incremental entry no longer describes the table, so it fully reloads
+        result = loader.load_all_files()['ORDERS']
+        assert result['status'] == 'success'
+        assert 'since' not in result
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_memory_limited_plan_streams_the_file(self, mock_connector_class, tmp_path):
+        """Test incremental planning under a memory limit never reads a whole file."""
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        self._write_orders(data_dir, ['2017-01-01 10:00:00', '2017-01-02 10:00:00'])
+
+        loader, _, appended = self._loader(mock_connector_class, data_dir, memory_limit_mb=64)
+        loader._read_csv = MagicMock(side_effect=AssertionError('whole-file read'))
+        loader._read_table = MagicMock(side_effect=AssertionError('whole-file read'))
+        assert loader.load_all_files()['ORDERS']['status'] == 'success'
+
+        self._write_orders(data_dir, [
+            '2017-01-01 10:00:00', '2017-01-02 10:00:00', '2017-01-03 10:00:00'
+        ])
+        results = loader.load_all_files()
+
+        assert results['ORDERS']['since'] == '2017-01-02T10:00:00'
+        assert appended[-1]['order_id'].tolist() == ['o2']
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_new_rows_are_appended(self, mock_connector_class, tmp_path):
+        """Test only rows past the watermark are appended."""
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        self._write_orders(data_dir, ['2017-01-01 10:00:00', '2017-01-02 10:00:00'])
+
+        loader, connector, appended = self._loader(mock_connector_class, data_dir)
+        loader.load_all_files()
+
+        self._write_orders(data_dir, [
+            '2017-01-01 10:00:00', '2017-01-02 10:00:00', '2017-01-03 10:00:00'
+        ])
+        results = loader.load_all_files()
+
+        assert results['ORDERS']['status'] == 'success'
+        assert results['ORDERS']['rows'] == 1
+        assert results['ORDERS']['since'] == '2017-01-02T10:00:00'
+        assert connector.load_chunks_to_snowflake.call_args.kwargs['if_exists'] == 'append'
+        assert appended[0]['order_id'].tolist() == ['o2']
+
+        # The manifest now covers all three rows
+        assert loader.load_all_files()['ORDERS'] == {'status': 'unchanged', 'rows': 3}
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_rewritten_history_falls_back_to_full_reload(self, mock_connector_class, tmp_path):
+        """Test rows changed before the watermark trigger a full reload."""
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        self._write_orders(data_dir, ['2017-01-01 10:00:00', '2017-01-02 10:00:00'])
+
+        loader, connector, _ = self._loader(mock_connector_class, data_dir)
+        loader.load_all_files()
+
+        # One old row removed, one new row added
+        self._write_orders(data_dir, ['2017-01-02 10:00:00', '2017-01-03 10:00:00'])
+        results = loader.load_all_files()
+
+        assert results['ORDERS']['status'] == 'success'
+        assert 'since' not in results['ORDERS']
+        assert connector.load_csv_to_snowflake.call_count == 2
+        connector.load_chunks_to_snowflake.assert_not_called()
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_edited_history_falls_back_to_full_reload(self, mock_connector_class, tmp_path):
+        """Test an old row edited in place triggers a full reload despite equal counts."""
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        self._write_orders(data_dir, ['2017-01-01 10:00:00', '2017-01-02 10:00:00'])
+
+        loader, connector, _ = self._loader(mock_connector_class, data_dir)
+        loader.load_all_files()
+
+        # Same number of rows before the watermark, but the first one changed
+        self._write_orders(data_dir, [
+            '2017-01-01 11:00:00', '2017-01-02 10:00:00', '2017-01-03 10:00:00'
+        ])
+        results = loader.load_all_files()
+
+        assert results['ORDERS']['status'] == 'success'
+        assert 'since' not in results['ORDERS']
+        assert connector.load_csv_to_snowflake.call_count == 2
+        connector.load_chunks_to_snowflake.assert_not_called()
+
+
+class TestCheckpointedLoads:
+    """Tests for checkpoints passed to full loads."""
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_failed_load_resumes_with_same_checkpoint(self, mock_connector_class, tmp_path):
+        """Test a rerun of a failed load picks up the checkpoint of the same file."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        TestIncrementalLoads._write_orders(data_dir, ['2017-01-01 10:00:00'])
+
+        mock_connector = MagicMock()
+        mock_connector.database = 'ECOMMERCE_DEV'
+
+        def fail_after_first_chunk(df, table_name, schema, if_exists, columns, checkpoint,
+                                   stats):
+            checkpoint.record(0, len(df))
+            return False
+
+        mock_connector.load_csv_to_snowflake.side_effect = fail_after_first_chunk
+        mock_connector_class.return_value = mock_connector
+
+        loader = EcommerceDataLoader(data_dir=str(data_dir))
+        assert loader.load_all_files()['ORDERS']['status'] == 'failed'
+
+        mock_connector.load_csv_to_snowflake.side_effect = None
+        mock_connector.load_csv_to_snowflake.return_value = True
+        loader.load_all_files()
+
+        checkpoint = mock_connector.load_csv_to_snowflake.call_args.kwargs['checkpoint']
+        assert checkpoint.path == tmp_path / 'load_checkpoints' / 'ECOMMERCE_DEV.RAW.ORDERS.json'
+        assert checkpoint.resuming
+        assert checkpoint.completed == 1
+
+
+class TestPreaggregatedLoads:
+    """Tests for loading GEOLOCATION pre-aggregated."""
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_geolocation_is_loaded_aggregated(self, mock_connector_class, tmp_path):
+        """Test only one row per zip code prefix is uploaded."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        pd.DataFrame({
+            'geolocation_zip_code_prefix': ['01001', '01001', '02002'],
+            'geolocation_lat': [-23.1, -23.3, -22.0],
+            'geolocation_lng': [-46.1, -46.3, -45.0],
+            'geolocation_city': ['sao paulo', 'sao paulo', 'guarulhos'],
+            'geolocation_state': ['SP', 'SP', 'SP'],
+        }).to_csv(data_dir / 'olist_geolocation_dataset.csv', index=False)
+
+        mock_connector = MagicMock()
+        mock_connector.database = 'ECOMMERCE_DEV'
+        mock_connector.load_csv_to_snowflake.return_value = True
+        mock_connector_class.return_value = mock_connector
+
+        loader = EcommerceDataLoader(data_dir=str(data_dir), preaggregate=True)
+        results = loader.load_all_files()
+
+        assert results['GEOLOCATION']['rows'] == 2
+        assert results['GEOLOCATION']['source_rows'] == 3
+        uploaded = mock_connector.load_csv_to_snowflake.call_args.kwargs['df']
+        assert uploaded['geolocation_zip_code_prefix'].tolist() == ['01001', '02002']
+        assert uploaded['geolocation_city'].tolist() == ['Sao Paulo', 'Guarulhos']
+
+        # The dbt model built from full RAW data matches the local aggregate
+        mock_connector.execute_query.return_value = [
+            ('01001', -23.2, -46.2, 'Sao Paulo', 'SP'),
+            ('02002', -22.0, -45.0, 'Guarulhos', 'SP'),
+        ]
+        assert loader.check_preaggregations() == {'GEOLOCATION': []}
+
+
+class TestCachedLoads:
+    """Tests for loads through the columnar cache."""
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_repeat_run_reads_from_cache(self, mock_connector_class, tmp_path):
+        """Test a second run uploads the same data without parsing the CSV."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        pd.DataFrame({
+            'seller_id': ['s1', 's2'],
+            'seller_zip_code_prefix': ['01001', '02002'],
+            'seller_city': ['sao paulo', 'guarulhos'],
+            'seller_state': ['SP', 'SP'],
+        }).to_csv(data_dir / 'olist_sellers_dataset.csv', index=False)
+
+        mock_connector = MagicMock()
+        mock_connector.database = 'ECOMMERCE_DEV'
+        mock_connector.load_csv_to_snowflake.return_value = True
+        mock_connector_class.return_value = mock_connector
+
+        loader = EcommerceDataLoader(data_dir=str(data_dir), use_cache=True)
+        loader.load_all_files()
+        first = mock_connector.load_csv_to_snowflake.call_args.kwargs['df']
+        assert list((tmp_path / 'cache').glob('olist_sellers_dataset-*.arrow'))
+
+        with patch('src.ecommerce_analytics.data_loader.columnar_cache.read_source_table') as parse:
+            results = loader.load_all_files()
+        parse.assert_not_called()
+
+        assert results['SELLERS']['status'] == 'success'
+        second = mock_connector.load_csv_to_snowflake.call_args.kwargs['df']
+        pd.testing.assert_frame_equal(first, second)
+        assert second['seller_zip_code_prefix'].tolist() == ['01001', '02002']
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_incremental_run_hashes_each_file_once(self, mock_connector_class, tmp_path):
+        """Test the cache reuses the digest computed while planning an incremental load."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        pd.DataFrame({
+            'seller_id': ['s1'],
+            'seller_zip_code_prefix': ['01001'],
+            'seller_city': ['sao paulo'],
+            'seller_state': ['SP'],
+        }).to_csv(data_dir / 'olist_sellers_dataset.csv', index=False)
+
+        mock_connector = MagicMock()
+        mock_connector.database = 'ECOMMERCE_DEV'
+        mock_connector.load_csv_to_snowflake.return_value = True
+        mock_connector_class.return_value = mock_connector
+
+        loader = EcommerceDataLoader(data_dir=str(data_dir), use_cache=True, incremental=True)
+        with patch('src.ecommerce_analytics.data_loader.columnar_cache.file_digest') as hash_file:
+            results = loader.load_all_files()
+
+        assert results['SELLERS']['status'] == 'success'
+        hash_file.assert_not_called()
+        assert list((tmp_path / 'cache').glob('olist_sellers_dataset-*.arrow'))
+
 
 class TestDataLoaderIntegration:
     """Integration-style tests for data loader."""
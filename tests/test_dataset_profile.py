@@ -0,0 +1,109 @@
+"""
+Unit tests for the single-pass dataset profiler.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Write a small set of source files and return the directory."""
+    data_dir = tmp_path / 'raw'
+    data_dir.mkdir()
+    pd.DataFrame({
+        'customer_id': ['c1', 'c2', 'c3'],
+        'customer_unique_id': ['u1', 'u1', 'u2'],
+        'customer_zip_code_prefix': ['01001', '02002', None],
+        'customer_city': ['sao paulo', 'sao paulo', 'rio de janeiro'],
+        'customer_state': ['SP', 'SP', 'RJ'],
+    }).to_csv(data_dir / 'olist_customers_dataset.csv', index=False)
+    pd.DataFrame({
+        'order_id': ['o1', 'o2', 'o3', 'o4'],
+        'customer_id': ['c1', 'c2', 'c3', 'c1'],
+        'order_status': ['delivered', 'shipped', 'delivered', 'canceled'],
+        'order_purchase_timestamp': [
+            '2017-03-01 10:00:00', '2016-09-04 21:15:19', '2018-10-17 17:30:18', None
+        ],
+    }).to_csv(data_dir / 'olist_orders_dataset.csv', index=False)
+    pd.DataFrame({'a': [1, 2]}).to_csv(data_dir / 'notes.csv', index=False)
+    return data_dir
+
+
+class TestDistinctSketch:
+    """Tests for the k-minimum-values distinct count."""
+
+    def test_exact_below_k_and_close_above(self):
+        """Test small counts are exact and large ones within a few percent."""
+        from src.ecommerce_analytics.profiling.dataset_profile import DistinctSketch
+
+        rng = np.random.default_rng(0)
+        small = DistinctSketch(k=1024)
+        small.update(rng.integers(0, 2**63, 500, dtype=np.uint64).repeat(3))
+        assert small.estimate() == 500
+
+        large = DistinctSketch(k=1024)
+        values = rng.integers(0, 2**63, 200_000, dtype=np.uint64) * np.uint64(2)
+        for batch in np.array_split(values, 7):
+            large.update(batch)
+            large.update(batch)
+        assert large.estimate() == pytest.approx(200_000, rel=0.1)
+
+
+class TestProfileDataset:
+    """Tests for profile_dataset."""
+
+    def test_columns_and_key_metrics(self, data_dir):
+        """Test per-column statistics and the cross-file key metrics."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+        from src.ecommerce_analytics.profiling.dataset_profile import profile_dataset
+
+        profile = profile_dataset(data_dir, EcommerceDataLoader.FILE_TABLE_MAPPING, max_workers=2)
+
+        customers = profile['tables']['CUSTOMERS']
+        assert customers['rows'] == 3
+        assert customers['source'] == 'csv'
+        zip_code = customers['columns']['customer_zip_code_prefix']
+        assert zip_code['null_rate'] == pytest.approx(1 / 3, abs=1e-6)
+        assert (zip_code['min'], zip_code['max']) == ('01001', '02002')
+        assert customers['columns']['customer_state']['approx_distinct'] == 2
+        assert customers['bytes'] > 0
+
+        orders = profile['tables']['ORDERS']['columns']
+        assert orders['order_status']['type'].startswith('dictionary')
+        assert orders['order_status']['approx_distinct'] == 3
+        assert profile['tables']['notes']['rows'] == 2
+
+        assert profile['metrics'] == {
+            'total_orders': 4,
+            'total_order_items': None,
+            'unique_customers': 2,
+            'first_purchase': pd.Timestamp('2016-09-04 21:15:19').to_pydatetime(),
+            'last_purchase': pd.Timestamp('2018-10-17 17:30:18').to_pydatetime(),
+        }
+
+    def test_cached_files_give_the_same_profile(self, data_dir, tmp_path):
+        """Test files in the columnar cache are profiled from it, with the same result."""
+        from src.ecommerce_analytics.data_loader.columnar_cache import ColumnarCache
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+        from src.ecommerce_analytics.profiling.dataset_profile import (
+            profile_dataset,
+            save_profile,
+        )
+
+        mapping = EcommerceDataLoader.FILE_TABLE_MAPPING
+        cache = ColumnarCache(tmp_path / 'cache')
+        parsed = profile_dataset(data_dir, mapping, cache=cache)
+        cache.read_table(data_dir / 'olist_orders_dataset.csv', 'ORDERS')
+        cached = profile_dataset(data_dir, mapping, cache=cache)
+
+        assert cached['tables']['ORDERS']['source'] == 'cache'
+        assert cached['tables']['CUSTOMERS']['source'] == 'csv'
+        assert cached['tables']['ORDERS']['columns'] == parsed['tables']['ORDERS']['columns']
+
+        path = save_profile(cached, tmp_path / 'profiles' / 'profile.json')
+        with open(path) as f:
+            saved = json.load(f)
+        assert saved['metrics']['first_purchase'] == '2016-09-04 21:15:19'
@@ -0,0 +1,149 @@
+"""
+Unit tests for the dbt run profiler.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+RUN_START = datetime(2024, 1, 1, 5, 0, tzinfo=timezone.utc)
+
+
+def _artifacts(schedule, depends_on, invocation_id='inv-1', full_refresh=False, threads=2):
+    """
+    Build run_results.json and manifest.json contents.
+
+    Args:
+        schedule: Model name -> (thread, start offset, seconds, status).
+        depends_on: Model name -> upstream unique ids.
+    """
+    results = []
+    nodes = {}
+    for name, (thread, offset, seconds, status) in schedule.items():
+        unique_id = f'model.ecommerce_dw.{name}'
+        start = RUN_START + timedelta(seconds=offset)
+        end = start + timedelta(seconds=seconds)
+        results.append({
+            'unique_id': unique_id,
+            'status': status,
+            'execution_time': seconds,
+            'thread_id': f'Thread-{thread}',
+            'timing': [
+                {'name': 'compile', 'started_at': start.isoformat().replace('+00:00', 'Z'),
+                 'completed_at': start.isoformat().replace('+00:00', 'Z')},
+                {'name': 'execute', 'started_at': start.isoformat().replace('+00:00', 'Z'),
+                 'completed_at': end.isoformat().replace('+00:00', 'Z')},
+            ],
+        })
+    for name, parents in depends_on.items():
+        nodes[f'model.ecommerce_dw.{name}'] = {
+            'name': name,
+            'resource_type': 'model',
+            'config': {'materialized': 'table'},
+            'depends_on': {'nodes': parents},
+        }
+    run_results = {
+        'metadata': {'invocation_id': invocation_id, 'generated_at': '2024-01-01T05:01:00Z'},
+        'elapsed_time': 14.0,
+        'args': {'which': 'run', 'full_refresh': full_refresh, 'threads': threads},
+        'results': results,
+    }
+    return run_results, {'nodes': nodes, 'sources': {}}
+
+
+# stg_a and stg_b feed int_x through an ephemeral model that is not in the
+# run; fct depends on int_x; dim is independent. Two threads.
+DEPENDS_ON = {
+    'stg_a': ['source.ecommerce_dw.raw.orders'],
+    'stg_b': ['source.ecommerce_dw.raw.items'],
+    'eph': ['model.ecommerce_dw.stg_b'],
+    'int_x': ['model.ecommerce_dw.stg_a', 'model.ecommerce_dw.eph'],
+    'fct': ['model.ecommerce_dw.int_x'],
+    'dim': ['model.ecommerce_dw.stg_a'],
+}
+SCHEDULE = {
+    'stg_a': (1, 0.0, 2.0, 'success'),
+    'stg_b': (2, 0.0, 5.0, 'success'),
+    'dim': (1, 2.0, 4.0, 'success'),
+    'int_x': (1, 6.0, 3.0, 'success'),
+    'fct': (1, 9.0, 1.0, 'success'),
+}
+
+
+class TestProfileRun:
+    """Tests for profile_run."""
+
+    def test_critical_path_and_parallelism(self):
+        """Test the critical path follows ephemeral dependencies and bounds the parallelism."""
+        from src.ecommerce_analytics.profiling.dbt_run_profile import profile_run
+
+        profile = profile_run(*_artifacts(SCHEDULE, DEPENDS_ON))
+
+        path = profile['critical_path']
+        assert [profile['nodes'][uid]['name'] for uid in path['nodes']] == [
+            'stg_b', 'int_x', 'fct'
+        ]
+        assert path['seconds'] == pytest.approx(9.0)
+        assert profile['busy_seconds'] == pytest.approx(15.0)
+        assert profile['span_seconds'] == pytest.approx(10.0)
+        assert profile['achieved_parallelism'] == pytest.approx(1.5)
+        assert profile['possible_parallelism'] == pytest.approx(15.0 / 9.0, abs=0.01)
+        assert profile['ideal_seconds'] == pytest.approx(9.0)
+        # int_x was ready when stg_b finished at 5s but its thread was busy until 6s
+        assert profile['nodes']['model.ecommerce_dw.int_x']['wait_seconds'] == pytest.approx(1.0)
+
+
+class TestCompareProfiles:
+    """Tests for the history and regression checks."""
+
+    def test_flags_slower_nodes_against_comparable_run(self, tmp_path):
+        """Test regressions are flagged against the last run with the same refresh mode."""
+        from src.ecommerce_analytics.profiling.dbt_run_profile import (
+            append_history,
+            compare_profiles,
+            load_history,
+            previous_profile,
+            profile_run,
+        )
+
+        history_path = tmp_path / 'history.jsonl'
+        baseline = profile_run(*_artifacts(SCHEDULE, DEPENDS_ON, 'inv-1'))
+        full_refresh = profile_run(*_artifacts(
+            {**SCHEDULE, 'int_x': (1, 6.0, 30.0, 'success')}, DEPENDS_ON, 'inv-2',
+            full_refresh=True,
+        ))
+        assert append_history(baseline, history_path)
+        assert append_history(full_refresh, history_path)
+        assert not append_history(baseline, history_path)
+
+        slower = {**SCHEDULE, 'int_x': (1, 6.0, 6.0, 'success'), 'fct': (1, 12.0, 1.1, 'success'),
+                  'dim': (1, 2.0, 0.5, 'error')}
+        current = profile_run(*_artifacts(slower, DEPENDS_ON, 'inv-3'))
+        previous = previous_profile(load_history(history_path), current)
+        regressions = compare_profiles(previous, current)
+
+        assert previous['invocation_id'] == 'inv-1'
+        assert len(load_history(history_path)) == 2
+        assert {(r['node'], r['metric']) for r in regressions} == {
+            ('int_x', 'seconds'), ('*', 'critical_path_seconds')
+        }
+        assert regressions[0]['node'] == 'int_x'
+
+    def test_main_reads_saved_artifacts(self, tmp_path, capsys, monkeypatch):
+        """Test the CLI profiles a target directory and records the run."""
+        from src.ecommerce_analytics.profiling import dbt_run_profile
+
+        run_results, manifest = _artifacts(SCHEDULE, DEPENDS_ON)
+        (tmp_path / 'run_results.json').write_text(json.dumps(run_results))
+        (tmp_path / 'manifest.json').write_text(json.dumps(manifest))
+        history_path = tmp_path / 'history.jsonl'
+
+        argv = ['dbt_run_profile', '--target-dir', str(tmp_path), '--history', str(history_path)]
+        monkeypatch.setattr('sys.argv', argv)
+        with pytest.raises(SystemExit) as exit_info:
+            dbt_run_profile.main()
+
+        output = capsys.readouterr().out
+        assert exit_info.value.code == 0
+        assert 'stg_b → int_x → fct' in output
+        assert len(history_path.read_text().splitlines()) == 1
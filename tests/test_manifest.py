@@ -0,0 +1,44 @@
+"""
+Unit tests for the RAW load manifest.
+"""
+import os
+
+
+class TestLoadManifest:
+    """Tests for LoadManifest."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test entries survive a save and reload."""
+        from src.ecommerce_analytics.data_loader.manifest import LoadManifest
+
+        path = tmp_path / 'load_manifest.json'
+        manifest = LoadManifest(path)
+        manifest.update('DB.RAW.ORDERS', {'sha256': 'abc', 'size': 1, 'mtime': 2.0, 'rows': 3})
+        manifest.save()
+
+        entry = LoadManifest(path).get('DB.RAW.ORDERS')
+        assert entry['rows'] == 3
+        assert entry['sha256'] == 'abc'
+        assert 'loaded_at' in entry
+
+    def test_is_unchanged(self, tmp_path):
+        """Test change detection by stat shortcut and by content hash."""
+        from src.ecommerce_analytics.data_loader.manifest import LoadManifest, file_digest
+
+        csv = tmp_path / 'orders.csv'
+        csv.write_text('order_id\no1\n')
+        stat = csv.stat()
+
+        manifest = LoadManifest(tmp_path / 'load_manifest.json')
+        assert manifest.is_unchanged('K', csv) == (False, file_digest(csv))
+
+        manifest.update('K', {'sha256': file_digest(csv), 'size': stat.st_size,
+                              'mtime': stat.st_mtime, 'rows': 1})
+        assert manifest.is_unchanged('K', csv) == (True, None)
+
+        # Touched but identical content: hashed, still unchanged
+        os.utime(csv, (stat.st_atime, stat.st_mtime + 10))
+        assert manifest.is_unchanged('K', csv)[0] is True
+
+        csv.write_text('order_id\no1\no2\n')
+        assert manifest.is_unchanged('K', csv)[0] is False
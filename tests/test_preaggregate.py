@@ -0,0 +1,72 @@
+"""
+Unit tests for local pre-aggregation of RAW tables.
+"""
+import pandas as pd
+import pytest
+
+
+class TestGeolocationPreaggregation:
+    """Tests for the GEOLOCATION aggregate mirroring stg_geolocation."""
+
+    def test_initcap_matches_snowflake(self):
+        """Test only Snowflake's delimiters start a new word."""
+        from src.ecommerce_analytics.data_loader.preaggregate import snowflake_initcap
+
+        assert snowflake_initcap('SAO PAULO') == 'Sao Paulo'
+        assert snowflake_initcap("pau d'alho") == "Pau D'alho"
+        assert snowflake_initcap('são joão-del rei') == 'São João-Del Rei'
+
+    def test_one_row_per_zip(self):
+        """Test coordinates are averaged and the max cleaned city/state kept."""
+        from src.ecommerce_analytics.data_loader.preaggregate import aggregate_geolocation
+
+        df = pd.DataFrame({
+            'geolocation_zip_code_prefix': ['01001', '01001', '01001', '99990'],
+            'geolocation_lat': [-23.0, -23.5, None, -10.0],
+            'geolocation_lng': [-46.0, -46.5, -47.0, -50.0],
+            'geolocation_city': [' sao paulo', 'SÃO PAULO', 'sao paulo', 'palmas'],
+            'geolocation_state': ['sp ', 'SP', 'sp', 'to'],
+        })
+
+        result = aggregate_geolocation(df).set_index('geolocation_zip_code_prefix')
+
+        assert list(result.index) == ['01001', '99990']
+        assert result.loc['01001', 'geolocation_lat'] == pytest.approx(-23.25)
+        assert result.loc['01001', 'geolocation_lng'] == pytest.approx(-46.5)
+        # 'São Paulo' sorts after 'Sao Paulo', as with Snowflake's MAX
+        assert result.loc['01001', 'geolocation_city'] == 'São Paulo'
+        assert result.loc['01001', 'geolocation_state'] == 'SP'
+        assert result.loc['99990', 'geolocation_city'] == 'Palmas'
+
+    def test_aggregate_is_stable_under_reaggregation(self):
+        """Test dbt re-aggregating the loaded table changes nothing."""
+        from src.ecommerce_analytics.data_loader.preaggregate import (
+            aggregate_geolocation,
+            compare_to_model,
+            geolocation_model,
+        )
+
+        df = pd.DataFrame({
+            'geolocation_zip_code_prefix': ['01001', '01001', '02002'],
+            'geolocation_lat': [-23.1, -23.2, -22.0],
+            'geolocation_lng': [-46.1, -46.2, -45.0],
+            'geolocation_city': ['sao paulo', 'sao paulo', 'guarulhos'],
+            'geolocation_state': ['SP', 'SP', 'SP'],
+        })
+        once = geolocation_model(aggregate_geolocation(df))
+        twice = geolocation_model(aggregate_geolocation(aggregate_geolocation(df)))
+
+        assert compare_to_model(once, twice, 'zip_code_prefix') == []
+
+    def test_compare_to_model_reports_differences(self):
+        """Test missing keys and differing values are reported."""
+        from src.ecommerce_analytics.data_loader.preaggregate import compare_to_model
+
+        expected = pd.DataFrame({'zip': ['1', '2', '3'], 'lat': [1.0, 2.0, 3.0], 'city': ['A', 'B', 'C']})
+        actual = pd.DataFrame({'zip': ['1', '2'], 'lat': [1.0, 2.5], 'city': ['A', 'X']})
+
+        problems = compare_to_model(expected, actual, 'zip')
+
+        assert any('missing from model' in p and "'3'" in p for p in problems)
+        assert any(p.startswith('lat: 1 rows differ') for p in problems)
+        assert any(p.startswith('city: 1 rows differ') for p in problems)
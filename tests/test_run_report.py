@@ -0,0 +1,163 @@
+"""
+Unit tests for loader throughput instrumentation and run reports.
+"""
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+
+def _report(seconds, tables):
+    return {
+        'version': 1,
+        'started_at': '2024-01-01T00:00:00+00:00',
+        'seconds': seconds,
+        'database': 'ECOMMERCE_DEV',
+        'schema': 'RAW',
+        'settings': {},
+        'peak_rss_mb': 200.0,
+        'tables': tables,
+    }
+
+
+class TestPhaseTimer:
+    """Tests for PhaseTimer."""
+
+    def test_iterate_times_only_item_production(self):
+        """Test time spent by the consumer is not counted."""
+        import time
+        from src.ecommerce_analytics.data_loader.run_report import PhaseTimer
+
+        def produce():
+            for i in range(2):
+                time.sleep(0.01)
+                yield i
+
+        timer = PhaseTimer()
+        with timer.phase('upload'):
+            for _ in timer.iterate(produce(), 'parse'):
+                time.sleep(0.03)
+
+        assert 0.02 <= timer.phases['parse'] < 0.05
+        assert timer.phases['upload'] >= 0.08
+
+
+class TestCompareRuns:
+    """Tests for compare_runs."""
+
+    def test_flags_slower_tables_and_phases(self):
+        """Test duration and throughput regressions beyond the threshold are flagged."""
+        from src.ecommerce_analytics.data_loader.run_report import compare_runs
+
+        previous = _report(10.0, {
+            'ORDERS': {'status': 'success', 'rows': 1000, 'seconds': 4.0, 'rows_per_sec': 250.0,
+                       'phases': {'parse': 1.0, 'upload': 3.0}},
+            'SELLERS': {'status': 'success', 'rows': 10, 'seconds': 2.0, 'rows_per_sec': 5.0},
+        })
+        current = _report(11.0, {
+            'ORDERS': {'status': 'success', 'rows': 1000, 'seconds': 8.0, 'rows_per_sec': 125.0,
+                       'phases': {'parse': 1.1, 'upload': 6.9}},
+            'SELLERS': {'status': 'success', 'rows': 10, 'seconds': 2.1, 'rows_per_sec': 4.8},
+        })
+
+        regressions = compare_runs(previous, current)
+        flagged = {(r['table'], r['metric']) for r in regressions}
+
+        assert flagged == {
+            ('ORDERS', 'seconds'), ('ORDERS', 'rows_per_sec'), ('ORDERS', 'phases.upload')
+        }
+        assert regressions[0]['metric'] == 'phases.upload'
+
+    def test_ignores_short_and_failed_loads(self):
+        """Test noise-level durations and non-successful loads are not compared."""
+        from src.ecommerce_analytics.data_loader.run_report import compare_runs
+
+        previous = _report(0.5, {
+            'ORDERS': {'status': 'success', 'seconds': 0.1, 'rows_per_sec': 100.0},
+            'SELLERS': {'status': 'error', 'seconds': 2.0},
+        })
+        current = _report(0.9, {
+            'ORDERS': {'status': 'success', 'seconds': 0.4, 'rows_per_sec': 25.0},
+            'SELLERS': {'status': 'success', 'seconds': 9.0, 'rows_per_sec': 1.0},
+        })
+
+        assert compare_runs(previous, current) == []
+
+
+class TestLatestReport:
+    """Tests for latest_report."""
+
+    def test_baseline_has_the_same_load_mode(self, tmp_path):
+        """Test only reports with matching load-mode settings are picked as baseline."""
+        from src.ecommerce_analytics.data_loader.run_report import latest_report
+
+        for stamp, incremental in (('20240101', False), ('20240102', True)):
+            report = _report(10.0, {})
+            report['settings'] = {'incremental': incremental, 'use_stage': False,
+                                  'max_workers': 4}
+            (tmp_path / f'run-{stamp}T000000000000Z.json').write_text(json.dumps(report))
+
+        full = {'incremental': False, 'use_stage': False, 'max_workers': 1}
+
+        assert latest_report(tmp_path).name.startswith('run-20240102')
+        assert latest_report(tmp_path, settings=full).name.startswith('run-20240101')
+        assert latest_report(tmp_path, settings=dict(full, use_stage=True)) is None
+
+
+class TestLoaderRunReport:
+    """Tests for the run report written by EcommerceDataLoader."""
+
+    @patch('src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector')
+    def test_report_is_written_and_compared(self, mock_connector_class, tmp_path):
+        """Test each run writes a JSON report and is compared with the previous one."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+        from src.ecommerce_analytics.data_loader.run_report import load_report
+
+        data_dir = tmp_path / 'raw'
+        data_dir.mkdir()
+        pd.DataFrame({
+            'seller_id': ['s1', 's2'],
+            'seller_zip_code_prefix': ['01001', '02002'],
+            'seller_city': ['sao paulo', 'guarulhos'],
+            'seller_state': ['SP', 'SP'],
+        }).to_csv(data_dir / 'olist_sellers_dataset.csv', index=False)
+
+        def load_csv(df, stats=None, **kwargs):
+            stats['bytes_uploaded'] = 1234
+            return True
+
+        mock_connector = MagicMock()
+        mock_connector.database = 'ECOMMERCE_DEV'
+        mock_connector.load_csv_to_snowflake.side_effect = load_csv
+        mock_connector_class.return_value = mock_connector
+
+        loader = EcommerceDataLoader(data_dir=str(data_dir), report_dir=str(tmp_path / 'reports'))
+        loader.load_all_files()
+
+        reports = list((tmp_path / 'reports').glob('run-*.json'))
+        assert len(reports) == 1
+        report = load_report(reports[0])
+        sellers = report['tables']['SELLERS']
+        assert sellers['status'] == 'success'
+        assert sellers['rows'] == 2
+        assert sellers['bytes_read'] == (data_dir / 'olist_sellers_dataset.csv').stat().st_size
+        assert sellers['bytes_uploaded'] == 1234
+        # Peak memory is process-wide and only reported for the run
+        assert 'peak_rss_mb' not in sellers
+        assert report['peak_rss_mb'] > 0
+        assert set(sellers['phases']) == {'parse', 'convert', 'upload'}
+        assert sellers['rows_per_sec'] > 0
+        assert report['tables']['ORDERS'] == {'status': 'skipped'}
+        assert report['settings']['max_workers'] == 1
+
+        # Against a baseline that used far less memory, the next run is flagged
+        previous = dict(report, started_at=datetime(2000, 1, 1, tzinfo=timezone.utc).isoformat(),
+                        peak_rss_mb=1.0)
+        with open(tmp_path / 'reports' / 'run-20000101T000000000000Z.json', 'w') as f:
+            json.dump(previous, f)
+        for path in reports:
+            path.unlink()
+        loader.load_all_files()
+
+        assert any(r['metric'] == 'peak_rss_mb' for r in loader.regressions)
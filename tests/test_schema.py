@@ -0,0 +1,88 @@
+"""
+Unit tests for the source CSV schema registry.
+"""
+import pandas as pd
+
+
+class TestSchemaRegistry:
+    """Tests for the explicit Olist column types."""
+
+    def test_registry_covers_all_mapped_tables(self):
+        """Test every loaded table has a registered schema."""
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+        from src.ecommerce_analytics.data_loader.schema import TABLE_SCHEMAS
+
+        assert set(EcommerceDataLoader.FILE_TABLE_MAPPING.values()) == set(TABLE_SCHEMAS)
+
+    def test_read_source_csv_types(self, tmp_path):
+        """Test registered types are applied when reading a CSV."""
+        from src.ecommerce_analytics.data_loader.schema import read_source_csv
+
+        path = tmp_path / 'olist_customers_dataset.csv'
+        path.write_text(
+            'customer_id,customer_unique_id,customer_zip_code_prefix,customer_city,customer_state\n'
+            'c1,u1,01037,sao paulo,SP\n'
+            'c2,u2,22790,,RJ\n'
+        )
+
+        df = read_source_csv(path, 'CUSTOMERS')
+
+        assert df['customer_zip_code_prefix'].tolist() == ['01037', '22790']
+        assert isinstance(df['customer_state'].dtype, pd.CategoricalDtype)
+        assert df['customer_id'].dtype == pd.StringDtype('pyarrow')
+        assert pd.isna(df['customer_city'][1])
+
+    def test_iter_source_csv_timestamps(self, tmp_path):
+        """Test streamed chunks parse timestamps and narrow ints."""
+        from src.ecommerce_analytics.data_loader.schema import iter_source_csv
+
+        path = tmp_path / 'olist_order_reviews_dataset.csv'
+        header = ('review_id,order_id,review_score,review_comment_title,'
+                  'review_comment_message,review_creation_date,review_answer_timestamp\n')
+        rows = ''.join(f'r{i},o{i},5,,ok,2018-01-18 00:00:00,\n' for i in range(3000))
+        path.write_text(header + rows)
+
+        chunks = list(iter_source_csv(path, 'ORDER_REVIEWS', chunk_rows=1000))
+
+        assert len(chunks) == 3
+        assert sum(len(c) for c in chunks) == 3000
+        first = chunks[0]
+        assert first['review_score'].dtype == 'int8'
+        assert first['review_creation_date'].iloc[0] == pd.Timestamp('2018-01-18')
+        assert first['review_answer_timestamp'].isna().all()
+
+    def test_quoted_multiline_fields(self, tmp_path):
+        """Test quoted values spanning lines parse as one row, whole and streamed."""
+        from src.ecommerce_analytics.data_loader.schema import (
+            read_source_csv,
+            stream_source_table,
+        )
+
+        path = tmp_path / 'olist_order_reviews_dataset.csv'
+        header = (b'review_id,order_id,review_score,review_comment_title,'
+                  b'review_comment_message,review_creation_date,review_answer_timestamp\n')
+        rows = b''.join(
+            b'r%d,o%d,4,,"entrega rapida\nproduto ok\r\nrecomendo",2018-01-18 00:00:00,\n' % (i, i)
+            for i in range(2000)
+        )
+        path.write_bytes(header + rows)
+
+        df = read_source_csv(path, 'ORDER_REVIEWS')
+        streamed = stream_source_table(path, 'ORDER_REVIEWS', block_size=4096).read_all()
+
+        assert len(df) == 2000
+        assert df['review_comment_message'][0] == 'entrega rapida\nproduto ok\r\nrecomendo'
+        assert df['review_id'].tolist()[-1] == 'r1999'
+        assert streamed.num_rows == 2000
+        assert streamed['review_score'].type == 'int8'
+
+    def test_snowflake_columns(self):
+        """Test the registry drives the table DDL."""
+        from src.ecommerce_analytics.data_loader.schema import snowflake_columns
+
+        columns = dict(snowflake_columns('ORDERS'))
+
+        assert columns['order_id'] == 'VARCHAR'
+        assert columns['order_status'] == 'VARCHAR'
+        assert columns['order_purchase_timestamp'] == 'TIMESTAMP_NTZ'
+        assert snowflake_columns('UNKNOWN') is None
@@ -0,0 +1,104 @@
+"""
+Unit tests for pre-load validation of the source files.
+"""
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Write a small, consistent set of source files and return the directory."""
+    data_dir = tmp_path / 'raw'
+    data_dir.mkdir()
+    pd.DataFrame({
+        'customer_id': ['c1', 'c2'],
+        'customer_unique_id': ['u1', 'u2'],
+        'customer_state': ['SP', 'RJ'],
+    }).to_csv(data_dir / 'olist_customers_dataset.csv', index=False)
+    pd.DataFrame({
+        'order_id': ['o1', 'o2'],
+        'customer_id': ['c1', 'c2'],
+        'order_status': ['delivered', 'shipped'],
+    }).to_csv(data_dir / 'olist_orders_dataset.csv', index=False)
+    pd.DataFrame({
+        'order_id': ['o1', 'o1', 'o2'],
+        'order_item_id': [1, 2, 1],
+        'product_id': ['p1', 'p2', 'p1'],
+        'seller_id': ['s1', 's1', 's1'],
+        'price': [10.0, 20.0, 30.0],
+    }).to_csv(data_dir / 'olist_order_items_dataset.csv', index=False)
+    pd.DataFrame({'product_id': ['p1', 'p2']}).to_csv(
+        data_dir / 'olist_products_dataset.csv', index=False
+    )
+    pd.DataFrame({'seller_id': ['s1'], 'seller_state': ['SP']}).to_csv(
+        data_dir / 'olist_sellers_dataset.csv', index=False
+    )
+    return data_dir
+
+
+def _mapping():
+    from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+    return EcommerceDataLoader.FILE_TABLE_MAPPING
+
+
+class TestValidateFiles:
+    """Tests for validate_files."""
+
+    def test_consistent_files_pass(self, data_dir):
+        """Test a consistent dataset has no failures and is profiled."""
+        from src.ecommerce_analytics.data_loader.validation import validate_files
+
+        report = validate_files(data_dir, _mapping())
+
+        assert report['failures'] == []
+        assert report['tables']['ORDER_ITEMS']['rows'] == 3
+        assert report['tables']['ORDERS']['null_rates']['order_status'] == 0.0
+
+    def test_key_violations_are_reported(self, data_dir):
+        """Test duplicate keys, NULLs and orphan rows are each reported."""
+        from src.ecommerce_analytics.data_loader.validation import validate_files
+
+        pd.DataFrame({
+            'order_id': ['o1', 'o2', 'o2'],
+            'customer_id': ['c1', 'c9', None],
+            'order_status': ['delivered', 'shipped', 'shipped'],
+        }).to_csv(data_dir / 'olist_orders_dataset.csv', index=False)
+
+        report = validate_files(data_dir, _mapping(), max_workers=2)
+        failures = {(f['table'], f['check'], f['column']): f for f in report['failures']}
+
+        assert failures[('ORDERS', 'unique', 'order_id')]['examples'] == ['o2']
+        assert failures[('ORDERS', 'not_null', 'customer_id')]['failures'] == 1
+        assert failures[('ORDERS', 'relationship:CUSTOMERS', 'customer_id')]['examples'] == ['c9']
+        assert report['tables']['ORDERS']['null_rates']['customer_id'] == pytest.approx(1 / 3)
+
+
+class TestLoaderValidation:
+    """Tests for validation inside EcommerceDataLoader."""
+
+    def test_failed_validation_uploads_nothing(self, data_dir, tmp_path):
+        """Test an orphan row stops the run before any upload."""
+        from unittest.mock import MagicMock, patch
+        from src.ecommerce_analytics.data_loader.load_to_snowflake import EcommerceDataLoader
+
+        pd.DataFrame({
+            'order_id': ['o1', 'o3'],
+            'order_item_id': [1, 1],
+            'product_id': ['p1', 'p1'],
+            'seller_id': ['s1', 's1'],
+            'price': [10.0, 20.0],
+        }).to_csv(data_dir / 'olist_order_items_dataset.csv', index=False)
+
+        patch_target = 'src.ecommerce_analytics.data_loader.load_to_snowflake.SnowflakeConnector'
+        with patch(patch_target) as cls:
+            mock_connector = MagicMock()
+            mock_connector.database = 'ECOMMERCE_DEV'
+            cls.return_value = mock_connector
+
+            loader = EcommerceDataLoader(data_dir=str(data_dir), validate=True)
+            results = loader.load_all_files()
+
+        assert results['ORDER_ITEMS'] == {'status': 'invalid', 'reason': 'validation failed'}
+        assert results['ORDERS']['status'] == 'invalid'
+        mock_connector.load_csv_to_snowflake.assert_not_called()
+        assert loader.validation['failures'][0]['examples'] == ['o3']